@@ -7,8 +7,32 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import random
+from dataclasses import dataclass
+from typing import Optional
+
+from config import (
+    DATA_GENERATOR_CONFIG, DATABASE_CONFIG, DEFAULT_FILTERS, EXPERIENCE_LEVELS, RECRUITMENT_CHANNELS,
+    REFRESH_INTERVALS, SIDEBAR_FILTERS
+)
+from utils.aggregate_cache import get_aggregate_cache
+from utils.aggregates import AggregateCube
+from utils.cache import dataset_version, get_cache_backend, shared_cache
+from utils.channel_roi import ChannelROI
+from utils.data_generator import DataGenerator, seed_stream
+from utils.downsample import histogram_bins, histogram_trace
+from utils.event_log import StatusEventLog
+from utils.filter_index import FilterIndex
+from utils.funnel import FUNNEL_DIMENSIONS, FunnelEngine
+from utils.metrics import record_rerun, record_rows, start_metrics_server, timed, track
+from utils.pagination import render_page_selector, render_page_table, render_paginated_table
+from utils.profiler import profile_rerun
+from utils.refresh import BackgroundRefresher, get_refresher
+from utils.repository import RepositoryChannelROI, RepositoryFunnel, get_repository
+from utils.schema import apply_candidate_schema, format_salary
+from utils.search_index import SEARCH_FIELDS, SearchIndex
+from utils.shared_snapshot import share_frame
 
 # 페이지 설정
 st.set_page_config(
@@ -69,9 +93,12 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # 데이터 생성 함수
-@st.cache_data
-def generate_sample_data():
-    """샘플 데이터 생성"""
+@timed('load', count_rows=True)
+@shared_cache(dataset='candidates', deterministic=True)
+def generate_sample_data(as_of: date, seed: int = DATA_GENERATOR_CONFIG['seed']):
+    """샘플 데이터 생성 (as_of 날짜와 시드가 같으면 어느 레플리카에서 다시 만들어도 같은 데이터)"""
+    rng = random.Random(int(seed_stream(seed, 'sample_data').generate_state(1)[0]))
+    today = datetime.combine(as_of, datetime.min.time())
     
     # 지원자 데이터
     names = ['김민수', '이지은', '박준호', '최서영', '정하늘', '강민아', '윤성진', '조유리', 
@@ -81,45 +108,29 @@ def generate_sample_data():
                 'QA 엔지니어', '프로덕트 매니저', 'DevOps 엔지니어']
     
     statuses = ['서류 심사', '1차 면접', '2차 면접', '최종 면접', '합격', '불합격']
-    experiences = ['신입', '1년', '2년', '3년', '4년', '5년', '6년', '7년 이상']
+    experiences = EXPERIENCE_LEVELS
     locations = ['서울', '경기', '부산', '대구', '인천', '광주', '대전']
     sources = ['사람인', '잡코리아', '링크드인', '원티드', '직접지원', '추천']
     
     candidates_data = []
     for i, name in enumerate(names):
-        applied_date = datetime.now() - timedelta(days=random.randint(1, 90))
+        applied_date = today - timedelta(days=rng.randint(1, 90))
         candidates_data.append({
             'id': f'REC{i+1:04d}',
             'name': name,
-            'position': random.choice(positions),
-            'status': random.choice(statuses),
-            'experience': random.choice(experiences),
-            'location': random.choice(locations),
-            'resume_score': random.randint(60, 98),
-            'rating': round(random.uniform(3.0, 5.0), 1),
+            'position': rng.choice(positions),
+            'status': rng.choice(statuses),
+            'experience': rng.choice(experiences),
+            'location': rng.choice(locations),
+            'resume_score': rng.randint(60, 98),
+            'rating': round(rng.uniform(3.0, 5.0), 1),
             'applied_date': applied_date,
             'email': f'{name.lower().replace(" ", "")}@email.com',
-            'salary_expectation': f'{random.randint(3000, 8000)}만원',
-            'skills': random.choice(['Python, Django', 'React, Node.js', 'Figma, Sketch', 'SQL, Tableau']),
-            'source': random.choice(sources)
+            'salary_expectation': rng.randint(3000, 8000),  # 만원 단위
+            'skills': rng.choice(['Python, Django', 'React, Node.js', 'Figma, Sketch', 'SQL, Tableau']),
+            'source': rng.choice(sources)
         })
     
-    # 채널 성과 데이터
-    channel_data = {
-        'channel': ['사람인', '잡코리아', '링크드인', '원티드', '직접지원', '추천'],
-        'applicants': [1024, 756, 234, 445, 298, 90],
-        'hired': [51, 38, 18, 22, 14, 8],
-        'cost': [4800000, 3200000, 1800000, 1950000, 500000, 0],
-        'conversion_rate': [4.98, 5.03, 7.69, 4.94, 4.70, 8.89]
-    }
-    
-    # 퍼널 데이터
-    funnel_data = {
-        'stage': ['총 지원자', '서류 통과', '1차 면접', '2차 면접', '최종 면접', '최종 합격'],
-        'count': [3014, 1507, 754, 377, 226, 151],
-        'percentage': [100, 50.0, 25.0, 12.5, 7.5, 5.0]
-    }
-    
     # 월별 트렌드 데이터
     monthly_data = {
         'month': ['2024-01', '2024-02', '2024-03', '2024-04', '2024-05', '2024-06'],
@@ -129,68 +140,158 @@ def generate_sample_data():
     }
     
     return (
-        pd.DataFrame(candidates_data),
-        pd.DataFrame(channel_data),
-        pd.DataFrame(funnel_data),
+        apply_candidate_schema(pd.DataFrame(candidates_data)),
         pd.DataFrame(monthly_data)
     )
 
+@dataclass(frozen=True)
+class DashboardData:
+    """한 데이터셋 버전의 원본 프레임과 미리 만든 필터/집계 구조 (백그라운드 스레드가 통째로 교체)"""
+    candidates_df: pd.DataFrame
+    monthly_df: pd.DataFrame
+    version: str
+    filter_index: FilterIndex
+    cube: AggregateCube
+    channel_roi: ChannelROI
+    event_log: StatusEventLog
+    funnel_engine: FunnelEngine
+    search_index: SearchIndex
+
+@timed('aggregate')
+def build_dashboard_data(previous: Optional[DashboardData] = None) -> DashboardData:
+    """데이터셋과 필터 비트맵/집계 큐브/채널 성과/이벤트 로그/퍼널 배열/검색 역색인 생성
+
+    최초에는 공유 캐시를 그대로 쓰고, 이후 주기마다 캐시 만료 전에 다시 계산해 캐시도 함께 갱신합니다.
+    """
+    load = generate_sample_data if previous is None else generate_sample_data.refresh
+    candidates_df, monthly_df = load(date.today())
+    candidates_df = share_frame(candidates_df, 'candidates')  # 세션/프로세스 간 공유하는 읽기 전용 매핑
+    
+    channel_roi = ChannelROI(RECRUITMENT_CHANNELS)
+    channel_roi.add(candidates_df)
+    channel_roi.advance_to(datetime.now())  # 구간은 오늘 기준
+    
+    event_log = StatusEventLog()
+    event_log.append(DataGenerator().generate_status_events(candidates_df, seed=0))
+    
+    search_fields = {field: weight for field, weight in SEARCH_FIELDS.items() if field in candidates_df.columns}
+    
+    return DashboardData(
+        candidates_df=candidates_df,
+        monthly_df=monthly_df,
+        version=dataset_version(candidates_df),
+        filter_index=FilterIndex(candidates_df, SIDEBAR_FILTERS),
+        cube=AggregateCube(candidates_df),
+        channel_roi=channel_roi,
+        event_log=event_log,
+        funnel_engine=FunnelEngine(candidates_df),
+        search_index=SearchIndex(candidates_df, search_fields)
+    )
+
+def get_dashboard_refresher() -> BackgroundRefresher:
+    """대시보드 데이터를 주기(hourly)보다 조금 일찍 다시 만드는 프로세스 공용 백그라운드 스레드
+
+    지원자 데이터셋의 새 버전이 공개되면(pub/sub) 주기를 기다리지 않고 다시 만듭니다.
+    """
+    refresher = get_refresher('dashboard', build_dashboard_data, REFRESH_INTERVALS['hourly'])
+    get_aggregate_cache().on_invalidate('candidates', refresher.request_refresh)
+    return refresher
+
+@timed('filter', count_rows=True)
+def search_candidates(data: DashboardData, term: str, within: np.ndarray) -> pd.DataFrame:
+    """필터 결과(within) 안에서 검색어와 일치하는 지원자를 관련도 순으로 반환 (역색인은 백그라운드 빌드 때 생성)"""
+    rows, _ = data.search_index.search(term, within=within)
+    return data.candidates_df.iloc[rows]
+
 # 메인 앱
 def main():
     # 헤더
     st.markdown('<h1 class="main-header">📌 종합 채용 대시보드</h1>', unsafe_allow_html=True)
     st.markdown("### 데이터 기반 채용 인사이트로 더 나은 인재 확보 전략을 수립하세요")
     
-    # 데이터 로드
-    candidates_df, channel_df, funnel_df, monthly_df = generate_sample_data()
+    # 메트릭 (/metrics 서버는 프로세스당 한 번 시작)
+    start_metrics_server()
+    record_rerun('app', new_session='metrics_session' not in st.session_state)
+    st.session_state['metrics_session'] = True
+    
+    if DATABASE_CONFIG['enabled']:
+        render_database_dashboard(get_repository())
+        return
+    
+    # 데이터 로드 (백그라운드 스레드가 미리 교체해 둔 스냅샷)
+    refresher = get_dashboard_refresher()
+    snapshot = refresher.current()  # 최초 빌드 전에만 대기
+    data = snapshot.value
+    candidates_df, monthly_df, version = data.candidates_df, data.monthly_df, data.version
+    filter_index, cube, event_log = data.filter_index, data.cube, data.event_log
+    
+    # 퍼널/채널 집계는 데이터셋 버전별 공유 캐시를 거쳐 레플리카 간에 한 번만 계산
+    aggregates = get_aggregate_cache()
+    funnel_engine = aggregates.view(data.funnel_engine, 'candidates', version, ('funnel', 'rejected'))
+    channel_roi = aggregates.view(data.channel_roi, 'candidates', version, ('metrics', 'summary'))
     
     # 사이드바
     st.sidebar.header("📊 대시보드 설정")
     
     # 필터 옵션
-    position_filter = st.sidebar.multiselect(
-        "직무 선택",
-        options=candidates_df['position'].unique(),
-        default=candidates_df['position'].unique()
+    selections = {}
+    for column, label in SIDEBAR_FILTERS.items():
+        options = filter_index.values(column)
+        selections[column] = st.sidebar.multiselect(label, options=options, default=options)
+    
+    st.sidebar.caption(
+        f"🔄 데이터 기준 {datetime.fromtimestamp(snapshot.built_at):%H:%M:%S} "
+        f"(생성 {snapshot.build_seconds:.1f}초, 백그라운드 갱신)"
     )
-    
-    status_filter = st.sidebar.multiselect(
-        "상태 선택", 
-        options=candidates_df['status'].unique(),
-        default=candidates_df['status'].unique()
+    if st.sidebar.button("데이터 새로고침"):
+        refresher.request_refresh()
+        st.sidebar.caption("백그라운드에서 새 데이터를 만들고 있습니다. 완료 후 다시 실행하면 반영됩니다.")
+    
+    cache_stats = get_cache_backend().stats
+    st.sidebar.caption(
+        f"💾 데이터 캐시 적중률 {cache_stats.hit_ratio:.0%} "
+        f"(적중 {cache_stats.hits} / 실패 {cache_stats.misses}) · "
+        f"집계 캐시 적중률 {aggregates.stats.hit_ratio:.0%}"
     )
     
-    # 데이터 필터링
-    filtered_df = candidates_df[
-        (candidates_df['position'].isin(position_filter)) &
-        (candidates_df['status'].isin(status_filter))
-    ]
+    # 데이터 필터링 (미리 만든 비트맵 조합)
+    with track('filter', 'sidebar'):
+        filter_mask = filter_index.mask(selections)
+        filtered_df = candidates_df[filter_mask]
+    record_rows('filter', 'sidebar', len(filtered_df))
     
     st.markdown("---")
     
-    # 핵심 지표
+    # 핵심 지표 (집계 큐브에서 조회)
     col1, col2, col3, col4, col5, col6 = st.columns(6)
+    total_count = cube.counts()
     
     with col1:
-        st.metric("📊 총 지원자", f"{len(candidates_df):,}", "12% ↑")
+        st.metric("📊 총 지원자", f"{total_count:,}", "12% ↑")
     
     with col2:
-        hired_count = len(candidates_df[candidates_df['status'] == '합격'])
-        conversion_rate = (hired_count / len(candidates_df) * 100) if len(candidates_df) > 0 else 0
+        hired_count = int(cube.counts('status').get('합격', 0))
+        conversion_rate = (hired_count / total_count * 100) if total_count > 0 else 0
         st.metric("🎯 최종 합격", f"{hired_count}", f"{conversion_rate:.1f}% 전환율")
     
     with col3:
-        st.metric("⏱️ 평균 리드타임", "24일", "-3일")
+        lead_time = event_log.lead_time_percentiles((50, 90))
+        if np.isnan(lead_time['p50']):
+            st.metric("⏱️ 리드타임 (중앙값)", "-", "합격자 없음", delta_color="off")
+        else:
+            st.metric("⏱️ 리드타임 (중앙값)", f"{lead_time['p50']:.0f}일", f"p90 {lead_time['p90']:.0f}일",
+                      delta_color="off")
     
     with col4:
-        total_cost = channel_df['cost'].sum()
-        st.metric("💰 총 광고비", f"{total_cost//10000:,}만원", "CPA 4,389원")
+        spend = channel_roi.summary(30)
+        st.metric("💰 총 광고비 (30일)", f"{spend['cost']//10000:,}만원", f"CPA {spend['cpa']:,.0f}원",
+                  delta_color="off")
     
     with col5:
         st.metric("📝 활성 공고", "28", "12개 직무")
     
     with col6:
-        avg_score = candidates_df['resume_score'].mean()
+        avg_score = cube.mean_score()
         st.metric("⭐ 평균 점수", f"{avg_score:.0f}점", "이력서 품질")
     
     st.markdown("---")
@@ -205,20 +306,25 @@ def main():
         render_dashboard_overview(filtered_df)
     
     with tab2:
-        render_candidate_management(filtered_df)
+        render_candidate_management(filtered_df, cube, selections,
+                                    search=lambda term: search_candidates(data, term, filter_mask))
     
     with tab3:
-        render_funnel_analysis(funnel_df)
+        # 단계 체류 기간은 이벤트 로그에서, 퍼널과 같은 직무/채널 선택의 지원자만
+        funnel_mask = filter_index.mask({c: v for c, v in selections.items() if c in FUNNEL_DIMENSIONS})
+        stage_durations = event_log.stage_duration_percentiles((50,), candidates=candidates_df['id'][funnel_mask])
+        render_funnel_analysis(funnel_engine, selections, stage_durations)
     
     with tab4:
-        render_channel_performance(channel_df)
+        render_channel_performance(channel_roi, cube, selections)
     
     with tab5:
-        render_analytics_report(monthly_df, candidates_df)
+        render_analytics_report(monthly_df, cube)
     
     with tab6:
-        render_ai_insights(candidates_df, channel_df)
+        render_ai_insights(candidates_df, channel_roi.metrics(30))
 
+@timed('render')
 def render_dashboard_overview(filtered_df):
     """대시보드 개요"""
     st.header("📈 대시보드 개요")
@@ -253,14 +359,100 @@ def render_dashboard_overview(filtered_df):
         for activity in activities:
             st.success(f"• {activity}")
 
-def render_candidate_management(filtered_df):
-    """지원자 관리"""
+@timed('render')
+def render_database_dashboard(repository):
+    """DB 모드 대시보드 (필터/검색/페이지/KPI/퍼널/채널 집계를 모두 SQL로 실행하고 결과만 가져옴)
+
+    집계 쿼리 결과는 현재 공개된 데이터셋 버전 키로 공유 캐시에 저장해 레플리카가 함께 씁니다.
+    """
+    aggregates = get_aggregate_cache()
+    repository = aggregates.view(repository, 'candidates', aggregates.current_version('candidates'),
+                                 ('values', 'summary', 'count', 'counts', 'funnel_counts', 'channel_totals'))
+    st.sidebar.header("📊 대시보드 설정")
+    selections = {}
+    for column, label in SIDEBAR_FILTERS.items():
+        options = repository.values(column)
+        selections[column] = st.sidebar.multiselect(label, options=options, default=options)
+    st.sidebar.caption(f"🗄️ {repository.dialect.name} 연결 풀 {repository.pool.created}/{repository.pool.max_size}")
+    
+    st.markdown("---")
+    
+    # 핵심 지표 (서버 측 집계)
+    kpis = repository.summary(selections)
+    channel_roi = RepositoryChannelROI(repository)
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("📊 총 지원자", f"{kpis['total']:,}")
+    with col2:
+        conversion_rate = (kpis['hired'] / kpis['total'] * 100) if kpis['total'] > 0 else 0
+        st.metric("🎯 최종 합격", f"{kpis['hired']:,}", f"{conversion_rate:.1f}% 전환율")
+    with col3:
+        spend = channel_roi.summary(30)
+        st.metric("💰 총 광고비 (30일)", f"{spend['cost']//10000:,}만원", f"CPA {spend['cpa']:,.0f}원",
+                  delta_color="off")
+    with col4:
+        avg_score = kpis['avg_score'] if not np.isnan(kpis['avg_score']) else 0
+        st.metric("⭐ 평균 점수", f"{avg_score:.0f}점", "이력서 품질")
+    
+    st.markdown("---")
+    
+    tab1, tab2, tab3 = st.tabs(["👥 지원자 관리", "🔄 채용 퍼널", "📊 채널 성과"])
+    with tab1:
+        render_database_candidates(repository, selections)
+    with tab2:
+        render_funnel_analysis(RepositoryFunnel(repository), selections)
+    with tab3:
+        render_channel_performance(channel_roi)
+
+@timed('render')
+def render_database_candidates(repository, selections):
+    """DB 모드 지원자 관리 (검색은 LIKE/ILIKE, 목록은 현재 페이지만 LIMIT/OFFSET으로 조회)"""
+    st.header("👥 지원자 관리")
+    search_term = st.text_input("🔍 지원자 검색", placeholder="이름, 직무, 스킬로 검색...", key='db_search')
+    
+    st.subheader("📊 현재 상태 분포")
+    status_counts = repository.counts('status', selections, search_term)
+    status_counts = status_counts[status_counts > 0]
+    if status_counts.empty:
+        st.info("조건에 맞는 지원자가 없습니다.")
+    else:
+        status_cols = st.columns(len(status_counts))
+        for i, (status, count) in enumerate(status_counts.items()):
+            with status_cols[i]:
+                st.metric(status, count)
+    
+    total = int(status_counts.sum())
+    st.subheader(f"📋 지원자 목록 (총 {total:,}명)")
+    per_page = DEFAULT_FILTERS['items_per_page']
+    page = render_page_selector('db_candidate_page', total, per_page)
+    candidate = render_page_table(
+        repository.page(selections, search_term, page, per_page),
+        columns={
+            'name': '이름', 'position': '직무', 'status': '상태', 'experience': '경력',
+            'location': '지역', 'resume_score': '점수', 'rating': '평점',
+            'salary_expectation': '희망연봉', 'applied_date': '지원일'
+        },
+        key='db_candidate_page',
+        page=page,
+        formatters={
+            'salary_expectation': lambda s: s.map('{:,}만원'.format),
+            'applied_date': lambda s: s.dt.strftime('%Y-%m-%d')
+        }
+    )
+    if candidate is not None:
+        render_candidate_detail(candidate)
+
+@timed('render')
+def render_candidate_management(filtered_df, cube=None, selections=None, search=None):
+    """지원자 관리 (search는 검색어를 받아 필터 결과 안의 일치 행을 관련도 순으로 돌려주는 함수)"""
     st.header("👥 지원자 관리")
     
     # 검색
-    search_term = st.text_input("🔍 지원자 검색", placeholder="이름 또는 포지션으로 검색...")
+    search_term = st.text_input("🔍 지원자 검색", placeholder="이름, 직무, 스킬로 검색...")
     
-    if search_term:
+    if search_term and search is not None:
+        search_df = search(search_term)
+    elif search_term:
         search_df = filtered_df[
             filtered_df['name'].str.contains(search_term, case=False, na=False) |
             filtered_df['position'].str.contains(search_term, case=False, na=False)
@@ -270,40 +462,71 @@ def render_candidate_management(filtered_df):
     
     # 상태별 요약
     st.subheader("📊 현재 상태 분포")
-    status_counts = search_df['status'].value_counts()
+    if search_term or cube is None:
+        status_counts = search_df['status'].value_counts(sort=False)
+    else:
+        status_counts = cube.counts('status', selections)
+    status_counts = status_counts[status_counts > 0]  # 범주형은 해당 없는 단계도 0으로 집계됨
     
-    status_cols = st.columns(len(status_counts))
-    for i, (status, count) in enumerate(status_counts.items()):
-        with status_cols[i]:
-            st.metric(status, count)
+    if status_counts.empty:
+        st.info("조건에 맞는 지원자가 없습니다.")
+    else:
+        status_cols = st.columns(len(status_counts))
+        for i, (status, count) in enumerate(status_counts.items()):
+            with status_cols[i]:
+                st.metric(status, count)
     
-    # 지원자 목록
+    # 지원자 목록 (현재 페이지만 표로 그리고 선택한 지원자만 상세 표시)
     st.subheader(f"📋 지원자 목록 (총 {len(search_df)}명)")
     
-    for _, candidate in search_df.head(10).iterrows():
-        with st.expander(f"👤 {candidate['name']} - {candidate['position']} (점수: {candidate['resume_score']}점)"):
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.write(f"**📧 이메일:** {candidate['email']}")
-                st.write(f"**🏢 경력:** {candidate['experience']}")
-                st.write(f"**📍 지역:** {candidate['location']}")
-                
-            with col2:
-                st.write(f"**⭐ 평점:** {candidate['rating']}")
-                st.write(f"**📊 점수:** {candidate['resume_score']}점")
-                st.write(f"**💰 희망연봉:** {candidate['salary_expectation']}")
-                
-            with col3:
-                st.write(f"**📋 상태:** {candidate['status']}")
-                st.write(f"**📅 지원일:** {candidate['applied_date'].strftime('%Y-%m-%d')}")
-                
-                progress = candidate['resume_score'] / 100
-                st.progress(progress, text=f"점수: {candidate['resume_score']}점")
+    candidate = render_paginated_table(
+        search_df,
+        columns={
+            'name': '이름', 'position': '직무', 'status': '상태', 'experience': '경력',
+            'location': '지역', 'resume_score': '점수', 'rating': '평점',
+            'salary_expectation': '희망연봉', 'applied_date': '지원일'
+        },
+        key='candidate_page',
+        formatters={
+            'salary_expectation': lambda s: s.map('{:,}만원'.format),
+            'applied_date': lambda s: s.dt.strftime('%Y-%m-%d')
+        }
+    )
+    if candidate is not None:
+        render_candidate_detail(candidate)
+
+@timed('render')
+def render_candidate_detail(candidate):
+    """선택한 지원자 상세 정보"""
+    st.markdown(f"#### 👤 {candidate['name']} - {candidate['position']} (점수: {candidate['resume_score']}점)")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.write(f"**📧 이메일:** {candidate['email']}")
+        st.write(f"**🏢 경력:** {candidate['experience']}")
+        st.write(f"**📍 지역:** {candidate['location']}")
+        
+    with col2:
+        st.write(f"**⭐ 평점:** {candidate['rating']}")
+        st.write(f"**📊 점수:** {candidate['resume_score']}점")
+        st.write(f"**💰 희망연봉:** {format_salary(candidate['salary_expectation'])}")
+        
+    with col3:
+        st.write(f"**📋 상태:** {candidate['status']}")
+        st.write(f"**📅 지원일:** {candidate['applied_date'].strftime('%Y-%m-%d')}")
+        
+        progress = candidate['resume_score'] / 100
+        st.progress(progress, text=f"점수: {candidate['resume_score']}점")
 
-def render_funnel_analysis(funnel_df):
-    """채용 퍼널 분석"""
+@timed('render')
+def render_funnel_analysis(funnel_engine, selections=None, stage_durations: Optional[pd.DataFrame] = None):
+    """채용 퍼널 분석 (지원자 상태에서 계산한 퍼널, 직무/채널 필터 적용)
+
+    stage_durations(이벤트 로그의 단계별 체류 기간 p50)가 있으면 단계 체류 중앙값을 보여 주고,
+    없으면(DB 집계 행) 현재 단계 지원자의 지원 후 경과일 중앙값으로 대신합니다.
+    """
     st.header("🔄 채용 퍼널 분석")
+    funnel_df = funnel_engine.funnel(selections=selections).reset_index()
     
     col1, col2 = st.columns(2)
     
@@ -324,22 +547,36 @@ def render_funnel_analysis(funnel_df):
         # 전환율 분석
         st.subheader("📊 단계별 전환율")
         
-        conversion_rates = [
-            ("지원 → 서류", 50.0),
-            ("서류 → 1차면접", 50.0), 
-            ("1차 → 2차면접", 50.0),
-            ("2차 → 최종면접", 60.0),
-            ("최종 → 합격", 67.0)
-        ]
-        
-        for stage, rate in conversion_rates:
-            st.metric(stage, f"{rate}%")
-            st.progress(rate / 100)
+        for previous, row in zip(funnel_df.itertuples(), funnel_df.iloc[1:].itertuples()):
+            rate = 0.0 if np.isnan(row.conversion) else row.conversion
+            if stage_durations is not None:
+                days = stage_durations.loc[previous.stage, 'p50']
+                label = f"{previous.stage} 체류 중앙값"
+            else:
+                days, label = row.median_days_since_applied, "지원 후 경과일 중앙값"
+            median = "-" if np.isnan(days) else f"{days:.0f}일"
+            st.metric(f"{previous.stage} → {row.stage}", f"{rate:.1f}%", f"{label} {median}", delta_color="off")
+            st.progress(min(rate / 100, 1.0))
+        st.caption(f"불합격 {funnel_engine.rejected(selections):,}명은 첫 단계까지만 도달한 것으로 계산합니다. "
+                   "지역/경력/상태 필터는 퍼널에 적용되지 않습니다.")
+    
+    # 그룹별 퍼널
+    group_options = {'직무': 'position', '채널': 'source', '지원 월': 'month'}
+    group_label = st.selectbox("그룹별 퍼널", list(group_options), key='funnel_group')
+    grouped = funnel_engine.funnel(group_options[group_label], selections)
+    group_table = grouped['count'].unstack('stage')[funnel_engine.progress_stages]
+    group_table['최종 전환율(%)'] = grouped['overall_rate'].unstack('stage')[funnel_engine.progress_stages[-1]].round(1)
+    st.dataframe(group_table, use_container_width=True)
 
-def render_channel_performance(channel_df):
-    """채널 성과 분석"""
+@timed('render')
+def render_channel_performance(channel_roi, cube=None, selections=None):
+    """채널 성과 분석 (지원자 데이터에서 계산한 최근 N일 구간 성과)"""
     st.header("📊 채널별 성과 분석")
     
+    window = st.radio("집계 구간", channel_roi.windows, index=1, format_func=lambda days: f"최근 {days}일",
+                      horizontal=True, key='channel_window')
+    channel_df = channel_roi.metrics(window)
+    
     col1, col2 = st.columns(2)
     
     with col1:
@@ -369,19 +606,31 @@ def render_channel_performance(channel_df):
     # 채널 성과 테이블
     st.subheader("📋 채널별 상세 성과")
     
-    channel_detail = channel_df.copy()
-    channel_detail['CPA'] = np.where(
-        channel_detail['hired'] > 0,
-        channel_detail['cost'] / channel_detail['hired'],
-        0
-    ).astype(int)
-    
-    display_channels = channel_detail[['channel', 'applicants', 'hired', 'conversion_rate', 'cost', 'CPA']].copy()
-    display_channels.columns = ['채널', '지원자 수', '합격자 수', '전환율(%)', '광고비(원)', 'CPA(원)']
+    display_channels = channel_df[['channel', 'applicants', 'hired', 'conversion_rate', 'cost', 'cpa', 'avg_score']].copy()
+    display_channels.columns = ['채널', '지원자 수', '합격자 수', '전환율(%)', '광고비(원)', 'CPA(원)', '평균 점수']
     
     st.dataframe(display_channels, use_container_width=True)
+    
+    if cube is not None:
+        # 현재 필터 기준 지원 채널 분포 (집계 큐브)
+        source_stats = pd.DataFrame({
+            'count': cube.counts('source', selections),
+            'avg_score': cube.mean_score('source', selections).round(1)
+        }).reset_index()
+        source_stats = source_stats[source_stats['count'] > 0]
+        fig_source = px.bar(
+            source_stats,
+            x='source',
+            y='count',
+            color='avg_score',
+            title="지원 채널별 지원자 수 (현재 필터)",
+            labels={'source': '채널', 'count': '지원자 수', 'avg_score': '평균 점수'},
+            color_continuous_scale='Blues'
+        )
+        st.plotly_chart(fig_source, use_container_width=True)
 
-def render_analytics_report(monthly_df, candidates_df):
+@timed('render')
+def render_analytics_report(monthly_df, cube):
     """분석 리포트"""
     st.header("📍 분석 리포트")
     
@@ -398,17 +647,15 @@ def render_analytics_report(monthly_df, candidates_df):
         st.plotly_chart(fig_trend, use_container_width=True)
         
     with col2:
-        # 이력서 점수 분포
-        fig_score = px.histogram(
-            candidates_df,
-            x='resume_score',
-            nbins=15,
-            title="이력서 점수 분포"
-        )
+        # 이력서 점수 분포 (점수 값별 인원을 가중치로 사용)
+        score_hist = cube.score_histogram()
+        edges, counts = histogram_bins(score_hist.index, bins=15, weights=score_hist.values)
+        fig_score = go.Figure(histogram_trace(edges, counts))
+        fig_score.update_layout(title="이력서 점수 분포", xaxis_title='resume_score', yaxis_title='count', bargap=0)
         st.plotly_chart(fig_score, use_container_width=True)
     
     # 경력별 분포
-    experience_counts = candidates_df['experience'].value_counts()
+    experience_counts = cube.counts('experience')  # 경력 순서 유지
     fig_exp = px.bar(
         x=experience_counts.index,
         y=experience_counts.values,
@@ -416,6 +663,7 @@ def render_analytics_report(monthly_df, candidates_df):
     )
     st.plotly_chart(fig_exp, use_container_width=True)
 
+@timed('render')
 def render_ai_insights(candidates_df, channel_df):
     """AI 인사이트"""
     st.header("🤖 AI 채용 인사이트")
@@ -425,9 +673,11 @@ def render_ai_insights(candidates_df, channel_df):
     with col1:
         st.subheader("🔍 주요 발견사항")
         
+        top_channel = channel_df.loc[channel_df['conversion_rate'].idxmax()] if channel_df['hired'].sum() else None
         insights = [
             "80점 이상 이력서의 합격률이 평균 대비 2.3배 높음",
-            "링크드인 채널의 전환율이 7.69%로 가장 높음", 
+            (f"{top_channel['channel']} 채널의 전환율이 {top_channel['conversion_rate']:.2f}%로 가장 높음 (최근 30일)"
+             if top_channel is not None else "최근 30일 채널별 합격자 없음"), 
             "경력 4-6년 구간의 지원자 품질 점수 최고",
             "자기소개서 800자 이상 작성 시 합격률 최대화"
         ]
@@ -471,4 +721,5 @@ def render_ai_insights(candidates_df, channel_df):
     st.plotly_chart(fig_score, use_container_width=True)
 
 if __name__ == "__main__":
-    main()
+    with profile_rerun('app'):  # DASHBOARD_PROFILE=1 또는 ?profile=1 일 때만 프로파일
+        main()
@@ -0,0 +1,76 @@
+"""
+집계 큐브 벤치마크 (필터 후 행 스캔 vs 큐브 슬라이스)
+
+사이드바 필터 하나를 적용한 상태에서 KPI(총원/합격/평균 점수)와 코호트(월 × 상태) 집계를
+행 스캔과 큐브 슬라이스로 각각 계산해 지원자 수에 따른 지연 시간을 비교합니다.
+
+실행: python -m benchmarks.bench_aggregates --sizes 10000 100000 1000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from utils.aggregates import AggregateCube
+from utils.data_generator import DataGenerator
+
+SELECTIONS = {
+    'position': ['프론트엔드 개발자', '백엔드 개발자', '데이터 분석가'],
+    'location': ['서울', '경기'],
+}
+
+
+def _measure(func, repeat: int) -> float:
+    """가장 빠른 실행 시간(밀리초) 반환"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def _scan(df):
+    mask = np.ones(len(df), dtype=bool)
+    for column, values in SELECTIONS.items():
+        mask &= df[column].isin(values).to_numpy()
+    filtered = df[mask]
+    months = filtered['applied_date'].dt.to_period('M')
+    return (
+        len(filtered),
+        int((filtered['status'] == '합격').sum()),
+        filtered['resume_score'].mean(),
+        filtered.groupby([months, 'status'], observed=True).size().unstack(fill_value=0),
+    )
+
+
+def _slice(cube: AggregateCube):
+    return (
+        cube.counts(selections=SELECTIONS),
+        cube.counts('status', SELECTIONS)['합격'],
+        cube.mean_score(selections=SELECTIONS),
+        cube.counts(['month', 'status'], SELECTIONS),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="집계 큐브 지연 시간 벤치마크")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    generator = DataGenerator()
+    print(f"{'rows':>10} | {'build (ms)':>10} | {'scan (ms)':>10} | {'cube (ms)':>10} | {'cube MB':>8}")
+    print('-' * 60)
+    for size in args.sizes:
+        df = generator._build_candidates_frame(size, np.random.default_rng(0))
+        build = _measure(lambda: AggregateCube(df), 1)
+        cube = AggregateCube(df)
+        scan = _measure(lambda: _scan(df), args.repeat)
+        sliced = _measure(lambda: _slice(cube), args.repeat)
+        print(f"{size:>10,} | {build:10.1f} | {scan:10.2f} | {sliced:10.2f} | {cube.nbytes / 1024 / 1024:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+지원자 데이터 생성 벤치마크 (행 단위 루프 vs NumPy 컬럼 생성)
+
+실행: python -m benchmarks.bench_candidates --sizes 10000 100000 1000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from utils.data_generator import DataGenerator
+
+
+def _measure(func, repeat: int) -> float:
+    """가장 빠른 실행 시간(초) 반환"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="지원자 데이터 생성 벤치마크")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--python-max', type=int, default=100_000,
+                        help="행 단위 루프를 직접 측정할 최대 행 수 (초과 시 외삽)")
+    args = parser.parse_args()
+
+    generator = DataGenerator()
+
+    print(f"{'rows':>10} | {'python (s)':>11} | {'numpy (s)':>10} | {'numpy rows/s':>13} | {'speedup':>8}")
+    print('-' * 66)
+
+    python_per_row = None
+    for size in args.sizes:
+        numpy_time = _measure(lambda: generator._build_candidates_frame(size, np.random.default_rng(0)), args.repeat)
+
+        if size <= args.python_max:
+            python_time = _measure(lambda: generator._build_candidates_records(size), 1)
+            python_per_row = python_time / size
+            python_label = f"{python_time:11.3f}"
+        elif python_per_row is not None:
+            python_time = python_per_row * size
+            python_label = f"~{python_time:10.3f}"
+        else:
+            python_time = None
+            python_label = f"{'-':>11}"
+
+        speedup = f"{python_time / numpy_time:7.1f}x" if python_time else f"{'-':>8}"
+        print(f"{size:>10,} | {python_label} | {numpy_time:10.3f} | {size / numpy_time:13,.0f} | {speedup}")
+
+
+if __name__ == "__main__":
+    main()
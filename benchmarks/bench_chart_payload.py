@@ -0,0 +1,76 @@
+"""
+산점도 렌더링 모드 벤치마크 (SVG 전체 점 vs WebGL/축소 모드)
+
+채용 타임라인 차트를 합격자 수별로 만들어 직렬화한 JSON 크기(브라우저 전송량)와
+Figure 생성 + 직렬화 시간을 비교합니다. 'before'는 WebGL 전환/대표 점 축소/밀도 히트맵을 모두 끈 설정,
+'after'는 config.CHART_CONFIG['scatter'] 기본 설정입니다. 브라우저 렌더링 시간은 측정하지 않으며,
+trace 종류(scatter/scattergl)로 렌더링 경로를 함께 표시합니다.
+
+실행: python -m benchmarks.bench_chart_payload --sizes 1000 10000 50000
+"""
+
+import argparse
+import copy
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+
+from config import CHART_CONFIG
+from utils.charts import ChartGenerator
+from utils.data_generator import DataGenerator
+from utils.event_log import StatusEventLog
+
+
+def _hired_frame(generator: DataGenerator, hired: int) -> pd.DataFrame:
+    df = generator._build_candidates_frame(hired, np.random.default_rng(0))
+    df.loc[:, 'status'] = '합격'  # 전체를 합격자로 두어 점 개수를 size로 고정
+    return df
+
+
+def _event_log(generator: DataGenerator, df: pd.DataFrame) -> StatusEventLog:
+    event_log = StatusEventLog()
+    event_log.append(generator.generate_status_events(df, seed=0))
+    event_log.lead_times()  # 정렬은 측정에서 제외
+    return event_log
+
+
+def _measure(chart: ChartGenerator, df: pd.DataFrame, event_log: StatusEventLog, repeat: int):
+    """(가장 빠른 생성+직렬화 시간 ms, JSON 바이트 수, trace 종류)"""
+    best, payload, trace_type = float('inf'), None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        figure = chart.create_hiring_timeline_chart(df, event_log)
+        payload = pio.to_json(figure, validate=False)
+        best = min(best, time.perf_counter() - start)
+        trace_type = figure.data[0].type if figure.data else '-'
+    return best * 1000, len(payload.encode()), trace_type
+
+
+def main():
+    parser = argparse.ArgumentParser(description="산점도 렌더링 모드 전송량/시간 벤치마크")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 50_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    before_config = copy.deepcopy(CHART_CONFIG)
+    before_config['scatter'].update(webgl_threshold=float('inf'), max_points=float('inf'),
+                                    density_threshold=float('inf'))
+    before = ChartGenerator(use_cache=False)
+    before.chart_config = before_config
+    after = ChartGenerator(use_cache=False)
+
+    generator = DataGenerator()
+    print(f"{'hired':>8} | {'mode':>6} | {'trace':>11} | {'build+json (ms)':>15} | {'payload KB':>10}")
+    print('-' * 64)
+    for size in args.sizes:
+        df = _hired_frame(generator, size)
+        event_log = _event_log(generator, df)
+        for label, chart in (('before', before), ('after', after)):
+            elapsed, nbytes, trace_type = _measure(chart, df, event_log, args.repeat)
+            print(f"{size:>8,} | {label:>6} | {trace_type:>11} | {elapsed:15.1f} | {nbytes / 1024:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
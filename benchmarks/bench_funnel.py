@@ -0,0 +1,65 @@
+"""
+퍼널 계산 벤치마크 (행 groupby vs 퍼널 집계 배열)
+
+직무/채널 필터를 적용한 상태에서 전체 퍼널과 채널별 퍼널을 pandas groupby로 계산하는 방식과
+FunnelEngine 배열 조회의 지연 시간을 지원자 수에 따라 비교합니다.
+
+실행: python -m benchmarks.bench_funnel --sizes 10000 100000 1000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from utils.data_generator import DataGenerator
+from utils.funnel import FunnelEngine
+
+SELECTIONS = {
+    'position': ['프론트엔드 개발자', '백엔드 개발자', '데이터 분석가'],
+}
+
+
+def _measure(func, repeat: int) -> float:
+    """가장 빠른 실행 시간(밀리초) 반환"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def _scan(df):
+    filtered = df[df['position'].isin(SELECTIONS['position'])]
+    current = filtered.groupby(['source', 'status'], observed=False).size().unstack(fill_value=0)
+    reached = current.iloc[:, ::-1].cumsum(axis=1).iloc[:, ::-1]
+    days = (np.datetime64('now') - filtered['applied_date']).dt.days
+    medians = days.groupby(filtered['status'], observed=False).median()
+    return reached, medians
+
+
+def _lookup(engine: FunnelEngine):
+    return engine.funnel(selections=SELECTIONS), engine.funnel('source', SELECTIONS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="퍼널 계산 지연 시간 벤치마크")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    generator = DataGenerator()
+    print(f"{'rows':>10} | {'build (ms)':>10} | {'scan (ms)':>10} | {'engine (ms)':>11} | {'engine MB':>9}")
+    print('-' * 62)
+    for size in args.sizes:
+        df = generator._build_candidates_frame(size, np.random.default_rng(0))
+        build = _measure(lambda: FunnelEngine(df), 1)
+        engine = FunnelEngine(df)
+        scan = _measure(lambda: _scan(df), args.repeat)
+        lookup = _measure(lambda: _lookup(engine), args.repeat)
+        print(f"{size:>10,} | {build:10.1f} | {scan:10.2f} | {lookup:11.2f} | {engine.nbytes / 1024 / 1024:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+지원자 스키마 벤치마크 (문자열 컬럼 vs 범주형 컬럼)
+
+같은 지원자 데이터를 기존 문자열 스키마(object / pandas str)와 범주형 스키마로 두고
+메모리 사용량과 사이드바 필터(isin), value_counts, groupby 지연 시간을 비교합니다.
+
+실행: python -m benchmarks.bench_schema --rows 1000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils.data_generator import DataGenerator
+from utils.schema import CANDIDATE_CATEGORIES, SALARY_COLUMN
+
+
+def _measure(func, repeat: int) -> float:
+    """가장 빠른 실행 시간(밀리초) 반환"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def _legacy_frame(df: pd.DataFrame, dtype) -> pd.DataFrame:
+    """범주형 컬럼을 문자열로, 희망연봉을 '5000만원' 형식으로 되돌린 프레임"""
+    legacy = df.astype({column: dtype for column in CANDIDATE_CATEGORIES})
+    legacy[SALARY_COLUMN] = (df[SALARY_COLUMN].astype(str) + '만원').astype(dtype)
+    return legacy
+
+
+def _operations(df: pd.DataFrame) -> dict:
+    positions = ['프론트엔드 개발자', '백엔드 개발자', '데이터 분석가']
+    statuses = ['1차 면접', '2차 면접', '최종 면접']
+    return {
+        'isin filter': lambda: df[df['position'].isin(positions) & df['status'].isin(statuses)],
+        'value_counts': lambda: df['status'].value_counts(),
+        'groupby mean': lambda: df.groupby(['position', 'location'], observed=True)['resume_score'].mean(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="지원자 스키마 메모리/지연 시간 벤치마크")
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    categorical = DataGenerator()._build_candidates_frame(args.rows, np.random.default_rng(args.seed))
+    frames = {
+        'object': _legacy_frame(categorical, object),
+        'str': _legacy_frame(categorical, 'str'),
+        'category': categorical,
+    }
+    columns = list(CANDIDATE_CATEGORIES) + [SALARY_COLUMN]
+
+    print(f"rows: {args.rows:,} (스키마 대상 컬럼 {len(columns)}개)")
+    header = f"{'schema':>9} | {'memory (MB)':>11} | " + ' | '.join(f"{name:>14}" for name in _operations(categorical))
+    print(header)
+    print('-' * len(header))
+    for label, df in frames.items():
+        memory_mb = df[columns].memory_usage(deep=True, index=False).sum() / 1024 / 1024
+        timings = [_measure(op, args.repeat) for op in _operations(df).values()]
+        print(f"{label:>9} | {memory_mb:11.1f} | " + ' | '.join(f"{ms:11.1f} ms" for ms in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+지원자 검색 벤치마크 (str.contains 스캔 vs n-gram 역색인)
+
+검색어별로 이름/직무/스킬/이전 직장/메모 컬럼 전체를 str.contains로 훑는 방식과
+SearchIndex 조회(상위 50명)의 지연 시간을 지원자 수에 따라 비교합니다.
+
+실행: python -m benchmarks.bench_search --sizes 10000 100000 1000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from utils.data_generator import DataGenerator
+from utils.search_index import SEARCH_FIELDS, SearchIndex
+
+QUERIES = ['김민수', '민수', 'react', 'python django', '엔지니어', '신입']
+
+
+def _measure(func, repeat: int) -> float:
+    """가장 빠른 실행 시간(밀리초) 반환"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def _scan(df, query: str):
+    mask = np.ones(len(df), dtype=bool)
+    for token in query.lower().split():
+        token_mask = np.zeros(len(df), dtype=bool)
+        for field in SEARCH_FIELDS:
+            token_mask |= df[field].astype(str).str.contains(token, case=False, regex=False).to_numpy()
+        mask &= token_mask
+    return np.flatnonzero(mask)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="지원자 검색 지연 시간 벤치마크")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    generator = DataGenerator()
+    for size in args.sizes:
+        df = generator._build_candidates_frame(size, np.random.default_rng(0))
+        build = _measure(lambda: SearchIndex(df), 1)
+        index = SearchIndex(df)
+        print(f"\n{size:,}명 (인덱스 생성 {build:,.0f}ms, 어휘 {index.vocabulary_size:,}개)")
+        print(f"{'query':>14} | {'matches':>8} | {'scan (ms)':>10} | {'index (ms)':>10}")
+        print('-' * 52)
+        for query in QUERIES:
+            matches = len(index.search(query)[0])
+            scan = _measure(lambda: _scan(df, query), args.repeat)
+            indexed = _measure(lambda: index.search(query, limit=50), args.repeat)
+            print(f"{query:>14} | {matches:>8,} | {scan:10.1f} | {indexed:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,390 @@
+"""
+벤치마크 모음 (Streamlit 서버 없이 실행, JSON 결과 + 기준선 비교)
+
+행 수(기본 1천/10만/100만/1000만)마다 다음 항목의 처리 시간, 처리량(행/초), 최대 메모리를 측정합니다.
+- generate.candidates*  : DataGenerator.generate_candidates_data (캐시 데코레이터를 벗긴 원래 함수, 직렬/샤드 병렬)
+- load.csv_data         : 대시보드 개요 페이지의 load_csv_data 본문 (합성 Remember 형식 CSV)
+- filter.* / search.*   : 사이드바 필터 비트맵 생성/조합, 검색 역색인 생성/필터 결과 안 검색
+- chart.create_*        : ChartGenerator의 모든 create_* 메서드 (Figure 캐시 없이 생성 + JSON 직렬화, 바이트 수 기록)
+
+- 입력 데이터는 (--seed, 행 수)와 고정된 기준 시각으로 만들므로 실행마다 같아 결과를 그대로 비교할 수 있습니다.
+- 시간은 repeat회 중 가장 빠른 값이며, 최대 메모리는 별도 1회 실행의 tracemalloc 최대치입니다
+  (Python/NumPy/pandas 할당 기준, Arrow 메모리 풀은 load.csv_data의 loader_peak_mb에만 포함).
+- 합성 CSV는 행마다 대용량 컬럼 5개에 blob_chars자 JSON 문자열을 넣으므로(실제 스크랩과 비슷한 크기)
+  기본적으로 csv_max_rows 행까지만 만듭니다.
+- --baseline을 주면 (항목, 행 수)별로 시간/메모리/전송 바이트를 비교해 threshold를 넘게 느려지거나
+  커진 항목을 표시하고 종료 코드 1로 끝납니다 (CI에서 성능 회귀 차단용).
+
+실행: python -m benchmarks.suite --sizes 1000 100000 --output bench_results.json
+      python -m benchmarks.suite --baseline bench_baseline.json --cases 'chart.*'
+"""
+
+import argparse
+import fnmatch
+import gc
+import inspect
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from functools import cached_property
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import plotly
+import plotly.io as pio
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
+from config import JOB_CATEGORIES, REGIONS, SIDEBAR_FILTERS
+from utils.aggregates import AggregateCube
+from utils.charts import ChartGenerator
+from utils.data_generator import DataGenerator
+from utils.event_log import StatusEventLog
+from utils.filter_index import FilterIndex
+from utils.remember_loader import HEAVY_COLUMNS
+from utils.search_index import SEARCH_FIELDS, SearchIndex
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000, 10_000_000]
+NOW = datetime(2025, 6, 1)  # 지원일 기준 시각 (입력 데이터를 실행마다 같게 고정)
+QUERIES = ['김민수', 'react', 'python django', '엔지니어']
+SELECTIONS = {
+    'position': ['프론트엔드 개발자', '백엔드 개발자', '데이터 분석가'],
+    'location': ['서울', '경기'],
+}
+REMEMBER_COLUMNS = ['공고ID', '공고명', '회사명', '지역', '직무', '경력요건', '학력요건', '채용유형', '공고시작일',
+                    '마감일', '합격축하금', '직무카테고리'] + HEAVY_COLUMNS
+
+# 캐시 데코레이터(shared_cache/@timed)를 벗긴 원래 함수 (항상 실제로 계산하도록)
+_generate_candidates = inspect.unwrap(DataGenerator.generate_candidates_data)
+_generate_funnel = inspect.unwrap(DataGenerator.generate_funnel_data)
+_generate_channels = inspect.unwrap(DataGenerator.generate_channel_performance_data)
+_generate_monthly = inspect.unwrap(DataGenerator.generate_monthly_trend_data)
+_generate_regional = inspect.unwrap(DataGenerator.generate_regional_data)
+
+
+def write_remember_csv(path: str, rows: int, blob_chars: int = 2000, seed: int = 0, batch_size: int = 10_000):
+    """Remember 스크랩과 같은 컬럼의 합성 CSV 작성 (대용량 컬럼은 blob_chars자 JSON 문자열)"""
+    rng = np.random.default_rng(seed)
+    words = [''.join(chr(0xAC00 + c) for c in rng.integers(0, 11172, 2)) for _ in range(500)] + \
+            ['React', 'Python', 'AWS', 'SQL', 'Kubernetes', 'Figma']
+    blobs = []
+    for _ in range(64):
+        text = ' '.join(rng.choice(words, blob_chars // 2))
+        blob = json.dumps({'props': {'pageProps': {'description': text}}}, ensure_ascii=False)
+        blobs.append(blob[:blob_chars])
+    blobs = pa.array(blobs)
+
+    positions = [position for category in JOB_CATEGORIES.values() for position in category]
+    companies = [f"(주){name}" for name in ('정보', '클라우드', '테크', '데이터', '솔루션', '랩스')]
+    start = pd.Timestamp('2025-05-27')
+    schema = pa.schema([(column, pa.int64() if column in ('공고ID', '합격축하금') else pa.string())
+                        for column in REMEMBER_COLUMNS])
+
+    with pacsv.CSVWriter(path, schema) as writer:
+        for offset in range(0, rows, batch_size):
+            n = min(batch_size, rows - offset)
+            start_days = rng.integers(0, 60, n)
+            columns = {
+                '공고ID': pa.array(np.arange(offset, offset + n) + 250_000),
+                '공고명': pa.array(np.char.add('채용 공고 ', rng.integers(0, 10_000, n).astype(str))),
+                '회사명': pa.array(rng.choice(companies, n)),
+                '지역': pa.array(rng.choice([f"{region}/전체" for region in REGIONS], n)),
+                '직무': pa.array(rng.choice(positions, n)),
+                '경력요건': pa.array(rng.choice(['신입', '1년 이상', '3년 이상', '5년 이상'], n)),
+                '학력요건': pa.array(rng.choice(['무관', '학사', '석사'], n)),
+                '채용유형': pa.array(rng.choice(['정규직', '계약직'], n)),
+                '공고시작일': pa.array((start - pd.to_timedelta(start_days, unit='D')).strftime('%Y-%m-%d')),
+                '마감일': pa.array((start + pd.to_timedelta(60 - start_days, unit='D')).strftime('%Y-%m-%d')),
+                '합격축하금': pa.array(rng.choice([0, 100_000, 200_000, 500_000], n)),
+                '직무카테고리': pa.array(rng.choice(list(JOB_CATEGORIES), n)),
+            }
+            for column in HEAVY_COLUMNS:
+                columns[column] = blobs.take(pa.array(rng.integers(0, len(blobs), n)))
+            writer.write_table(pa.table(columns, schema=schema))
+
+
+class Fixtures:
+    """한 행 수에 대한 입력 데이터 (필요한 것만 처음 접근할 때 만들고 측정 시간에서 제외)"""
+
+    def __init__(self, rows: int, args: argparse.Namespace):
+        self.rows = rows
+        self.args = args
+        self.generator = DataGenerator(seed=args.seed)
+        self._tmp_dir: Optional[str] = None
+
+    @cached_property
+    def candidates(self) -> pd.DataFrame:
+        return _generate_candidates(self.generator, self.rows, now=NOW, _workers=self.args.workers)
+
+    @cached_property
+    def filter_index(self) -> FilterIndex:
+        return FilterIndex(self.candidates, SIDEBAR_FILTERS)
+
+    @cached_property
+    def filter_mask(self) -> np.ndarray:
+        return self.filter_index.mask(SELECTIONS)
+
+    @cached_property
+    def search_index(self) -> SearchIndex:
+        return SearchIndex(self.candidates, self.search_fields)
+
+    @property
+    def search_fields(self) -> Dict[str, float]:
+        return {field: weight for field, weight in SEARCH_FIELDS.items() if field in self.candidates.columns}
+
+    @cached_property
+    def csv_path(self) -> str:
+        self._tmp_dir = tempfile.mkdtemp(prefix='bench_remember_')
+        path = os.path.join(self._tmp_dir, f"premium_remember_jobs_{self.rows}.csv")
+        write_remember_csv(path, self.rows, self.args.blob_chars)
+        return path
+
+    @cached_property
+    def chart_inputs(self) -> Dict[str, Any]:
+        df = self.candidates
+        event_log = StatusEventLog()
+        event_log.append(self.generator.generate_status_events(df, now=NOW))
+        return {
+            'cube': AggregateCube(df),
+            'event_log': event_log,
+            'funnel': _generate_funnel(self.generator, df),
+            'channels': _generate_channels(self.generator, df, now=NOW),
+        }
+
+    def chart_args(self, method: str) -> Tuple:
+        """create_* 메서드 인자 (대시보드가 넘기는 것과 같은 입력, 메서드마다 필요한 것만 생성)"""
+        df = self.candidates
+        builders = {
+            'create_funnel_chart': lambda: (self.chart_inputs['funnel'],),
+            'create_conversion_rate_chart': lambda: (self.chart_inputs['funnel'],),
+            'create_channel_performance_chart': lambda: (self.chart_inputs['channels'],),
+            'create_monthly_trend_chart': lambda: (_generate_monthly(self.generator),),
+            'create_regional_distribution_chart': lambda: (_generate_regional(self.generator),),
+            'create_score_distribution_chart': lambda: (df,),
+            'create_experience_distribution_chart': lambda: (df, self.chart_inputs['cube']),
+            'create_status_distribution_chart': lambda: (df, self.chart_inputs['cube']),
+            'create_hiring_timeline_chart': lambda: (df, self.chart_inputs['event_log']),
+            'create_performance_radar_chart': lambda: (self.chart_inputs['channels'],),
+            'create_cohort_analysis_chart': lambda: (df, self.chart_inputs['cube']),
+        }
+        return builders[method]()
+
+    def close(self):
+        if self._tmp_dir is not None:
+            shutil.rmtree(self._tmp_dir, ignore_errors=True)
+
+
+def _figure_bytes(figure) -> int:
+    if isinstance(figure, dict):
+        return sum(_figure_bytes(value) for value in figure.values())
+    return len(pio.to_json(figure, validate=False).encode())
+
+
+def _load_csv_case(fx: Fixtures) -> Callable[[], Dict[str, float]]:
+    from pages.dashboard_overview import build_dashboard_frames  # Streamlit 페이지 모듈 (스크립트 본문은 실행하지 않음)
+
+    load = inspect.unwrap(build_dashboard_frames)
+    path = fx.csv_path
+
+    def run():
+        _, _, report = load(path)
+        return {'csv_mb': round(os.path.getsize(path) / 1024 / 1024, 1),
+                'loader_peak_mb': round(report.peak_memory_mb, 1)}
+
+    return run
+
+
+def _check_chart_input(method: str, args: Tuple):
+    """입력 프레임이 비었거나 값이 모두 0인 숫자 컬럼이 있으면 ValueError (기준선이 빈 차트끼리 비교되지 않도록)"""
+    for arg in args:
+        if not isinstance(arg, pd.DataFrame):
+            continue
+        numeric = arg.select_dtypes('number')
+        zero = [column for column in numeric.columns if not numeric[column].any()]
+        if arg.empty or zero:
+            raise ValueError(f"{method} 입력이 비어 있습니다 (행 {len(arg)}개, 값이 모두 0인 컬럼 {zero})")
+
+
+def _chart_case(method: str) -> Callable[[Fixtures], Callable[[], Dict[str, float]]]:
+    def prepare(fx: Fixtures):
+        chart = ChartGenerator(use_cache=False)
+        create = getattr(chart, method)
+        args = fx.chart_args(method)
+        _check_chart_input(method, args)
+        return lambda: {'bytes': _figure_bytes(create(*args))}
+
+    return prepare
+
+
+def _filter_case(fx: Fixtures) -> Callable[[], Any]:
+    index, df = fx.filter_index, fx.candidates
+    return lambda: df[index.mask(SELECTIONS)]
+
+
+def _search_case(fx: Fixtures) -> Callable[[], Any]:
+    index, mask = fx.search_index, fx.filter_mask
+    return lambda: [index.search(query, limit=50, within=mask) for query in QUERIES]
+
+
+def build_cases(args: argparse.Namespace) -> List[Tuple[str, Callable[[Fixtures], Callable], Optional[int]]]:
+    """(항목 이름, 준비 함수(fixtures) -> 측정할 함수, 최대 행 수)"""
+    cases = [
+        ('generate.candidates', lambda fx: lambda: _generate_candidates(fx.generator, fx.rows, now=NOW, _workers=1), None),
+        ('generate.candidates_parallel',
+         lambda fx: lambda: _generate_candidates(fx.generator, fx.rows, now=NOW, _workers=args.workers), None),
+        ('load.csv_data', _load_csv_case, args.csv_max_rows),
+        ('filter.index_build', lambda fx: lambda: FilterIndex(fx.candidates, SIDEBAR_FILTERS), None),
+        ('filter.sidebar', _filter_case, None),
+        ('search.index_build', lambda fx: lambda: SearchIndex(fx.candidates, fx.search_fields), None),
+        ('search.query', _search_case, None),
+    ]
+    methods = sorted(name for name in vars(ChartGenerator) if name.startswith('create_'))
+    cases += [(f"chart.{method}", _chart_case(method), None) for method in methods]
+    return [case for case in cases if any(fnmatch.fnmatch(case[0], pattern) for pattern in args.cases)]
+
+
+def measure(run: Callable[[], Optional[Dict[str, float]]], repeat: int, memory: bool) -> Dict[str, Any]:
+    """가장 빠른 시간(초)과 별도 1회 실행의 tracemalloc 최대 메모리(MB)"""
+    best, extra = float('inf'), None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        extra = run()
+        best = min(best, time.perf_counter() - start)
+
+    peak_mb = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            run()
+            peak_mb = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        finally:
+            tracemalloc.stop()
+    result = {'seconds': best, 'peak_mb': round(peak_mb, 2) if peak_mb is not None else None}
+    if isinstance(extra, dict):
+        result.update(extra)
+    return result
+
+
+def environment() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'pyarrow': pa.__version__,
+        'plotly': plotly.__version__,
+    }
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], threshold: float,
+            min_delta_seconds: float) -> List[Dict[str, Any]]:
+    """기준선 대비 회귀 항목 (시간은 절대 차이가 min_delta_seconds 이상일 때만 판정)"""
+    previous = {(row['case'], row['rows']): row for row in baseline}
+    regressions = []
+    for row in results:
+        base = previous.get((row['case'], row['rows']))
+        if base is None or 'error' in base:
+            continue
+        if 'error' in row:
+            regressions.append({'case': row['case'], 'rows': row['rows'], 'reasons': [row['error']]})
+            continue
+        row['baseline_seconds'] = base['seconds']
+        row['change'] = round(row['seconds'] / base['seconds'] - 1, 4) if base['seconds'] else None
+        reasons = []
+        if row['seconds'] > base['seconds'] * (1 + threshold) and row['seconds'] - base['seconds'] >= min_delta_seconds:
+            reasons.append(f"시간 {base['seconds']:.4f}s → {row['seconds']:.4f}s")
+        for metric in ('peak_mb', 'bytes'):
+            if row.get(metric) and base.get(metric) and row[metric] > base[metric] * (1 + threshold):
+                reasons.append(f"{metric} {base[metric]:,} → {row[metric]:,}")
+        if reasons:
+            regressions.append({'case': row['case'], 'rows': row['rows'], 'reasons': reasons})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="데이터 생성/로드/필터/차트 벤치마크 모음")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--cases', nargs='+', default=['*'], help="측정할 항목 이름 패턴 (예: 'chart.*' 'filter.*')")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0, help="입력 데이터 시드")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="샤드 생성 프로세스 수 (기본값: DATA_GENERATOR_CONFIG, 데이터에는 영향 없음)")
+    parser.add_argument('--no-memory', action='store_true', help="최대 메모리 측정 생략 (tracemalloc 실행 1회 절약)")
+    parser.add_argument('--blob-chars', type=int, default=2000, help="합성 CSV 대용량 컬럼 글자 수")
+    parser.add_argument('--csv-max-rows', type=int, default=100_000, help="합성 CSV를 만들 최대 행 수")
+    parser.add_argument('--output', default='bench_results.json')
+    parser.add_argument('--baseline', help="비교할 이전 결과 JSON (회귀가 있으면 종료 코드 1)")
+    parser.add_argument('--threshold', type=float, default=0.2, help="허용 증가 비율 (0.2 = 20%%)")
+    parser.add_argument('--min-delta-ms', type=float, default=5.0, help="시간 회귀로 판정할 최소 절대 차이")
+    args = parser.parse_args()
+
+    cases = build_cases(args)
+    results = []
+    print(f"{'case':<44} | {'rows':>10} | {'seconds':>9} | {'rows/s':>13} | {'peak MB':>8} | extra")
+    print('-' * 110)
+    for rows in args.sizes:
+        fixtures = Fixtures(rows, args)
+        try:
+            for name, prepare, max_rows in cases:
+                if max_rows is not None and rows > max_rows:
+                    continue
+                try:
+                    run = prepare(fixtures)
+                    result = {'case': name, 'rows': rows, **measure(run, args.repeat, not args.no_memory)}
+                except Exception as e:
+                    # 한 항목이 실패해도 나머지는 계속 측정 (결과에 오류로 남김)
+                    results.append({'case': name, 'rows': rows, 'error': f"{type(e).__name__}: {e}"})
+                    print(f"{name:<44} | {rows:>10,} | 실패: {type(e).__name__}: {e}", flush=True)
+                    continue
+                result['rows_per_second'] = round(rows / result['seconds']) if result['seconds'] else None
+                results.append(result)
+                extra = {k: v for k, v in result.items()
+                         if k not in ('case', 'rows', 'seconds', 'peak_mb', 'rows_per_second')}
+                peak = f"{result['peak_mb']:8.1f}" if result['peak_mb'] is not None else f"{'-':>8}"
+                print(f"{name:<44} | {rows:>10,} | {result['seconds']:9.4f} | {result['rows_per_second'] or 0:>13,} | "
+                      f"{peak} | {extra or ''}", flush=True)
+        finally:
+            fixtures.close()
+
+    report = {'environment': environment(), 'arguments': vars(args), 'results': results}
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline['results'], args.threshold, args.min_delta_ms / 1000)
+        report['baseline'] = {'path': args.baseline, 'environment': baseline.get('environment'),
+                              'regressions': regressions}
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {args.output} ({len(results)}개 항목)")
+
+    if args.baseline:
+        if regressions:
+            print(f"⚠️ 기준선 대비 회귀 {len(regressions)}건 (허용 {args.threshold:.0%})")
+            for regression in regressions:
+                print(f"  - {regression['case']} @ {regression['rows']:,}행: {', '.join(regression['reasons'])}")
+            sys.exit(1)
+        print("기준선 대비 회귀 없음")
+
+
+if __name__ == "__main__":
+    main()
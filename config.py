@@ -2,6 +2,7 @@
 채용 대시보드 설정 파일
 """
 
+import os
 import streamlit as st
 from datetime import datetime, timedelta
 
@@ -68,6 +69,17 @@ RECRUITMENT_STAGES = [
     '2차 면접', '최종 면접', '합격', '불합격'
 ]
 
+# 학력 구분
+EDUCATION_LEVELS = ['고졸', '전문대졸', '대졸', '석사', '박사']
+
+# 이전 직장 (경력이 없는 지원자는 '신입')
+PREVIOUS_COMPANIES = [
+    '삼성전자', 'LG전자', 'SK하이닉스', '현대자동차', 'KT',
+    '네이버', '카카오', '쿠팡', '배달의민족', '토스',
+    '라인', '넥슨', 'NHN', '우아한형제들', '마켓컬리',
+    '당근마켓', '직방', '야놀자', '무신사', '29CM', '신입'
+]
+
 # 기본 필터 설정
 DEFAULT_FILTERS = {
     'date_range': (datetime.now() - timedelta(days=30), datetime.now()),
@@ -75,13 +87,29 @@ DEFAULT_FILTERS = {
     'chart_height': 400
 }
 
-# API 설정 (실제 환경에서는 환경변수 사용)
+# 사이드바 필터 (컬럼: 위젯 라벨)
+SIDEBAR_FILTERS = {
+    'position': '직무 선택',
+    'status': '상태 선택',
+    'experience': '경력 선택',
+    'location': '지역 선택',
+    'source': '채널 선택'
+}
+
+# DB 설정 (DASHBOARD_DATA_SOURCE=database이면 지원자/채널/퍼널을 DB에서 조회, 접속 정보는 환경변수)
 DATABASE_CONFIG = {
-    'host': 'localhost',
-    'port': 5432,
-    'database': 'recruitment_db',
-    'user': 'admin',
-    'password': 'password'  # 실제로는 환경변수에서 가져오기
+    'enabled': os.environ.get('DASHBOARD_DATA_SOURCE', 'sample') == 'database',
+    'backend': os.environ.get('DATABASE_BACKEND', 'postgres'),  # 'postgres' 또는 'sqlite'
+    'host': os.environ.get('DATABASE_HOST', 'localhost'),
+    'port': int(os.environ.get('DATABASE_PORT', '5432')),
+    'database': os.environ.get('DATABASE_NAME', 'recruitment_db'),
+    'user': os.environ.get('DATABASE_USER', 'admin'),
+    'password': os.environ.get('DATABASE_PASSWORD', ''),
+    'sqlite_path': os.environ.get('DATABASE_SQLITE_PATH', os.path.join('data', 'recruitment.db')),
+    'pool_size': int(os.environ.get('DATABASE_POOL_SIZE', '8')),
+    'pool_timeout': 10,  # 초
+    'statement_timeout_ms': 15000,
+    'fetch_batch_size': 10000  # 스트리밍 조회 한 번에 가져올 행 수
 }
 
 # 이메일 설정
@@ -299,6 +327,40 @@ CHART_CONFIG = {
     'line': {
         'colors': ['#3b82f6', '#10b981', '#f59e0b', '#ef4444'],
         'height': 400
+    },
+    # 행 수와 관계없이 브라우저로 보내는 데이터 크기 제한
+    'histogram': {
+        'bins': 20
+    },
+    'scatter': {
+        'webgl_threshold': 10_000,  # 넘으면 WebGL(Scattergl)로 그리고 툴팁 항목 축소
+        'max_points': 5000,  # 넘으면 격자 칸별 대표 점만 표시
+        'density_threshold': 50000,  # 넘으면 밀도 히트맵으로 전환
+        'density_bins': 60
+    }
+}
+
+# 차트 Figure 캐시 설정 (프로세스 메모리, 직렬화된 JSON 기준 LRU)
+FIGURE_CACHE_CONFIG = {
+    'max_entries': 256,
+    'max_bytes': 64 * 1024 * 1024
+}
+
+# 채널 성과 집계 구간 (최근 N일)
+ROI_WINDOWS = [7, 30, 90]
+
+# 채널 광고비 (spend_table_path의 CSV(date, channel, cost)가 있으면 실제 집행 내역 사용)
+CHANNEL_SPEND_CONFIG = {
+    'spend_table_path': os.environ.get('DASHBOARD_SPEND_TABLE', os.path.join('data', 'channel_spend.csv')),
+    'daily_spend': {  # 원/일
+        '사람인': 160000,
+        '잡코리아': 107000,
+        '링크드인': 60000,
+        '원티드': 65000,
+        '직접지원': 0,
+        '추천': 0,
+        'GitHub Jobs': 30000,
+        '프로그래머스': 42000
     }
 }
 
@@ -308,3 +370,63 @@ REFRESH_INTERVALS = {
     'hourly': 3600,
     'daily': 86400
 }
+
+# 백그라운드 새로고침 설정 (주기의 lead_ratio만큼 만료 전에 미리 다시 생성, 실패 시 retry_seconds 후 재시도)
+REFRESH_CONFIG = {
+    'lead_ratio': 0.1,
+    'retry_seconds': 30
+}
+
+# 공유 데이터셋 스냅샷 설정 (Arrow IPC 파일을 메모리 매핑, /dev/shm 하위 경로를 주면 디스크 없이 공유 메모리 사용)
+SNAPSHOT_CONFIG = {
+    'directory': os.environ.get('DASHBOARD_SNAPSHOT_DIR', os.path.join('data', 'snapshots')),
+    'keep': 4  # 이름별로 남겨 둘 데이터셋 버전 수
+}
+
+# 공유 캐시 설정 (여러 레플리카가 같은 볼륨 또는 Redis를 공유)
+CACHE_CONFIG = {
+    'backend': os.environ.get('DASHBOARD_CACHE_BACKEND', 'disk'),  # 'disk' 또는 'redis'
+    'disk_dir': os.environ.get('DASHBOARD_CACHE_DIR', os.path.join('data', 'cache')),
+    'redis_url': os.environ.get('REDIS_URL', 'redis://localhost:6379/0'),
+    'max_bytes': 512 * 1024 * 1024,
+    'key_prefix': 'dashboard:cache'
+}
+
+# 메트릭 설정 (Prometheus가 http://<앱>:port/metrics 를 수집)
+METRICS_CONFIG = {
+    'enabled': os.environ.get('DASHBOARD_METRICS', '1') != '0',
+    'address': os.environ.get('DASHBOARD_METRICS_ADDRESS', '0.0.0.0'),
+    'port': int(os.environ.get('DASHBOARD_METRICS_PORT', '9100')),
+    'buckets': (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)  # 초
+}
+
+# 재실행 프로파일러 설정 (개발용, 환경 변수 또는 ?profile=1 쿼리 파라미터로 켬)
+PROFILER_CONFIG = {
+    'enabled': os.environ.get('DASHBOARD_PROFILE', '0') == '1',
+    'query_param': 'profile',
+    'log_dir': os.environ.get('DASHBOARD_PROFILE_DIR', os.path.join('logs', 'profiles')),
+    'keep': 20,  # 남겨 둘 최근 프로파일 수
+    'top_n': 15,  # 사이드바에 보여줄 상위 함수 수
+    'sample_interval': 0.005  # 스택 샘플링 간격(초)
+}
+
+# 공유 집계 캐시 설정 (KPI/퍼널/채널 집계를 데이터셋 버전별 키로 Redis에 저장, pub/sub으로 무효화)
+AGGREGATE_CACHE_CONFIG = {
+    'enabled': os.environ.get('DASHBOARD_AGGREGATE_CACHE', '1') != '0',  # 0이면 Redis 공유 없이 프로세스 안에서만 캐시
+    'ttl': 3600,  # 초 (버전이 바뀌지 않아도 이 시간이 지나면 다시 계산)
+    'local_entries': 512,  # 프로세스 메모리(L1)에 둘 직렬화 항목 수
+    'key_prefix': 'dashboard:agg',
+    'channel': 'dashboard:agg:invalidate',
+    'retry_seconds': 5,  # 구독이 끊겼을 때 다시 연결하기 전 대기
+    'shared_figures': True,  # 차트 Figure JSON도 Redis에 공유
+    'figure_max_bytes': 128 * 1024 * 1024
+}
+
+# 합성 데이터 생성 설정 (같은 시드/행 수/샤드 크기면 작업 프로세스 수와 관계없이 같은 데이터)
+DATA_GENERATOR_CONFIG = {
+    'seed': int(os.environ.get('DASHBOARD_DATA_SEED', '0')),  # 시드를 주지 않았을 때의 기본 시드
+    'shard_rows': 100_000,  # 샤드(독립 난수 스트림) 하나의 행 수
+    'workers': int(os.environ.get('DASHBOARD_DATA_WORKERS', '0')),  # 0이면 CPU 수
+    'parallel_min_rows': 500_000,  # 이보다 적으면 프로세스 풀 없이 생성
+    'start_method': 'spawn'  # Streamlit 서버 스레드와 함께 fork하지 않도록 spawn 사용
+}
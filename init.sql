@@ -0,0 +1,48 @@
+-- 채용 대시보드 PostgreSQL 스키마 (docker-compose postgres 서비스 최초 실행 시 적용)
+-- 컬럼 정의는 utils/repository.py의 SCHEMA_SQL과 같게 유지합니다.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;  -- ILIKE '%검색어%' 검색용 trigram 인덱스
+
+CREATE TABLE IF NOT EXISTS candidates (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    position TEXT NOT NULL,
+    status TEXT NOT NULL,
+    experience TEXT,
+    location TEXT,
+    resume_score INTEGER,
+    rating REAL,
+    applied_date TIMESTAMP NOT NULL,
+    email TEXT,
+    phone TEXT,
+    salary_expectation INTEGER,
+    skills TEXT,
+    source TEXT,
+    previous_company TEXT,
+    education TEXT,
+    portfolio_url TEXT,
+    github_url TEXT,
+    linkedin_url TEXT,
+    interview_date TIMESTAMP,
+    notes TEXT
+);
+
+-- 페이지네이션(최근 지원 순), 사이드바 필터, 채널 구간 집계
+CREATE INDEX IF NOT EXISTS idx_candidates_applied_date ON candidates (applied_date DESC, id);
+CREATE INDEX IF NOT EXISTS idx_candidates_status ON candidates (status);
+CREATE INDEX IF NOT EXISTS idx_candidates_position ON candidates (position);
+CREATE INDEX IF NOT EXISTS idx_candidates_source_applied ON candidates (source, applied_date);
+
+-- 검색 필드 (utils/search_index.py SEARCH_FIELDS)
+CREATE INDEX IF NOT EXISTS idx_candidates_name_trgm ON candidates USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_candidates_position_trgm ON candidates USING gin (position gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_candidates_previous_company_trgm ON candidates USING gin (previous_company gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_candidates_skills_trgm ON candidates USING gin (skills gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_candidates_notes_trgm ON candidates USING gin (notes gin_trgm_ops);
+
+CREATE TABLE IF NOT EXISTS channel_spend (
+    date DATE NOT NULL,
+    channel TEXT NOT NULL,
+    cost BIGINT NOT NULL,
+    PRIMARY KEY (date, channel)
+);
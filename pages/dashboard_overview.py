@@ -5,28 +5,51 @@
 import streamlit as st
 import pandas as pd
 from datetime import datetime, timedelta
+import os
 import random
+from typing import Optional
 import numpy as np
 
+from config import REFRESH_INTERVALS
+from utils.aggregate_cache import get_aggregate_cache
+from utils.cache import dataset_version, register_dataset_source, stamp_dataset_version
+from utils.filter_index import FilterIndex
+from utils.pagination import render_paginated_table
+from utils.profiler import profile_rerun
+from utils.refresh import BackgroundRefresher, get_refresher
+from utils.shared_snapshot import share_frame
+from utils.remember_loader import HEAVY_COLUMNS, load_posting_details, load_postings_summary
+from utils.posting_store import DEFAULT_STORE_DIR, PostingStore
+from utils.ingestion import IngestionManager
+from utils.metrics import record_rerun, record_rows, start_metrics_server, timed, track
+
 DEFAULT_CSV_PATH = "premium_remember_jobs_20250527_220128.csv"
+FILTER_COLUMNS = {'position': "직무 선택", 'status': "진행 상태 선택"}
+
+@st.cache_resource(max_entries=4)
+def get_filter_index(version: str, _candidates_df: pd.DataFrame) -> FilterIndex:
+    """데이터셋 버전마다 한 번만 필터 비트맵 인덱스 생성"""
+    return FilterIndex(_candidates_df, FILTER_COLUMNS)
 
-def render_dashboard_overview(candidates_df: pd.DataFrame, interview_df: pd.DataFrame):
+@timed('render')
+def render_dashboard_overview(candidates_df: pd.DataFrame, interview_df: pd.DataFrame, detail_source=None,
+                              filter_index: Optional[FilterIndex] = None):
     st.header("📊 대시보드 개요")
     st.markdown("### 오늘의 채용 현황과 주요 활동을 한눈에 확인하세요")
 
-    # 🔍 필터 추가
+    # 🔍 필터 추가 (미리 만든 인덱스가 없으면 데이터셋 버전마다 한 번 생성)
+    if filter_index is None:
+        filter_index = get_filter_index(dataset_version(candidates_df), candidates_df)
     with st.sidebar:
         st.subheader("🔧 필터 설정")
-        position_options = candidates_df['position'].unique().tolist()
-        position_filter = st.multiselect("직무 선택", position_options, default=position_options)
-
-        status_options = candidates_df['status'].unique().tolist()
-        status_filter = st.multiselect("진행 상태 선택", status_options, default=status_options)
+        selections = {}
+        for column, label in FILTER_COLUMNS.items():
+            options = filter_index.values(column)
+            selections[column] = st.multiselect(label, options, default=options)
 
-    filtered_df = candidates_df[
-        (candidates_df['position'].isin(position_filter)) &
-        (candidates_df['status'].isin(status_filter))
-    ]
+    with track('filter', 'overview_sidebar'):
+        filtered_df = candidates_df[filter_index.mask(selections)]
+    record_rows('filter', 'overview_sidebar', len(filtered_df))
 
     filtered_interviews = interview_df[interview_df['name'].isin(filtered_df['name'])]
 
@@ -42,21 +65,24 @@ def render_dashboard_overview(candidates_df: pd.DataFrame, interview_df: pd.Data
         render_notifications(filtered_df)
 
     st.markdown("---")
-    render_candidate_detail_table(filtered_df)
+    render_candidate_detail_table(filtered_df, detail_source)
 
+@timed('render')
 def render_today_metrics(candidates_df: pd.DataFrame):
     st.subheader("📊 오늘의 주요 지표")
-    today = datetime.now().date()
-    candidates_df['applied_date'] = pd.to_datetime(candidates_df['applied_date'], errors='coerce')
-    today_applicants = len(candidates_df[candidates_df['applied_date'].dt.date == today])
+    today = pd.Timestamp(datetime.now().date())
+    # 입력 프레임(공유 스냅샷일 수 있음)은 수정하지 않고 지원일만 따로 변환
+    applied_day = pd.to_datetime(candidates_df['applied_date'], errors='coerce').dt.normalize()
+    is_today = applied_day == today
+    today_applicants = int(is_today.sum())
 
     week_start = today - timedelta(days=today.weekday())
-    week_applicants = len(candidates_df[candidates_df['applied_date'].dt.date >= week_start])
+    week_applicants = int((applied_day >= week_start).sum())
 
     month_start = today.replace(day=1)
-    month_applicants = len(candidates_df[candidates_df['applied_date'].dt.date >= month_start])
+    month_applicants = int((applied_day >= month_start).sum())
 
-    avg_score_today = candidates_df[candidates_df['applied_date'].dt.date == today]['resume_score'].mean()
+    avg_score_today = candidates_df['resume_score'][is_today].mean()
     avg_score_today = avg_score_today if not pd.isna(avg_score_today) else 0
 
     col1, col2, col3, col4 = st.columns(4)
@@ -69,9 +95,10 @@ def render_today_metrics(candidates_df: pd.DataFrame):
     with col4:
         st.metric("⭐ 현재 평균 점수", f"{avg_score_today:.1f}점")
 
+@timed('render')
 def render_upcoming_interviews(interview_df: pd.DataFrame):
     st.subheader("📅 예정된 면접 일정")
-    interview_df['interview_date'] = pd.to_datetime(interview_df['interview_date'], errors='coerce')
+    interview_df = interview_df.assign(interview_date=pd.to_datetime(interview_df['interview_date'], errors='coerce'))
     upcoming = interview_df[interview_df['interview_date'] >= datetime.now()].sort_values('interview_date').head(5)
 
     if upcoming.empty:
@@ -80,6 +107,7 @@ def render_upcoming_interviews(interview_df: pd.DataFrame):
         for _, row in upcoming.iterrows():
             st.markdown(f"- **{row['name']}** ({row['position']}) – {row['interview_date'].strftime('%Y-%m-%d')}")
 
+@timed('render')
 def render_recent_activities(candidates_df: pd.DataFrame):
     st.subheader("🕒 최근 지원자 활동")
     recent = candidates_df.sort_values('applied_date', ascending=False).head(5)
@@ -87,6 +115,7 @@ def render_recent_activities(candidates_df: pd.DataFrame):
     for _, row in recent.iterrows():
         st.markdown(f"- {row['applied_date'].strftime('%Y-%m-%d')} | **{row['name']}** ({row['position']}) – 점수: {row['resume_score']}")
 
+@timed('render')
 def render_today_todos():
     st.subheader("📝 오늘의 할 일")
     st.checkbox("이력서 검토 5건")
@@ -94,6 +123,7 @@ def render_today_todos():
     st.checkbox("채용 채널 성과 분석")
     st.checkbox("최종 합격자 통보")
 
+@timed('render')
 def render_notifications(candidates_df: pd.DataFrame):
     st.subheader("🔔 주의할 지원자")
     high_score = candidates_df[candidates_df['resume_score'] >= 90].head(3)
@@ -104,18 +134,66 @@ def render_notifications(candidates_df: pd.DataFrame):
         for _, row in high_score.iterrows():
             st.warning(f"⚠️ {row['name']} – 이력서 점수 {row['resume_score']}점 / {row['position']}")
 
-def render_candidate_detail_table(filtered_df):
+@timed('render')
+def render_candidate_detail_table(filtered_df, detail_source=None):
     st.subheader("📋 지원자 상세 보기")
-    for _, row in filtered_df.iterrows():
-        with st.expander(f"👤 {row['name']} - {row['position']} (점수: {row['resume_score']})"):
-            st.write(f"📧 이메일: {row['email']}")
-            st.write(f"📆 지원일: {row['applied_date'].strftime('%Y-%m-%d') if pd.notnull(row['applied_date']) else 'N/A'}")
-            st.write(f"⭐ 평점: {row['rating']}")
-            st.write(f"📋 상태: {row['status']}")
+    # 현재 페이지만 표로 그리고, 선택한 행만 상세 표시
+    row = render_paginated_table(
+        filtered_df,
+        columns={'name': "회사명", 'position': "직무", 'status': "상태",
+                 'resume_score': "점수", 'applied_date': "지원일"},
+        key="detail_page",
+        formatters={'applied_date': lambda s: s.dt.strftime('%Y-%m-%d').fillna('N/A')},
+    )
+    if row is None:
+        return
 
-def load_csv_data(uploaded_file):
-    raw_df = pd.read_csv(uploaded_file)
+    st.markdown(f"#### 👤 {row['name']} - {row['position']} (점수: {row['resume_score']})")
+    st.write(f"📧 이메일: {row['email']}")
+    st.write(f"📆 지원일: {row['applied_date'].strftime('%Y-%m-%d') if pd.notnull(row['applied_date']) else 'N/A'}")
+    st.write(f"⭐ 평점: {row['rating']}")
+    st.write(f"📋 상태: {row['status']}")
+
+    # 대용량 공고 본문은 요청 시에만 파싱
+    if detail_source is not None and pd.notnull(row.get('posting_id')):
+        if st.checkbox("📄 공고 본문 불러오기", key=f"posting_detail_{row.name}"):
+            render_posting_detail(detail_source, int(row['posting_id']))
+
+@st.cache_resource
+def get_posting_store(store_dir: str = DEFAULT_STORE_DIR):
+    """정규화된 공고 상세 저장소 로드 (python -m utils.posting_store 로 미리 생성)"""
+    return PostingStore(store_dir) if PostingStore.exists(store_dir) else None
+
+@timed('render')
+def render_posting_detail(detail_source, posting_id: int):
+    store = get_posting_store()
+    if store is not None and posting_id in store.postings.index:
+        organizations = store.posting_organizations(posting_id)
+        if organizations.empty:
+            st.info("연결된 기업 소개가 없습니다.")
+        for _, org in organizations.iterrows():
+            st.markdown(f"**🏢 {org['title']}**")
+            for description in org['descriptions']:
+                st.caption(f"• {description}")
+        return
+
+    # 저장소에 없는 공고는 원본 CSV에서 해당 공고만 읽기
+    details = load_posting_details(detail_source, [posting_id])
+    if details.empty:
+        st.info("공고 본문이 없습니다.")
+        return
+    for col in HEAVY_COLUMNS:
+        value = details.iloc[0].get(col)
+        if pd.notnull(value):
+            st.markdown(f"**{col}**")
+            st.text(str(value)[:500])
+
+@timed('load', count_rows=True)
+def build_dashboard_frames(source):
+    """공고 CSV를 읽어 대시보드용 지원자/면접 프레임 생성 (버전 기록)"""
+    raw_df, report = load_postings_summary(source)
     df_dashboard = pd.DataFrame({
+        'posting_id': raw_df['공고ID'],
         'name': raw_df['회사명'],
         'position': raw_df['직무'],
         'status': np.random.choice(['서류 심사', '1차 면접', '2차 면접', '최종 면접', '합격', '불합격'], len(raw_df)),
@@ -126,22 +204,87 @@ def load_csv_data(uploaded_file):
     })
     interview_df = df_dashboard[df_dashboard['status'].isin(['1차 면접', '2차 면접', '최종 면접'])].copy()
     interview_df['interview_date'] = [datetime.now() + timedelta(days=i) for i in range(1, len(interview_df)+1)]
-    return df_dashboard, interview_df
+    stamp_dataset_version((df_dashboard, interview_df), report.source)
+    return df_dashboard, interview_df, report
+
+@timed('load')
+@st.cache_data(show_spinner=False)
+def load_csv_data(uploaded_file):
+    """업로드한 파일 내용별로 한 번만 로드 (재실행마다 데이터셋이 바뀌지 않도록 캐시하고 버전을 기록)"""
+    return build_dashboard_frames(uploaded_file)
+
+def _file_token(path: str):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+def get_default_data_refresher(path: str = DEFAULT_CSV_PATH) -> BackgroundRefresher:
+    """기본 CSV를 백그라운드에서 읽고 필터 인덱스까지 만들어 두는 스레드 (파일이 바뀌면 다시 로드)"""
+    def build(previous):
+        df_dashboard, interview_df, report = build_dashboard_frames(path)
+        df_dashboard = share_frame(df_dashboard, 'postings')  # 세션/프로세스 간 공유하는 읽기 전용 매핑
+        filter_index = FilterIndex(df_dashboard, FILTER_COLUMNS)
+        return df_dashboard, interview_df, report, filter_index
+
+    refresher = get_refresher(f"postings:{path}", build, REFRESH_INTERVALS['daily'], changed=lambda: _file_token(path))
+    # 다른 레플리카/수집 작업이 새 공고 버전을 공개하면 바로 다시 로드
+    get_aggregate_cache().on_invalidate('postings', refresher.request_refresh)
+    return refresher
+
+@timed('render')
+def render_load_report(report):
+    st.sidebar.caption(
+        f"📄 {report.source}: {report.rows:,}행 · 파싱 {report.parse_seconds:.3f}초 · "
+        f"최대 메모리 {report.peak_memory_mb:.1f}MB"
+    )
+
+@st.cache_resource
+def get_ingestion_manager():
+    return IngestionManager()
+
+@timed('render')
+def render_ingestion_status(data_source):
+    st.sidebar.subheader("📥 스크랩 수집 현황")
+    manager = get_ingestion_manager()
+
+    if st.sidebar.button("현재 파일 수집 반영"):
+        result = manager.ingest(data_source)
+        if result.skipped:
+            st.sidebar.info(f"{result.source}은(는) 이미 반영된 파일입니다.")
+
+    last = manager.last_result
+    if last is None:
+        st.sidebar.caption("아직 수집된 스크랩이 없습니다.")
+        return
+    st.sidebar.caption(f"마지막 스크랩: {last.source} ({last.scraped_at[:16].replace('T', ' ')})")
+    col1, col2, col3 = st.sidebar.columns(3)
+    col1.metric("🆕 신규", f"{last.new:,}")
+    col2.metric("✏️ 변경", f"{last.changed:,}")
+    col3.metric("⌛ 마감", f"{last.expired:,}")
 
 if __name__ == "__main__":
     st.set_page_config(page_title="📊 대시보드 개요", layout="wide")
-    st.markdown("<h1 style='text-align:center;'>📊 대시보드 개요 (CSV 업로드 + 상세 보기)</h1>", unsafe_allow_html=True)
+    with profile_rerun('dashboard_overview'):  # DASHBOARD_PROFILE=1 또는 ?profile=1 일 때만 프로파일
+        st.markdown("<h1 style='text-align:center;'>📊 대시보드 개요 (CSV 업로드 + 상세 보기)</h1>", unsafe_allow_html=True)
+
+        start_metrics_server()
+        record_rerun('dashboard_overview', new_session='metrics_session' not in st.session_state)
+        st.session_state['metrics_session'] = True
 
-    st.sidebar.title("📁 CSV 업로드")
-    uploaded_file = st.sidebar.file_uploader("CSV 파일을 업로드하세요", type=["csv"])
+        st.sidebar.title("📁 CSV 업로드")
+        uploaded_file = st.sidebar.file_uploader("CSV 파일을 업로드하세요", type=["csv"])
 
-    try:
-        if uploaded_file:
-            df_dashboard, sample_interviews = load_csv_data(uploaded_file)
-        else:
-            raw_df = pd.read_csv(DEFAULT_CSV_PATH)
-            df_dashboard, sample_interviews = load_csv_data(DEFAULT_CSV_PATH)
+        try:
+            data_source = uploaded_file if uploaded_file else DEFAULT_CSV_PATH
+            if uploaded_file:
+                df_dashboard, sample_interviews, load_report = load_csv_data(uploaded_file)
+                register_dataset_source((df_dashboard, sample_interviews))  # st.cache_data는 매번 복사본을 돌려줌
+                filter_index = None
+            else:
+                # 기본 CSV는 백그라운드 스레드가 읽어 둔 스냅샷 사용 (재실행 중에는 파일을 다시 읽지 않음)
+                df_dashboard, sample_interviews, load_report, filter_index = get_default_data_refresher().current().value
+            render_load_report(load_report)
+            render_ingestion_status(data_source)
 
-        render_dashboard_overview(df_dashboard, sample_interviews)
-    except Exception as e:
-        st.error(f"❌ 데이터 로딩 실패: {e}")
+            render_dashboard_overview(df_dashboard, sample_interviews, data_source, filter_index)
+        except Exception as e:
+            st.error(f"❌ 데이터 로딩 실패: {e}")
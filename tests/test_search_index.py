@@ -0,0 +1,102 @@
+"""
+SearchIndex 동시 검색 회귀 테스트
+
+인덱스 하나를 여러 세션(스레드)이 공유하므로, 동시에 검색하거나 검색 중에 행을 추가해도
+결과가 단독 실행과 같아야 합니다.
+"""
+
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.search_index import SearchIndex
+
+# 대부분 일치 행이 적어 행 목록(CSR) 경로를 타는 검색어 ('python'은 전체 코드 배열 경로)
+QUERIES = ['김민수', '민수', '이서연', '박지', '토스', 'react 카카오', '메모 17', 'python']
+
+
+def _candidates(size: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    surnames = ['김', '이', '박', '최', '정', '강', '조', '윤', '장', '임']
+    given = ['민수', '서연', '지훈', '하은', '도윤', '서준', '지우', '예린', '현우', '수아', '지호', '유진']
+    skills = ['python', 'django', 'react', 'java', 'spring', 'sql', 'aws']
+    return pd.DataFrame({
+        'name': [s + g for s, g in zip(rng.choice(surnames, size), rng.choice(given, size))],
+        'position': rng.choice(['백엔드 엔지니어', '프론트엔드 엔지니어', '데이터 분석가', '신입 개발자'], size),
+        'previous_company': rng.choice([f'회사{i}' for i in range(40)] + ['네이버', '카카오', '토스', None], size),
+        'skills': [', '.join(rng.choice(skills, 2, replace=False)) for _ in range(size)],
+        'notes': [f"메모 {i % 500} {rng.choice(skills)}" for i in range(size)],
+    })
+
+
+@pytest.fixture(autouse=True)
+def _frequent_switches():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # 스레드 전환을 잦게 해 공유 상태 경합을 드러냄
+    yield
+    sys.setswitchinterval(interval)
+
+
+def test_concurrent_searches_match_serial_results():
+    index = SearchIndex(_candidates(20_000, seed=0))
+    rng = np.random.default_rng(1)
+    cases = [(QUERIES[i % len(QUERIES)], rng.random(index.size) < 0.5 if i % 2 else None,
+              None if i % 3 else 50) for i in range(300)]
+    expected = [index.search(query, limit=limit, within=within) for query, within, limit in cases]
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(lambda case: index.search(case[0], limit=case[2], within=case[1]), cases))
+
+    mismatches = [i for i, ((rows, scores), (want_rows, want_scores)) in enumerate(zip(results, expected))
+                  if not (np.array_equal(rows, want_rows) and np.array_equal(scores, want_scores))]
+    assert mismatches == []
+
+
+def test_add_during_searches_keeps_results_consistent():
+    first, second = _candidates(20_000, seed=2), _candidates(5_000, seed=3)
+    second.index += len(first)
+    chunks = [second.iloc[start:start + 500] for start in range(0, len(second), 500)]
+
+    # 추가 단계마다의 정답 (같은 순서로 단독 추가한 인덱스)
+    reference = SearchIndex(first, merge_ratio=0.05)
+    states = [{query: reference.search(query) for query in QUERIES}]
+    for chunk in chunks:
+        reference.add(chunk)
+        states.append({query: reference.search(query) for query in QUERIES})
+
+    index = SearchIndex(first, merge_ratio=0.05)
+    errors, done = [], threading.Event()
+
+    def search_loop(offset: int):
+        i = offset
+        while not done.is_set():
+            query = QUERIES[i % len(QUERIES)]
+            try:
+                rows, scores = index.search(query)
+            except Exception as e:  # 스레드 예외는 pytest가 실패로 보지 않으므로 직접 기록
+                errors.append(f"{query}: {type(e).__name__}: {e}")
+                i += 1
+                continue
+            # 어느 한 추가 단계의 결과와 정확히 같아야 함 (추가 도중 상태가 보이면 안 됨)
+            if not any(np.array_equal(rows, state[query][0]) and np.array_equal(scores, state[query][1])
+                       for state in states):
+                errors.append(query)
+            i += 1
+
+    threads = [threading.Thread(target=search_loop, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for chunk in chunks:
+        index.add(chunk)
+    done.set()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    for query in QUERIES:
+        rows, scores = index.search(query)
+        assert np.array_equal(rows, states[-1][query][0]) and np.array_equal(scores, states[-1][query][1])
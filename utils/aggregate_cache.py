@@ -0,0 +1,336 @@
+"""
+공유 집계 캐시 모듈
+
+레플리카마다 같은 KPI/퍼널/채널 집계를 따로 계산하지 않도록, 계산 결과를 데이터셋 버전이 들어간 키로
+Redis에 저장해 공유합니다. 값은 utils.cache.serialize로 직렬화하므로 DataFrame은 Arrow IPC로 저장됩니다.
+
+- 키: {prefix}:{dataset}:{version}:{name}:{인자 지문}
+  버전이 키에 들어 있으므로 새 버전이 공개되면 이전 항목은 다시 읽히지 않습니다.
+- 2단 구조: 프로세스 메모리(L1, 직렬화된 바이트 LRU) → Redis(L2, TTL)
+- publish_version(dataset, version): 현재 버전 포인터를 바꾸고 이전 버전 키를 삭제한 뒤
+  채널로 알립니다. 각 레플리카의 구독 스레드가 메시지를 받아 L1에서 이전 버전 항목을 버리고
+  on_invalidate로 등록한 콜백(예: refresher.request_refresh)을 호출합니다.
+- Redis 클라이언트가 없으면(디스크 캐시 모드) 프로세스 안에서만 캐시/무효화하고, 버전 포인터는 store(공유 데이터
+  캐시 백엔드)에 저장합니다. 공개된 버전이 없으면 고정된 INITIAL_VERSION을 쓰므로 재시작해도 데이터 캐시 키가 유지됩니다.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from config import AGGREGATE_CACHE_CONFIG
+from utils.cache import CacheStats, RedisCacheBackend, deserialize, get_cache_backend, serialize
+from utils.figure_cache import fingerprint
+
+logger = logging.getLogger(__name__)
+
+INITIAL_VERSION = 'initial'  # publish_version 전까지 쓰는 버전 (프로세스/재시작과 관계없이 같음)
+
+
+def _text(value) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class AggregateCache:
+    """데이터셋 버전별 집계 결과 캐시 (L1 프로세스 메모리 + L2 Redis, pub/sub 무효화)"""
+
+    def __init__(self, client=None, prefix: str = AGGREGATE_CACHE_CONFIG['key_prefix'],
+                 channel: str = AGGREGATE_CACHE_CONFIG['channel'], ttl: float = AGGREGATE_CACHE_CONFIG['ttl'],
+                 local_entries: int = AGGREGATE_CACHE_CONFIG['local_entries'], store=None):
+        self.client = client
+        self.store = store  # Redis가 없을 때 버전 포인터를 보관할 캐시 백엔드 (get/set)
+        self.prefix = prefix
+        self.channel = channel
+        self.ttl = ttl
+        self.local_entries = local_entries
+        self.stats = CacheStats()
+        self.shared_hits = 0  # L1 실패 후 Redis에서 찾은 횟수 (stats.hits에 포함)
+
+        self._local: 'OrderedDict[str, bytes]' = OrderedDict()
+        self._versions: Dict[str, str] = {}
+        self._callbacks: Dict[str, List[Callable[[str], None]]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._listener: Optional[threading.Thread] = None
+
+    # ---- 키 ----
+
+    def _version_key(self, dataset: str) -> str:
+        return f"{self.prefix}:{dataset}:__version__"
+
+    def _versions_key(self, dataset: str) -> str:
+        return f"{self.prefix}:{dataset}:__versions__"
+
+    def _stored_version_key(self, dataset: str) -> str:
+        return hashlib.sha256(self._version_key(dataset).encode()).hexdigest()  # 디스크 백엔드 파일 이름으로 쓰임
+
+    def _stored_version(self, dataset: str) -> Optional[str]:
+        if self.store is None:
+            return None
+        try:
+            data = self.store.get(self._stored_version_key(dataset))
+        except Exception as e:
+            logger.warning("'%s' 데이터셋 버전을 읽지 못했습니다: %s", dataset, e)
+            return None
+        return _text(data) if data else None
+
+    def _store_version(self, dataset: str, version: str):
+        if self.store is None:
+            return
+        try:
+            self.store.set(self._stored_version_key(dataset), version.encode())
+        except Exception as e:
+            logger.warning("'%s' 데이터셋 버전을 저장하지 못했습니다: %s", dataset, e)
+
+    def _members_key(self, dataset: str, version: str) -> str:
+        return f"{self.prefix}:{dataset}:{version}:__keys__"
+
+    def key(self, dataset: str, version: str, name: str, args: tuple = (), kwargs: Optional[dict] = None) -> str:
+        parts = [fingerprint(value) for value in args]
+        parts += [f"{arg_name}={fingerprint(value)}" for arg_name, value in sorted((kwargs or {}).items())]
+        digest = hashlib.sha256('|'.join(parts).encode()).hexdigest()[:32]
+        return f"{self.prefix}:{dataset}:{version}:{name}:{digest}"
+
+    # ---- 조회/저장 ----
+
+    def _redis(self, operation: Callable[[], Any], default=None):
+        """Redis 호출 (연결 오류는 경고만 남기고 프로세스 캐시로 계속 동작)"""
+        if self.client is None:
+            return default
+        try:
+            return operation()
+        except Exception as e:
+            logger.warning("공유 집계 캐시(Redis)를 사용하지 못했습니다: %s", e)
+            return default
+
+    def _remember(self, key: str, data: bytes):
+        with self._lock:
+            self._local[key] = data
+            self._local.move_to_end(key)
+            while len(self._local) > self.local_entries:
+                self._local.popitem(last=False)
+                self.stats.evictions += 1
+
+    def get_or_compute(self, dataset: str, version: str, name: str, compute: Callable[..., Any],
+                       args: tuple = (), kwargs: Optional[dict] = None) -> Any:
+        """캐시된 집계 결과 반환 (없으면 compute(*args, **kwargs)로 계산해 L1/Redis에 저장)
+
+        L1에는 직렬화된 바이트를 두고 호출마다 새 객체로 복원하므로, 받은 프레임을 수정해도 캐시에 영향이 없습니다.
+        """
+        kwargs = kwargs or {}
+        key = self.key(dataset, version, name, args, kwargs)
+        with self._lock:
+            data = self._local.get(key)
+            if data is not None:
+                self._local.move_to_end(key)
+        if data is None:
+            data = self._redis(lambda: self.client.get(key))
+            if data is not None:
+                self.shared_hits += 1
+                self._remember(key, data)
+        if data is not None:
+            try:
+                value = deserialize(data)
+                self.stats.hits += 1
+                return value
+            except Exception as e:
+                logger.warning("손상된 집계 캐시 항목을 삭제합니다 (%s): %s", key, e)
+                with self._lock:
+                    self._local.pop(key, None)
+                self._redis(lambda: self.client.delete(key))
+
+        self.stats.misses += 1
+        value = compute(*args, **kwargs)
+        data = serialize(value)
+        self._remember(key, data)
+
+        def store():
+            ttl = int(self.ttl) if self.ttl else None
+            members = self._members_key(dataset, version)
+            pipe = self.client.pipeline()
+            pipe.set(key, data, ex=ttl)
+            pipe.sadd(members, key)
+            pipe.sadd(self._versions_key(dataset), version)
+            if ttl:
+                pipe.expire(members, ttl)
+            pipe.execute()
+
+        self._redis(store)
+        return value
+
+    def view(self, target, dataset: str, version: str, methods: Iterable[str]) -> 'CachedView':
+        """target의 지정한 조회 메서드 결과를 이 캐시에 저장하는 래퍼"""
+        return CachedView(target, self, dataset, version, methods)
+
+    # ---- 데이터셋 버전 ----
+
+    def current_version(self, dataset: str) -> str:
+        """데이터셋의 현재 공개 버전 (Redis에 없으면 모든 레플리카가 같은 값을 쓰도록 INITIAL_VERSION을 SET NX)"""
+        with self._lock:
+            version = self._versions.get(dataset)
+        if version is not None:
+            return version
+
+        def shared():
+            self.client.set(self._version_key(dataset), INITIAL_VERSION, nx=True)
+            return _text(self.client.get(self._version_key(dataset)))
+
+        version = self._redis(shared)
+        if version is None and self.store is not None:
+            version = self._stored_version(dataset)
+            if version is None:
+                version = INITIAL_VERSION
+                self._store_version(dataset, version)  # Redis의 SET NX와 같이 처음 읽을 때 기록
+        version = version or INITIAL_VERSION
+        with self._lock:
+            version = self._versions.setdefault(dataset, version)
+        if self.client is not None:
+            self.start_listener()  # 이후 버전 변경은 구독 메시지로 반영
+        return version
+
+    def publish_version(self, dataset: str, version: Optional[str] = None) -> str:
+        """새 데이터셋 버전을 공개하고 이전 버전 항목 삭제 + 모든 레플리카에 무효화 알림"""
+        version = version or uuid.uuid4().hex
+
+        def publish():
+            previous = [_text(v) for v in self.client.smembers(self._versions_key(dataset))]
+            pipe = self.client.pipeline()
+            pipe.set(self._version_key(dataset), version)
+            for old in previous:
+                if old != version:
+                    members = self._members_key(dataset, old)
+                    for key in self.client.smembers(members):
+                        pipe.delete(key)
+                    pipe.delete(members)
+                    pipe.srem(self._versions_key(dataset), old)
+            pipe.publish(self.channel, json.dumps({'dataset': dataset, 'version': version}))
+            pipe.execute()
+
+        self._redis(publish)
+        self._store_version(dataset, version)
+        self._invalidate(dataset, version)  # 구독 메시지를 기다리지 않고 이 프로세스에는 바로 반영
+        return version
+
+    def on_invalidate(self, dataset: str, callback: Callable[[str], None]):
+        """데이터셋에 새 버전이 공개되면 callback(version) 호출 (같은 콜백은 한 번만 등록)"""
+        with self._lock:
+            callbacks = self._callbacks.setdefault(dataset, [])
+            if callback not in callbacks:
+                callbacks.append(callback)
+        if self.client is not None:
+            self.start_listener()
+
+    def _invalidate(self, dataset: str, version: str):
+        with self._lock:
+            if self._versions.get(dataset) == version:
+                return  # 이미 반영한 버전 (자기 자신이 보낸 메시지 등)
+            self._versions[dataset] = version
+            stale_prefix, current_prefix = f"{self.prefix}:{dataset}:", f"{self.prefix}:{dataset}:{version}:"
+            for key in [k for k in self._local if k.startswith(stale_prefix) and not k.startswith(current_prefix)]:
+                del self._local[key]
+            callbacks = list(self._callbacks.get(dataset, ()))
+
+        logger.info("'%s' 데이터셋 버전 %s 공개, 이전 집계 캐시를 버립니다", dataset, version)
+        for callback in callbacks:
+            try:
+                callback(version)
+            except Exception:
+                logger.exception("'%s' 무효화 콜백 실패", dataset)
+
+    # ---- 구독 스레드 ----
+
+    def start_listener(self) -> 'AggregateCache':
+        """무효화 채널을 구독하는 데몬 스레드 시작 (Redis가 없으면 아무것도 하지 않음)"""
+        with self._lock:
+            if self.client is None or (self._listener is not None and self._listener.is_alive()):
+                return self
+            self._stop.clear()
+            self._listener = threading.Thread(target=self._listen, name='aggregate-cache-listener', daemon=True)
+            self._listener.start()
+        return self
+
+    def stop_listener(self, timeout: Optional[float] = None):
+        self._stop.set()
+        if self._listener is not None:
+            self._listener.join(timeout)
+
+    def _resync(self):
+        """구독이 끊긴 사이 놓친 버전 변경을 포인터에서 다시 읽어 반영"""
+        with self._lock:
+            datasets = list(self._versions)
+        for dataset in datasets:
+            version = self.client.get(self._version_key(dataset))
+            if version is not None:
+                self._invalidate(dataset, _text(version))
+
+    def _listen(self):
+        while not self._stop.is_set():
+            pubsub = None
+            try:
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                self._resync()
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is None or message.get('type') != 'message':
+                        continue
+                    try:
+                        payload = json.loads(_text(message['data']))
+                        self._invalidate(payload['dataset'], payload['version'])
+                    except (ValueError, KeyError, TypeError) as e:
+                        logger.warning("잘못된 무효화 메시지를 무시합니다: %s", e)
+            except Exception as e:
+                logger.warning("집계 캐시 무효화 채널 구독이 끊겼습니다. 다시 연결합니다: %s", e)
+                self._stop.wait(AGGREGATE_CACHE_CONFIG['retry_seconds'])
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+
+class CachedView:
+    """조회 객체(FunnelEngine, ChannelROI, 저장소 등)의 지정한 메서드 결과를 AggregateCache에 저장하는 래퍼
+
+    나머지 속성(windows, progress_stages 등)은 원래 객체의 값을 그대로 돌려줍니다.
+    """
+
+    def __init__(self, target, cache: AggregateCache, dataset: str, version: str, methods: Iterable[str]):
+        self._target = target
+        self._cache = cache
+        self._dataset = dataset
+        self._version = version
+        self._methods = frozenset(methods)
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._target, name)
+        if name not in self._methods or not callable(attr):
+            return attr
+        qualified = f"{type(self._target).__name__}.{name}"
+
+        def cached(*args, **kwargs):
+            return self._cache.get_or_compute(self._dataset, self._version, qualified, attr, args, kwargs)
+
+        return cached
+
+
+_default_cache: Optional[AggregateCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_aggregate_cache() -> AggregateCache:
+    """프로세스 공용 집계 캐시 (공유 캐시 백엔드가 Redis이면 같은 연결을 사용, 아니면 프로세스 안에서만 동작)"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            backend = get_cache_backend()
+            client = None
+            if AGGREGATE_CACHE_CONFIG['enabled'] and isinstance(backend, RedisCacheBackend):
+                client = backend.client
+            _default_cache = AggregateCache(client, store=None if client is not None else backend)
+        return _default_cache
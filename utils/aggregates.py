@@ -0,0 +1,127 @@
+"""
+지원자 집계 큐브 모듈
+
+직무 × 상태 × 지원 월 × 채널 × 지역 × 경력 조합별 지원자 수와 이력서 점수 합계를
+데이터셋 버전마다 한 번 NumPy 다차원 배열로 만들어 둡니다.
+KPI와 차트는 사이드바 필터에 맞게 큐브를 잘라 합산하므로 지원자 수가 늘어나도 응답 시간이 일정합니다.
+"""
+
+import functools
+import hashlib
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+CUBE_DIMENSIONS = ['position', 'status', 'month', 'source', 'location', 'experience']
+
+
+def _dimension_codes(df: pd.DataFrame, dimension: str, date_column: str):
+    """차원 컬럼을 (정수 코드, 라벨 목록)으로 변환 (결측은 -1)"""
+    if dimension == 'month':
+        months = df[date_column].to_numpy(dtype='datetime64[ns]').astype('datetime64[M]')
+        missing = np.isnat(months)
+        uniques, codes = np.unique(months[~missing], return_inverse=True)
+        all_codes = np.full(len(months), -1, dtype=np.int64)
+        all_codes[~missing] = codes
+        return all_codes, [str(month) for month in uniques]
+
+    series = df[dimension]
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy().astype(np.int64), list(series.cat.categories)
+    codes, uniques = pd.factorize(series, sort=True)
+    return codes.astype(np.int64), list(uniques)
+
+
+class AggregateCube:
+    """차원 조합별 지원자 수 / 점수 합계 큐브"""
+
+    def __init__(self, df: pd.DataFrame, dimensions: Iterable[str] = CUBE_DIMENSIONS,
+                 measure: str = 'resume_score', date_column: str = 'applied_date'):
+        self.dimensions: List[str] = list(dimensions)
+        self.labels: Dict[str, List[Any]] = {}
+        self._positions: Dict[str, Dict[Any, int]] = {}
+
+        codes = []
+        for dimension in self.dimensions:
+            dimension_codes, labels = _dimension_codes(df, dimension, date_column)
+            codes.append(dimension_codes)
+            self.labels[dimension] = labels
+            self._positions[dimension] = {label: i for i, label in enumerate(labels)}
+
+        shape = tuple(len(self.labels[dimension]) for dimension in self.dimensions)
+        values = df[measure].to_numpy(dtype=np.float64)
+        valid = np.logical_and.reduce([c >= 0 for c in codes]) if codes else np.ones(len(df), dtype=bool)
+        self.dropped_rows = int((~valid).sum())  # 차원 값이 결측이라 큐브에서 빠진 행
+
+        flat = np.ravel_multi_index([c[valid] for c in codes], shape)
+        size = int(np.prod(shape))
+        self._counts = np.bincount(flat, minlength=size).reshape(shape)
+        self._sums = np.bincount(flat, weights=np.nan_to_num(values[valid]), minlength=size).reshape(shape)
+
+        # 점수 분포는 필터와 무관하게 전체 데이터 기준으로 사용 (점수 값별 인원)
+        scores = values[valid & ~np.isnan(values)]
+        self._score_values, self._score_counts = np.unique(scores, return_counts=True)
+
+    @functools.cached_property
+    def fingerprint(self) -> str:
+        """큐브 내용 지문 (차트 캐시 키용)"""
+        digest = hashlib.sha256(repr((self.dimensions, self.labels)).encode())
+        digest.update(self._counts.tobytes())
+        digest.update(self._sums.tobytes())
+        return digest.hexdigest()
+
+    @property
+    def nbytes(self) -> int:
+        return self._counts.nbytes + self._sums.nbytes
+
+    def _slice(self, array: np.ndarray, selections: Optional[Dict[str, Iterable[Any]]]):
+        """선택 값에 해당하는 축만 남긴 부분 배열과 차원별 라벨"""
+        labels = {dimension: self.labels[dimension] for dimension in self.dimensions}
+        for dimension, selected in (selections or {}).items():
+            if dimension not in self._positions:
+                raise KeyError(f"큐브에 없는 차원입니다: {dimension}")
+            positions = self._positions[dimension]
+            index = sorted({positions[value] for value in selected if value in positions})
+            if len(index) == len(positions):
+                continue
+            array = array.take(index, axis=self.dimensions.index(dimension))
+            labels[dimension] = [self.labels[dimension][i] for i in index]
+        return array, labels
+
+    def _reduce(self, array: np.ndarray, by, selections) -> Union[float, pd.Series, pd.DataFrame]:
+        array, labels = self._slice(array, selections)
+        by = [by] if isinstance(by, str) else list(by or [])
+        keep = [self.dimensions.index(dimension) for dimension in by]
+        reduced = array.sum(axis=tuple(i for i in range(array.ndim) if i not in keep))
+
+        if not by:
+            return reduced.item()
+        # sum 결과는 원래 축 순서이므로 요청한 차원 순서로 재배열
+        reduced = reduced.transpose(np.argsort(np.argsort(keep)))
+        if len(by) == 1:
+            return pd.Series(reduced, index=pd.Index(labels[by[0]], name=by[0]))
+        if len(by) == 2:
+            return pd.DataFrame(reduced, index=pd.Index(labels[by[0]], name=by[0]),
+                                columns=pd.Index(labels[by[1]], name=by[1]))
+        raise ValueError("by는 차원 2개까지 지정할 수 있습니다")
+
+    def counts(self, by=None, selections: Optional[Dict[str, Iterable[Any]]] = None):
+        """지원자 수 (by 없으면 전체 합계, 차원 1개면 Series, 2개면 DataFrame)"""
+        return self._reduce(self._counts, by, selections)
+
+    def score_sum(self, by=None, selections: Optional[Dict[str, Iterable[Any]]] = None):
+        """이력서 점수 합계"""
+        return self._reduce(self._sums, by, selections)
+
+    def mean_score(self, by=None, selections: Optional[Dict[str, Iterable[Any]]] = None):
+        """평균 이력서 점수 (지원자가 없는 조합은 NaN)"""
+        counts = self.counts(by, selections)
+        sums = self.score_sum(by, selections)
+        if not by:
+            return sums / counts if counts else float('nan')
+        return sums / counts.where(counts > 0)
+
+    def score_histogram(self) -> pd.Series:
+        """전체 데이터의 점수 값별 지원자 수"""
+        return pd.Series(self._score_counts, index=pd.Index(self._score_values, name='score'))
@@ -0,0 +1,376 @@
+"""
+공유 캐시 모듈
+
+st.cache_data는 한 Streamlit 프로세스의 메모리에만 남기 때문에 재시작하거나
+레플리카가 늘어날 때마다 데이터를 다시 생성합니다. 이 모듈은 함수 결과를
+내용 주소(content-addressed) 키로 디스크 또는 Redis에 저장해 재시작 후에도,
+여러 워커 사이에서도 재사용합니다.
+
+- DiskCacheBackend : 공유 볼륨(./data) 위의 Arrow IPC 파일, TTL + 용량 기반 LRU 삭제
+- RedisCacheBackend: docker-compose의 redis 서비스, TTL + 용량 기반 LRU 삭제
+"""
+
+import functools
+import hashlib
+import inspect
+import logging
+import os
+import pickle
+import struct
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+import pandas as pd
+import pyarrow as pa
+
+from config import CACHE_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# 생성 시점마다 달라지는 데이터셋 버전 (DataFrame.attrs에 저장되어 Arrow 직렬화 후에도 유지)
+DATASET_VERSION_ATTR = 'dataset_version'
+
+
+@dataclass
+class CacheStats:
+    """캐시 적중/실패/삭제 통계 (프로세스 단위)"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _ArrowFrame:
+    """Arrow IPC 스트림으로 직렬화된 DataFrame"""
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, pd.DataFrame):
+        table = pa.Table.from_pandas(value, preserve_index=True)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return _ArrowFrame(sink.getvalue().to_pybytes())
+    if isinstance(value, (tuple, list)):
+        return type(value)(_encode(v) for v in value)
+    return value
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, _ArrowFrame):
+        return pa.ipc.open_stream(value.data).read_all().to_pandas()
+    if isinstance(value, (tuple, list)):
+        return type(value)(_decode(v) for v in value)
+    return value
+
+
+def serialize(value: Any) -> bytes:
+    """DataFrame은 Arrow IPC로, 나머지 값은 pickle로 직렬화"""
+    return pickle.dumps(_encode(value), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def deserialize(data: bytes) -> Any:
+    return _decode(pickle.loads(data))
+
+
+def _hash_value(value: Any) -> bytes:
+    if isinstance(value, pd.DataFrame):
+        row_hashes = pd.util.hash_pandas_object(value, index=True).to_numpy()
+        return hashlib.sha256(row_hashes.tobytes() + repr(list(value.columns)).encode()).digest()
+    return hashlib.sha256(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)).digest()
+
+
+# 데이터셋 버전을 붙인 원본 프레임 (id -> 약한 참조)
+# attrs는 필터링/reset_index한 파생 프레임에도 복사되므로, 버전만으로 내용을 대신할 수 있는 것은 원본 객체뿐입니다.
+_version_sources: Dict[int, weakref.ref] = {}
+_version_sources_lock = threading.Lock()
+
+
+def register_dataset_source(value: Any) -> Any:
+    """버전이 있는 DataFrame(또는 그 튜플/리스트)을 원본 프레임으로 등록"""
+    frames = value if isinstance(value, (tuple, list)) else [value]
+    for frame in frames:
+        if isinstance(frame, pd.DataFrame) and DATASET_VERSION_ATTR in frame.attrs:
+            key = id(frame)
+            with _version_sources_lock:
+                _version_sources[key] = weakref.ref(frame, lambda _, key=key: _version_sources.pop(key, None))
+    return value
+
+
+def is_dataset_source(frame: Any) -> bool:
+    """등록된 원본 프레임 객체인지 (같은 버전 attrs를 가진 파생 프레임은 False)"""
+    ref = _version_sources.get(id(frame))
+    return ref is not None and ref() is frame
+
+
+def stamp_dataset_version(value: Any, key: str, unique: bool = True) -> Any:
+    """새로 계산한 결과의 DataFrame에 데이터셋 버전 기록 (이미 있으면 유지) 후 원본 프레임으로 등록
+
+    unique=False면 키만으로 버전을 만들어, 같은 키를 다시 계산해도(다른 레플리카 포함) 같은 버전이 됩니다.
+    """
+    frames = value if isinstance(value, (tuple, list)) else [value]
+    version = f"{key[:12]}-{time.time_ns():x}" if unique else key[:24]
+    for frame in frames:
+        if isinstance(frame, pd.DataFrame):
+            frame.attrs.setdefault(DATASET_VERSION_ATTR, version)
+    return register_dataset_source(value)
+
+
+def dataset_version(df: pd.DataFrame) -> str:
+    """데이터셋 버전 조회 (버전이 없는 프레임은 내용 해시로 대신함)
+
+    attrs는 필터링한 파생 프레임에도 전파되므로, 인덱스/집계는 원본 프레임 기준으로만 만듭니다.
+    """
+    version = df.attrs.get(DATASET_VERSION_ATTR)
+    if version is None:
+        version = _hash_value(df).hex()[:24]
+    return f"{version}:{len(df)}"
+
+
+def make_key(func: Callable, source_hash: str, args: tuple, kwargs: dict) -> str:
+    """함수 식별자, 소스 코드, 인자 값으로 캐시 키 생성 ('_'로 시작하는 인자는 제외)"""
+    bound = inspect.signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+
+    digest = hashlib.sha256(f"{func.__module__}.{func.__qualname__}:{source_hash}".encode())
+    for name, value in bound.arguments.items():
+        if name.startswith('_'):
+            continue
+        digest.update(name.encode())
+        digest.update(_hash_value(value))
+    return digest.hexdigest()
+
+
+class DiskCacheBackend:
+    """공유 디렉토리 기반 캐시 (파일 헤더에 만료 시각 저장, 수정 시각으로 LRU 관리)"""
+
+    _HEADER = struct.Struct('<d')
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.arrowcache")
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                (expires_at,) = self._HEADER.unpack(f.read(self._HEADER.size))
+                if expires_at and expires_at < time.time():
+                    data = None
+                else:
+                    data = f.read()
+        except (FileNotFoundError, struct.error):
+            data = None
+            expires_at = None
+
+        if data is None:
+            if expires_at:
+                self.delete(key)
+            self.stats.misses += 1
+            return None
+
+        os.utime(path)  # LRU 갱신
+        self.stats.hits += 1
+        return data
+
+    def set(self, key: str, data: bytes, ttl: Optional[float] = None):
+        expires_at = time.time() + ttl if ttl else 0.0
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(self._HEADER.pack(expires_at))
+            f.write(data)
+        os.replace(tmp_path, path)  # 다른 워커가 쓰다 만 파일을 읽지 않도록 원자적 교체
+        self._evict()
+
+    def delete(self, key: str):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith('.arrowcache'):
+                os.remove(entry.path)
+
+    def _evict(self):
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith('.arrowcache'):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            self.stats.evictions += 1
+
+
+class RedisCacheBackend:
+    """Redis 기반 캐시 (TTL은 Redis 만료, LRU는 정렬 집합으로 관리)"""
+
+    def __init__(self, client, max_bytes: int, prefix: str = CACHE_CONFIG['key_prefix']):
+        self.client = client
+        self.max_bytes = max_bytes
+        self.prefix = prefix
+        self.stats = CacheStats()
+        self._lru_key = f"{prefix}:__lru__"
+        self._sizes_key = f"{prefix}:__sizes__"
+
+    @classmethod
+    def from_url(cls, url: str, max_bytes: int, prefix: str = CACHE_CONFIG['key_prefix']) -> 'RedisCacheBackend':
+        import redis  # 선택 의존성: Redis 백엔드를 쓸 때만 필요
+
+        return cls(redis.Redis.from_url(url), max_bytes, prefix)
+
+    def _data_key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        data = self.client.get(self._data_key(key))
+        if data is None:
+            # TTL로 만료된 항목은 LRU/용량 정보에서도 정리
+            pipe = self.client.pipeline()
+            pipe.zrem(self._lru_key, key)
+            pipe.hdel(self._sizes_key, key)
+            pipe.execute()
+            self.stats.misses += 1
+            return None
+
+        self.client.zadd(self._lru_key, {key: time.time()})
+        self.stats.hits += 1
+        return data
+
+    def set(self, key: str, data: bytes, ttl: Optional[float] = None):
+        pipe = self.client.pipeline()
+        pipe.set(self._data_key(key), data, ex=int(ttl) if ttl else None)
+        pipe.zadd(self._lru_key, {key: time.time()})
+        pipe.hset(self._sizes_key, key, len(data))
+        pipe.execute()
+        self._evict()
+
+    def delete(self, key: str):
+        pipe = self.client.pipeline()
+        pipe.delete(self._data_key(key))
+        pipe.zrem(self._lru_key, key)
+        pipe.hdel(self._sizes_key, key)
+        pipe.execute()
+
+    def clear(self):
+        for key in self.client.zrange(self._lru_key, 0, -1):
+            self.delete(key.decode() if isinstance(key, bytes) else key)
+
+    def _evict(self):
+        total = sum(int(size) for size in self.client.hvals(self._sizes_key))
+        while total > self.max_bytes:
+            oldest = self.client.zrange(self._lru_key, 0, 0)
+            if not oldest:
+                break
+            key = oldest[0].decode() if isinstance(oldest[0], bytes) else oldest[0]
+            size = int(self.client.hget(self._sizes_key, key) or 0)
+            self.delete(key)
+            total -= size
+            self.stats.evictions += 1
+
+
+_default_backend = None
+_default_backend_lock = threading.Lock()
+
+
+def get_cache_backend():
+    """CACHE_CONFIG에 따른 기본 캐시 백엔드 (Redis 연결 실패 시 디스크로 대체)"""
+    global _default_backend
+    with _default_backend_lock:
+        if _default_backend is None:
+            if CACHE_CONFIG['backend'] == 'redis':
+                try:
+                    backend = RedisCacheBackend.from_url(CACHE_CONFIG['redis_url'], CACHE_CONFIG['max_bytes'])
+                    backend.client.ping()
+                    _default_backend = backend
+                except Exception as e:
+                    logger.warning("Redis 캐시를 사용할 수 없어 디스크 캐시로 대체합니다: %s", e)
+            if _default_backend is None:
+                _default_backend = DiskCacheBackend(CACHE_CONFIG['disk_dir'], CACHE_CONFIG['max_bytes'])
+        return _default_backend
+
+
+def shared_cache(ttl: Optional[float] = None, backend=None, dataset: Optional[str] = None,
+                 deterministic: bool = False):
+    """st.cache_data 대신 사용하는 공유 캐시 데코레이터
+
+    ttl은 초 단위이며, 인자 이름이 '_'로 시작하면 (예: _self) 키 계산에서 제외합니다.
+    func.refresh(...)는 캐시를 건너뛰고 다시 계산한 값으로 항목을 덮어씁니다.
+    dataset을 주면 그 데이터셋의 현재 공개 버전(utils.aggregate_cache)을 키에 넣어,
+    새 버전이 공개되면 TTL 전이라도 다시 계산합니다.
+    deterministic=True는 결과가 인자만으로 정해지는 함수에 쓰며, 결과 프레임의 데이터셋 버전을 키에서 만들어
+    레플리카마다 refresh해도 버전(과 그 버전으로 공유하는 집계 캐시 키)이 갈라지지 않습니다.
+    """
+    def decorator(func: Callable) -> Callable:
+        try:
+            source_hash = hashlib.sha256(inspect.getsource(func).encode()).hexdigest()
+        except (OSError, TypeError):
+            source_hash = ''
+
+        def cache_key(args: tuple, kwargs: dict) -> str:
+            key = make_key(func, source_hash, args, kwargs)
+            if dataset is not None:
+                from utils.aggregate_cache import get_aggregate_cache  # 순환 import 방지
+
+                version = get_aggregate_cache().current_version(dataset)
+                key = hashlib.sha256(f"{key}:{dataset}:{version}".encode()).hexdigest()
+            return key
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = backend or get_cache_backend()
+            key = cache_key(args, kwargs)
+
+            data = cache.get(key)
+            if data is not None:
+                try:
+                    return register_dataset_source(deserialize(data))
+                except Exception as e:
+                    logger.warning("손상된 캐시 항목을 삭제합니다 (%s): %s", key, e)
+                    cache.delete(key)
+
+            return compute(cache, key, args, kwargs)
+
+        def compute(cache, key: str, args: tuple, kwargs: dict):
+            value = stamp_dataset_version(func(*args, **kwargs), key, unique=not deterministic)
+            cache.set(key, serialize(value), ttl)
+            return value
+
+        def refresh(*args, **kwargs):
+            """캐시를 무시하고 다시 계산해 저장 (만료 전에 백그라운드에서 미리 갱신할 때 사용)"""
+            cache = backend or get_cache_backend()
+            return compute(cache, cache_key(args, kwargs), args, kwargs)
+
+        wrapper.refresh = refresh
+        return wrapper
+
+    return decorator
@@ -0,0 +1,181 @@
+"""
+채널 ROI 계산 모듈
+
+지원자 행에서 채널(source)별 지원자 수/합격자 수/이력서 점수 합계를 일 단위로 집계하고,
+광고비는 교체 가능한 광고비 테이블(SpendTable)에서 가져와 최근 7/30/90일 구간의 CPA/전환율/품질을 계산합니다.
+
+새 지원자가 들어오면 그 행만 일 단위 버킷에 더하고, 최신 날짜가 바뀌면 구간에서 빠지는 날의 버킷만
+구간 합계에서 뺍니다. 전체 이력을 다시 훑지 않으므로 갱신 비용은 새 행 수 + 지난 날짜 수에 비례합니다.
+합격 여부는 add 시점의 상태 기준이며, 합격자는 지원일에 귀속됩니다.
+"""
+
+import os
+from typing import Dict, Iterable, List, Optional, Protocol
+
+import numpy as np
+import pandas as pd
+
+from config import CHANNEL_SPEND_CONFIG, ROI_WINDOWS
+
+
+class SpendTable(Protocol):
+    """채널별 일 광고비 조회 인터페이스"""
+
+    def daily_cost(self, channels: List[str], days: np.ndarray) -> np.ndarray:
+        """[채널, 날짜] 광고비 배열 (days는 datetime64[D])"""
+        ...
+
+
+class FlatSpendTable:
+    """채널별 일 광고비가 고정된 테이블 (등록되지 않은 채널은 0원)"""
+
+    def __init__(self, daily_spend: Dict[str, float]):
+        self.daily_spend = dict(daily_spend)
+
+    def daily_cost(self, channels: List[str], days: np.ndarray) -> np.ndarray:
+        per_day = np.array([self.daily_spend.get(channel, 0.0) for channel in channels], dtype=np.float64)
+        return np.repeat(per_day[:, None], len(days), axis=1)
+
+
+class FrameSpendTable:
+    """(date, channel, cost) 행으로 된 실제 집행 내역 테이블 (내역이 없는 날은 0원)"""
+
+    def __init__(self, spend_df: pd.DataFrame):
+        days = pd.to_datetime(spend_df['date']).to_numpy().astype('datetime64[D]')
+        self._table = (
+            pd.DataFrame({'day': days, 'channel': spend_df['channel'].astype(str), 'cost': spend_df['cost']})
+            .groupby(['channel', 'day'])['cost'].sum()
+        )
+
+    @classmethod
+    def from_csv(cls, path: str) -> 'FrameSpendTable':
+        return cls(pd.read_csv(path))
+
+    def daily_cost(self, channels: List[str], days: np.ndarray) -> np.ndarray:
+        index = pd.MultiIndex.from_product([channels, days.astype('datetime64[ns]')], names=['channel', 'day'])
+        costs = self._table.reindex(index, fill_value=0).to_numpy(dtype=np.float64)
+        return costs.reshape(len(channels), len(days))
+
+
+def load_spend_table() -> SpendTable:
+    """CHANNEL_SPEND_CONFIG의 CSV가 있으면 집행 내역, 없으면 채널별 고정 일 광고비"""
+    path = CHANNEL_SPEND_CONFIG['spend_table_path']
+    if path and os.path.exists(path):
+        return FrameSpendTable.from_csv(path)
+    return FlatSpendTable(CHANNEL_SPEND_CONFIG['daily_spend'])
+
+
+def channel_metrics_frame(channels: List[str], applicants: np.ndarray, hired: np.ndarray,
+                          score_sum: np.ndarray, cost: np.ndarray) -> pd.DataFrame:
+    """채널별 합계에서 성과 지표 프레임 생성 (applicants, hired, cost, cpa, conversion_rate, avg_score, quality_score)"""
+    applicants, hired, score_sum, cost = (np.asarray(v, dtype=np.float64) for v in (applicants, hired, score_sum, cost))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        frame = pd.DataFrame({
+            'channel': channels,
+            'applicants': applicants.astype(np.int64),
+            'hired': hired.astype(np.int64),
+            'cost': cost.round().astype(np.int64),
+            'cpa': np.where(hired > 0, cost / hired, 0).round().astype(np.int64),
+            'conversion_rate': np.where(applicants > 0, hired / applicants * 100, 0).round(2),
+            'avg_score': np.where(applicants > 0, score_sum / applicants, np.nan).round(1),
+        })
+    frame['quality_score'] = (frame['avg_score'] / 20).round(1)  # 이력서 점수(100점)를 5점 척도로 환산
+    return frame
+
+
+def summarize_channels(metrics: pd.DataFrame) -> Dict[str, float]:
+    """채널별 성과 프레임의 전체 합계 (applicants, hired, cost, cpa)"""
+    applicants, hired, cost = (int(metrics[c].sum()) for c in ('applicants', 'hired', 'cost'))
+    return {
+        'applicants': applicants,
+        'hired': hired,
+        'cost': cost,
+        'cpa': cost / hired if hired else 0.0,
+    }
+
+
+class ChannelROI:
+    """채널별 최근 N일 구간 성과 (일 단위 링 버퍼 + 구간 합계 증분 갱신)"""
+
+    _MEASURES = ('applicants', 'hired', 'score_sum')
+
+    def __init__(self, channels: Iterable[str], spend_table: Optional[SpendTable] = None,
+                 windows: Iterable[int] = ROI_WINDOWS, hired_status: str = '합격'):
+        self.channels: List[str] = list(channels)
+        self.spend_table = spend_table if spend_table is not None else load_spend_table()
+        self.windows: List[int] = sorted(windows)
+        self.horizon = self.windows[-1]
+        self.hired_status = hired_status
+        self.latest_day: Optional[np.datetime64] = None
+        self.dropped_rows = 0  # 가장 긴 구간보다 오래되었거나 채널/날짜가 없는 행
+
+        shape = (len(self._MEASURES), len(self.channels), self.horizon)
+        self._daily = np.zeros(shape)  # [지표, 채널, 날짜 % horizon]
+        self._totals = {window: np.zeros(shape[:2]) for window in self.windows}
+
+    def _slots(self, days: np.ndarray) -> np.ndarray:
+        return days.astype(np.int64) % self.horizon
+
+    def advance_to(self, new_latest):
+        """구간 기준일(최신 날짜)을 옮기고 구간에서 빠지는 날의 버킷을 합계에서 제외 (과거로는 이동하지 않음)"""
+        new_latest = np.datetime64(new_latest, 'D')
+        if self.latest_day is None:
+            self.latest_day = new_latest
+            return
+        step = int((new_latest - self.latest_day).astype(np.int64))
+        if step <= 0:
+            return
+        for window in self.windows:
+            # 구간 (latest - window, latest] → (new_latest - window, new_latest]
+            leaving = self.latest_day - window + 1 + np.arange(min(step, window))
+            self._totals[window] -= self._daily[:, :, self._slots(leaving)].sum(axis=2)
+        cleared = self.latest_day + 1 + np.arange(min(step, self.horizon))
+        self._daily[:, :, self._slots(cleared)] = 0
+        self.latest_day = new_latest
+
+    def add(self, df: pd.DataFrame, date_column: str = 'applied_date'):
+        """새로 들어온 지원자 행을 일 단위 버킷과 구간 합계에 반영"""
+        if df.empty:
+            return
+        days = df[date_column].to_numpy(dtype='datetime64[ns]').astype('datetime64[D]')
+        channel_codes = pd.Categorical(df['source'], categories=self.channels).codes.astype(np.int64)
+        valid = (channel_codes >= 0) & ~np.isnat(days)
+        if valid.any():
+            self.advance_to(days[valid].max())
+            age = (self.latest_day - days).astype(np.int64)
+            valid &= age < self.horizon
+        self.dropped_rows += int((~valid).sum())
+        if not valid.any():
+            return
+
+        days, channel_codes, age = days[valid], channel_codes[valid], age[valid]
+        values = np.stack([
+            np.ones(len(days)),
+            (df['status'].to_numpy()[valid] == self.hired_status).astype(np.float64),
+            df['resume_score'].to_numpy(dtype=np.float64)[valid],
+        ])
+        size = len(self.channels) * self.horizon
+        flat = channel_codes * self.horizon + self._slots(days)
+        for m in range(len(self._MEASURES)):
+            self._daily[m] += np.bincount(flat, weights=values[m], minlength=size).reshape(len(self.channels), -1)
+            for window in self.windows:
+                inside = age < window
+                self._totals[window][m] += np.bincount(channel_codes[inside], weights=values[m][inside],
+                                                       minlength=len(self.channels))
+
+    def metrics(self, window: int) -> pd.DataFrame:
+        """최근 window일 채널별 성과 (applicants, hired, cost, cpa, conversion_rate, avg_score)"""
+        if window not in self._totals:
+            raise ValueError(f"지원하지 않는 구간입니다: {window}일 (가능: {self.windows})")
+        applicants, hired, score_sum = self._totals[window]
+        if self.latest_day is None:
+            cost = np.zeros(len(self.channels))
+        else:
+            days = self.latest_day - window + 1 + np.arange(window)
+            cost = self.spend_table.daily_cost(self.channels, days).sum(axis=1)
+
+        return channel_metrics_frame(self.channels, applicants, hired, score_sum, cost)
+
+    def summary(self, window: int) -> Dict[str, float]:
+        """전체 채널 합계 (applicants, hired, cost, cpa)"""
+        return summarize_channels(self.metrics(window))
@@ -7,57 +7,61 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 import streamlit as st
 
 from config import COLORS, STATUS_COLORS, CHART_CONFIG
+from utils.aggregates import AggregateCube
+from utils.downsample import density_heatmap_trace, grid_sample, histogram_bins, histogram_trace
+from utils.event_log import StatusEventLog
+from utils.figure_cache import FigureCache, cached_figure, get_figure_cache, register_chart_template
+from utils.metrics import timed
 
 class ChartGenerator:
-    """차트 생성을 담당하는 클래스"""
+    """차트 생성을 담당하는 클래스
+
+    create_* 메서드 결과는 figure_cache에 직렬화해 두고 같은 입력이면 재사용합니다 (None이면 매번 생성).
+    """
     
-    def __init__(self):
+    def __init__(self, figure_cache: Optional[FigureCache] = None, use_cache: bool = True):
         self.colors = COLORS
         self.status_colors = STATUS_COLORS
         self.chart_config = CHART_CONFIG
+        self.template = register_chart_template()
+        if not use_cache:
+            figure_cache = None
+        elif figure_cache is None:
+            figure_cache = get_figure_cache()
+        self.figure_cache = figure_cache
+    
+    def _use_webgl(self, point_count: int) -> bool:
+        """점 개수가 기준을 넘으면 SVG 대신 WebGL(Scattergl)로 렌더링"""
+        return point_count > self.chart_config['scatter']['webgl_threshold']
     
+    @timed('chart')
+    @cached_figure
     def create_funnel_chart(self, funnel_df: pd.DataFrame, title: str = "채용 퍼널") -> go.Figure:
         """채용 퍼널 차트 생성"""
+        # 연결선/테두리/글자 스타일은 공통 템플릿에 등록되어 있음
         fig = go.Figure(go.Funnel(
             y=funnel_df['stage'],
             x=funnel_df['count'],
             texttemplate="%{label}<br>%{value:,}<br>(%{percentInitial})",
-            textfont={"size": 14, "color": "white"},
-            connector={
-                "line": {
-                    "color": self.colors['primary'], 
-                    "dash": "dot", 
-                    "width": 3
-                }
-            },
-            marker={
-                "color": self.chart_config['funnel']['colors'],
-                "line": {
-                    "color": "white",
-                    "width": 2
-                }
-            }
+            marker_color=self.chart_config['funnel']['colors']
         ))
         
         fig.update_layout(
-            title={
-                'text': title,
-                'x': 0.5,
-                'xanchor': 'center',
-                'font': {'size': 20, 'color': self.colors['dark']}
-            },
+            template=self.template,
+            title={'text': title, 'x': 0.5, 'xanchor': 'center', 'font': {'size': 20}},
             height=self.chart_config['funnel']['height'],
-            font=dict(size=12),
             showlegend=False,
             margin=dict(l=20, r=20, t=60, b=20)
         )
         
         return fig
     
+    @timed('chart')
+    @cached_figure
     def create_conversion_rate_chart(self, funnel_df: pd.DataFrame) -> go.Figure:
         """단계별 전환율 차트"""
         conversion_data = []
@@ -80,6 +84,7 @@ class ChartGenerator:
             x='rate',
             orientation='h',
             title="단계별 전환율 (%)",
+            template=self.template,
             color='rate',
             color_continuous_scale='Viridis',
             text='rate'
@@ -91,7 +96,6 @@ class ChartGenerator:
         )
         
         fig.update_layout(
-            height=400,
             xaxis_title="전환율 (%)",
             yaxis_title="단계",
             showlegend=False
@@ -99,6 +103,8 @@ class ChartGenerator:
         
         return fig
     
+    @timed('chart')
+    @cached_figure
     def create_channel_performance_chart(self, channel_df: pd.DataFrame) -> Dict[str, go.Figure]:
         """채널 성과 관련 차트들"""
         charts = {}
@@ -109,6 +115,7 @@ class ChartGenerator:
             x='channel',
             y='applicants',
             title="채널별 지원자 수",
+            template=self.template,
             color='applicants',
             color_continuous_scale='Blues',
             text='applicants'
@@ -117,7 +124,6 @@ class ChartGenerator:
             texttemplate='%{text:,}',
             textposition='outside'
         )
-        charts['applicants'].update_layout(height=400)
         
         # 2. 채널별 전환율
         charts['conversion'] = px.bar(
@@ -125,6 +131,7 @@ class ChartGenerator:
             x='channel',
             y='conversion_rate',
             title="채널별 전환율 (%)",
+            template=self.template,
             color='conversion_rate',
             color_continuous_scale='Reds',
             text='conversion_rate'
@@ -133,9 +140,9 @@ class ChartGenerator:
             texttemplate='%{text:.1f}%',
             textposition='outside'
         )
-        charts['conversion'].update_layout(height=400)
         
         # 3. 채널 효율성 매트릭스 (버블 차트)
+        webgl = self._use_webgl(len(channel_df))
         charts['efficiency'] = px.scatter(
             channel_df,
             x='conversion_rate',
@@ -144,13 +151,20 @@ class ChartGenerator:
             color='cpa',
             hover_name='channel',
             title="채널 효율성 매트릭스",
+            template=self.template,
             labels={
                 'conversion_rate': '전환율 (%)',
                 'applicants': '지원자 수',
                 'cpa': 'CPA (원)'
             },
-            size_max=60
+            size_max=60,
+            render_mode='webgl' if webgl else 'svg'
         )
+        if webgl:
+            # 툴팁은 채널명/전환율/지원자 수만 (점마다 보내는 hover 데이터 축소)
+            charts['efficiency'].update_traces(
+                hovertemplate="%{hovertext}<br>전환율 %{x:.1f}%<br>지원자 %{y:,}명<extra></extra>"
+            )
         charts['efficiency'].update_layout(height=500)
         
         # 4. 채널별 ROI 분석
@@ -166,6 +180,7 @@ class ChartGenerator:
             x='channel',
             y='roi',
             title="채널별 ROI (%)",
+            template=self.template,
             color='roi',
             color_continuous_scale='RdYlGn',
             text='roi'
@@ -174,10 +189,11 @@ class ChartGenerator:
             texttemplate='%{text:.1f}%',
             textposition='outside'
         )
-        charts['roi'].update_layout(height=400)
         
         return charts
     
+    @timed('chart')
+    @cached_figure
     def create_monthly_trend_chart(self, monthly_df: pd.DataFrame) -> go.Figure:
         """월별 트렌드 차트"""
         fig = go.Figure()
@@ -210,9 +226,9 @@ class ChartGenerator:
         
         fig.update_layout(
             title="월별 지원자 트렌드",
+            template=self.template,
             xaxis_title="월",
             yaxis_title="지원자 수",
-            height=400,
             hovermode='x unified',
             legend=dict(
                 orientation="h",
@@ -225,6 +241,8 @@ class ChartGenerator:
         
         return fig
     
+    @timed('chart')
+    @cached_figure
     def create_regional_distribution_chart(self, region_df: pd.DataFrame) -> Dict[str, go.Figure]:
         """지역별 분포 차트들"""
         charts = {}
@@ -235,10 +253,9 @@ class ChartGenerator:
             values='count',
             names='region',
             title="지역별 지원자 분포",
+            template=self.template,
             color_discrete_sequence=px.colors.qualitative.Set3
         )
-        charts['pie'].update_traces(textposition='inside', textinfo='percent+label')
-        charts['pie'].update_layout(height=400)
         
         # 2. 막대 차트
         charts['bar'] = px.bar(
@@ -247,6 +264,7 @@ class ChartGenerator:
             y='region',
             orientation='h',
             title="지역별 지원자 수",
+            template=self.template,
             color='count',
             color_continuous_scale='Viridis',
             text='count'
@@ -255,53 +273,70 @@ class ChartGenerator:
             texttemplate='%{text:,}명',
             textposition='outside'
         )
-        charts['bar'].update_layout(height=400)
         
         return charts
     
+    @timed('chart')
+    @cached_figure
     def create_score_distribution_chart(self, candidates_df: pd.DataFrame) -> go.Figure:
-        """이력서 점수 분포 히스토그램"""
-        fig = px.histogram(
-            candidates_df,
-            x='resume_score',
-            nbins=20,
+        """이력서 점수 분포 히스토그램 (구간별 개수만 전송)"""
+        scores = candidates_df['resume_score'].to_numpy(dtype=np.float64)
+        edges, counts = histogram_bins(scores, bins=self.chart_config['histogram']['bins'])
+        
+        fig = go.Figure(histogram_trace(edges, counts, marker_color=self.colors['primary']))
+        fig.update_layout(
             title="이력서 점수 분포",
-            color_discrete_sequence=[self.colors['primary']],
-            labels={'resume_score': '이력서 점수', 'count': '지원자 수'}
+            template=self.template,
+            xaxis_title="이력서 점수",
+            yaxis_title="지원자 수",
+            bargap=0
         )
         
         # 평균선 추가
-        mean_score = candidates_df['resume_score'].mean()
+        mean_score = np.nanmean(scores) if len(scores) else 0.0
         fig.add_vline(
             x=mean_score,
             line_dash="dash",
             line_color="red",
             annotation_text=f"평균: {mean_score:.1f}점"
         )
-        
-        fig.update_layout(height=400)
         return fig
     
-    def create_experience_distribution_chart(self, candidates_df: pd.DataFrame) -> go.Figure:
-        """경력별 분포 차트"""
-        experience_counts = candidates_df['experience'].value_counts()
+    @timed('chart')
+    @cached_figure
+    def create_experience_distribution_chart(self, candidates_df: pd.DataFrame,
+                                             cube: Optional[AggregateCube] = None,
+                                             selections: Optional[Dict[str, Iterable[Any]]] = None) -> go.Figure:
+        """경력별 분포 차트 (집계 큐브가 있으면 행을 다시 세지 않고 큐브에서 조회)"""
+        if cube is not None:
+            experience_counts = cube.counts('experience', selections)
+        else:
+            experience_counts = candidates_df['experience'].value_counts()
         
         fig = px.bar(
             x=experience_counts.index,
             y=experience_counts.values,
             title="경력별 지원자 분포",
+            template=self.template,
             labels={'x': '경력', 'y': '지원자 수'},
             color=experience_counts.values,
             color_continuous_scale='Blues'
         )
         
         fig.update_traces(text=experience_counts.values, textposition='outside')
-        fig.update_layout(height=400)
         return fig
     
-    def create_status_distribution_chart(self, candidates_df: pd.DataFrame) -> go.Figure:
+    @timed('chart')
+    @cached_figure
+    def create_status_distribution_chart(self, candidates_df: pd.DataFrame,
+                                         cube: Optional[AggregateCube] = None,
+                                         selections: Optional[Dict[str, Iterable[Any]]] = None) -> go.Figure:
         """상태별 분포 도넛 차트"""
-        status_counts = candidates_df['status'].value_counts()
+        if cube is not None:
+            status_counts = cube.counts('status', selections)
+            status_counts = status_counts[status_counts > 0]
+        else:
+            status_counts = candidates_df['status'].value_counts()
         
         # 상태별 색상 매핑
         colors = [self.status_colors.get(status, '#6b7280') for status in status_counts.index]
@@ -313,60 +348,84 @@ class ChartGenerator:
             marker_colors=colors
         )])
         
-        fig.update_traces(
-            textposition='inside',
-            textinfo='percent+label',
-            textfont_size=12
-        )
+        fig.update_traces(textfont_size=12)
         
         fig.update_layout(
             title="지원자 상태 분포",
-            height=400,
+            template=self.template,
             showlegend=True,
             legend=dict(orientation="v", yanchor="middle", y=0.5)
         )
         
         return fig
     
-    def create_hiring_timeline_chart(self, candidates_df: pd.DataFrame) -> go.Figure:
-        """채용 타임라인 차트"""
+    @timed('chart')
+    @cached_figure
+    def create_hiring_timeline_chart(self, candidates_df: pd.DataFrame,
+                                     event_log: Optional[StatusEventLog] = None) -> go.Figure:
+        """채용 타임라인 차트 (채용 기간 = 상태 이벤트 로그의 지원 → 합격 리드타임)"""
         # 합격자들의 채용 기간 계산
-        hired_df = candidates_df[candidates_df['status'] == '합격'].copy()
+        hired_df = candidates_df[candidates_df['status'] == '합격']
+        if event_log is not None and not hired_df.empty:
+            lead_days = event_log.lead_times('합격').reindex(hired_df['id']).to_numpy()
+            hired_df = hired_df.assign(hire_duration=lead_days.round(1))[~np.isnan(lead_days)]
         
-        if hired_df.empty:
+        if hired_df.empty or event_log is None:
             # 빈 차트 반환
             fig = go.Figure()
             fig.add_annotation(
-                text="합격자 데이터가 없습니다",
+                text="합격자 데이터가 없습니다" if event_log is not None else "상태 변경 이력이 없습니다",
                 xref="paper", yref="paper",
                 x=0.5, y=0.5, xanchor='center', yanchor='middle',
                 showarrow=False, font=dict(size=16)
             )
-            fig.update_layout(height=400, title="채용 타임라인")
+            fig.update_layout(template=self.template, title="채용 타임라인")
             return fig
         
-        # 가상의 채용 완료일 생성 (지원일 + 랜덤 기간)
-        import random
-        hired_df['hire_duration'] = [random.randint(14, 45) for _ in range(len(hired_df))]
+        # 점이 아주 많으면 밀도 히트맵, 많으면 격자 칸별 대표 점만 표시
+        scatter_config = self.chart_config['scatter']
+        title = "채용 타임라인 (지원일 vs 채용기간)"
+        if len(hired_df) > scatter_config['density_threshold']:
+            fig = go.Figure(density_heatmap_trace(
+                hired_df['applied_date'], hired_df['hire_duration'], bins=scatter_config['density_bins']
+            ))
+            fig.update_layout(
+                title=f"{title} - 밀도 ({len(hired_df):,}명)",
+                template=self.template,
+                xaxis_title="지원일",
+                yaxis_title="채용 기간 (일)"
+            )
+            return fig
+        if len(hired_df) > scatter_config['max_points']:
+            sampled = grid_sample(hired_df['applied_date'], hired_df['hire_duration'], scatter_config['max_points'])
+            title = f"{title} - 대표 {len(sampled):,}명 / 전체 {len(hired_df):,}명"
+            hired_df = hired_df.iloc[sampled]
         
+        webgl = self._use_webgl(len(hired_df))
         fig = px.scatter(
             hired_df,
             x='applied_date',
             y='hire_duration',
             color='position',
             size='resume_score',
-            hover_data=['name', 'experience'],
-            title="채용 타임라인 (지원일 vs 채용기간)",
+            hover_name='name' if webgl else None,
+            hover_data=None if webgl else ['name', 'experience'],
+            title=title,
+            template=self.template,
             labels={
                 'applied_date': '지원일',
                 'hire_duration': '채용 기간 (일)',
                 'position': '직무'
-            }
+            },
+            render_mode='webgl' if webgl else 'svg'
         )
-        
-        fig.update_layout(height=400)
+        if webgl:
+            # 툴팁은 이름/지원일/채용 기간만 (경력·점수 등 점별 hover 데이터 제외)
+            fig.update_traces(hovertemplate="%{hovertext}<br>%{x|%Y-%m-%d} · %{y}일<extra></extra>")
         return fig
     
+    @timed('chart')
+    @cached_figure
     def create_performance_radar_chart(self, channel_df: pd.DataFrame, selected_channels: List[str] = None) -> go.Figure:
         """채널 성과 레이더 차트"""
         if selected_channels is None:
@@ -411,26 +470,34 @@ class ChartGenerator:
                 )
             ),
             title="채널별 성과 비교 (레이더 차트)",
-            height=400,
+            template=self.template,
             showlegend=True
         )
         
         return fig
     
-    def create_cohort_analysis_chart(self, candidates_df: pd.DataFrame) -> go.Figure:
+    @timed('chart')
+    @cached_figure
+    def create_cohort_analysis_chart(self, candidates_df: pd.DataFrame,
+                                     cube: Optional[AggregateCube] = None,
+                                     selections: Optional[Dict[str, Iterable[Any]]] = None) -> go.Figure:
         """코호트 분석 차트 (월별 지원자 현황)"""
-        # 월별로 그룹화
-        candidates_df['apply_month'] = candidates_df['applied_date'].dt.to_period('M')
-        cohort_data = candidates_df.groupby(['apply_month', 'status']).size().unstack(fill_value=0)
+        if cube is not None:
+            # 지원 월 × 상태 집계를 큐브에서 조회
+            cohort_data = cube.counts(['month', 'status'], selections)
+            cohort_data = cohort_data.loc[:, cohort_data.sum() > 0]
+        else:
+            # 월별로 그룹화 (입력 프레임에 컬럼을 추가하지 않고 키 Series로 묶기)
+            apply_month = candidates_df['applied_date'].dt.to_period('M').rename('apply_month')
+            cohort_data = candidates_df.groupby([apply_month, candidates_df['status']]).size().unstack(fill_value=0)
         
         # 히트맵 생성
         fig = px.imshow(
             cohort_data.T,
             title="월별 지원자 상태 분포 (코호트 분석)",
+            template=self.template,
             labels=dict(x="지원 월", y="상태", color="지원자 수"),
             aspect="auto",
             color_continuous_scale='Blues'
         )
-        
-        fig.update_layout(height=400)
         return fig
@@ -1,50 +1,89 @@
 """
 채용 대시보드 데이터 생성 및 관리 모듈
+
+모든 난수는 시드에서 만든 SeedSequence의 자식 스트림에서 뽑습니다 (전역 random 모듈을 쓰지 않음).
+- 용도별 스트림: 이름 풀, 지원자, 상태 이벤트, 월별 트렌드, 지역 분포가 서로 독립
+- 지원자 데이터는 shard_rows 행씩 샤드로 나누고 샤드마다 자식 스트림을 하나씩 쓰므로,
+  샤드를 프로세스 풀에서 병렬로 만들어도 작업 프로세스 수와 관계없이 같은 결과가 나옵니다.
 """
 
+import argparse
+import multiprocessing
+import os
 import pandas as pd
 import numpy as np
 import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Tuple, Dict, List
-import streamlit as st
+from typing import Tuple, Dict, List, Optional, Iterator
 
 # 설정 파일에서 상수 가져오기
 from config import (
     JOB_CATEGORIES, RECRUITMENT_CHANNELS, REGIONS, 
-    EXPERIENCE_LEVELS, RECRUITMENT_STAGES
+    EXPERIENCE_LEVELS, RECRUITMENT_STAGES, EDUCATION_LEVELS, PREVIOUS_COMPANIES,
+    DATA_GENERATOR_CONFIG
 )
+from utils.cache import shared_cache
+from utils.channel_roi import ChannelROI
+from utils.funnel import FunnelEngine
+from utils.metrics import timed
+from utils.schema import ALL_POSITIONS, CANDIDATE_CATEGORIES, apply_candidate_schema
+
+# 용도별 자식 스트림 번호 (순서를 바꾸면 같은 시드의 데이터가 달라짐)
+STREAMS = ('names', 'candidates', 'status_events', 'monthly_trend', 'regional', 'sample_data')
+
+def _take(labels: List[str], indices: np.ndarray) -> pd.api.extensions.ExtensionArray:
+    """라벨 목록에서 인덱스 배열로 값을 가져오기 (-1은 결측값)"""
+    return pd.Series(labels).array.take(indices, allow_fill=True)
+
+def _categorical(column: str, codes: np.ndarray) -> pd.Categorical:
+    """스키마 어휘의 정수 코드로 범주형 컬럼 생성 (문자열을 만들지 않음)"""
+    return pd.Categorical.from_codes(codes, dtype=CANDIDATE_CATEGORIES[column])
+
+def seed_stream(seed: int, stream: str) -> np.random.SeedSequence:
+    """시드의 용도별 자식 스트림
+
+    SeedSequence(seed).spawn(len(STREAMS))[i]와 같은 값이지만, spawn은 호출할 때마다 다음 자식을 주므로
+    spawn_key를 직접 지정해 몇 번을 호출해도 같은 스트림이 나오게 합니다.
+    """
+    return np.random.SeedSequence(seed, spawn_key=(STREAMS.index(stream),))
+
+def _build_shard(generator: 'DataGenerator', num_candidates: int, seed_seq: np.random.SeedSequence,
+                 start_index: int, now: datetime) -> pd.DataFrame:
+    """샤드 하나 생성 (프로세스 풀 작업 함수, 피클 가능하도록 모듈 수준에 둠)"""
+    return generator._build_candidates_frame(num_candidates, np.random.default_rng(seed_seq), start_index, now)
 
 class DataGenerator:
     """채용 데이터를 생성하고 관리하는 클래스"""
     
-    def __init__(self):
-        self.names = self._generate_korean_names()
+    def __init__(self, seed: Optional[int] = None):
+        """seed: 이름 풀과, 메서드에 시드를 주지 않았을 때 쓸 기본 시드 (None이면 DATA_GENERATOR_CONFIG['seed'])
+
+        캐시되는 메서드는 인스턴스(시드, 이름 풀)도 캐시 키에 포함하므로 시드가 다른 생성기끼리 결과를 섞지 않습니다.
+        """
+        self.seed = DATA_GENERATOR_CONFIG['seed'] if seed is None else seed
+        self.names = self._generate_korean_names(np.random.default_rng(seed_stream(self.seed, 'names')))
         self.companies = self._get_company_list()
         self.skills = self._get_skills_by_position()
+    
+    def _resolve_seed(self, seed: Optional[int]) -> int:
+        return self.seed if seed is None else seed
         
-    def _generate_korean_names(self) -> List[str]:
+    def _generate_korean_names(self, rng: np.random.Generator) -> List[str]:
         """한국 이름 생성"""
         surnames = ['김', '이', '박', '최', '정', '강', '조', '윤', '장', '임', '한', '오', '서', '신', '권', '황', '안', '송', '류', '전']
         given_names = ['민수', '지은', '준호', '서영', '하늘', '민아', '성진', '유리', '지수', '도현', 
                       '민철', '수진', '현우', '예린', '태현', '소영', '도윤', '채영', '민성', '지훈',
                       '윤서', '준표', '소희', '태영', '은지', '승현', '다은', '민호', '수빈', '재현']
         
-        names = []
-        for _ in range(100):
-            surname = random.choice(surnames)
-            given_name = random.choice(given_names)
-            names.append(f"{surname}{given_name}")
-        return names
+        surname_idx = rng.integers(0, len(surnames), 100)
+        given_idx = rng.integers(0, len(given_names), 100)
+        return [f"{surnames[s]}{given_names[g]}" for s, g in zip(surname_idx, given_idx)]
     
     def _get_company_list(self) -> List[str]:
         """이전 직장 리스트"""
-        return [
-            '삼성전자', 'LG전자', 'SK하이닉스', '현대자동차', 'KT',
-            '네이버', '카카오', '쿠팡', '배달의민족', '토스',
-            '라인', '넥슨', 'NHN', '우아한형제들', '마켓컬리',
-            '당근마켓', '직방', '야놀자', '무신사', '29CM'
-        ]
+        return [company for company in PREVIOUS_COMPANIES if company != '신입']
     
     def _get_skills_by_position(self) -> Dict[str, List[str]]:
         """직무별 스킬 매핑"""
@@ -61,9 +100,195 @@ class DataGenerator:
             'QA 엔지니어': ['Selenium', 'Postman', 'JIRA', 'TestRail', 'Python', 'Java', 'Git']
         }
     
-    @st.cache_data(ttl=3600)  # 1시간 캐시
-    def generate_candidates_data(_self, num_candidates: int = 100) -> pd.DataFrame:
-        """지원자 데이터 생성"""
+    @timed('generate', count_rows=True)
+    @shared_cache(ttl=3600, dataset='candidates')  # 1시간 캐시 (디스크/Redis 공유, 새 버전 공개 시 무효화)
+    def generate_candidates_data(self, num_candidates: int = 100, seed: Optional[int] = None,
+                                 engine: str = 'numpy', now: Optional[datetime] = None,
+                                 _workers: Optional[int] = None) -> pd.DataFrame:
+        """지원자 데이터 생성
+
+        engine='numpy'는 모든 필드를 NumPy 배열 단위로 생성하고,
+        engine='python'은 행 단위 루프로 생성하는 기존 방식입니다 (벤치마크 비교용).
+        numpy 엔진은 샤드 단위로 생성하며 _workers(None이면 설정값)는 결과에 영향을 주지 않으므로 캐시 키에서 뺍니다.
+        now를 주면 지원일/면접일도 고정되어 실행할 때마다 같은 데이터가 나옵니다.
+        """
+        if engine == 'python':
+            return self._build_candidates_records(num_candidates, seed, now)
+        if engine != 'numpy':
+            raise ValueError(f"지원하지 않는 엔진입니다: {engine}")
+        
+        shards = list(self.iter_candidates_chunks(num_candidates, seed=seed, workers=_workers, now=now))
+        if not shards:  # 0명: 스키마만 있는 빈 프레임
+            return self._build_candidates_frame(0, np.random.default_rng(seed_stream(self._resolve_seed(seed), 'candidates')),
+                                                now=now)
+        if len(shards) == 1:
+            return shards[0]
+        return pd.concat(shards, ignore_index=True)
+    
+    def iter_candidates_chunks(self, num_candidates: int, chunk_size: Optional[int] = None,
+                               seed: Optional[int] = None, workers: Optional[int] = None,
+                               now: Optional[datetime] = None) -> Iterator[pd.DataFrame]:
+        """지원자 데이터를 chunk_size(샤드) 행 단위로 나누어 순서대로 생성 (전체 프레임을 메모리에 두지 않음)
+
+        샤드 i는 지원자 스트림의 i번째 자식 스트림으로 만들므로 (seed, num_candidates, chunk_size)가 같으면
+        직렬/병렬과 작업 프로세스 수에 관계없이 같은 데이터가 나옵니다.
+        병렬일 때도 작업 프로세스 수의 2배까지만 샤드를 미리 만들어 메모리 사용량을 제한합니다.
+        """
+        chunk_size = chunk_size or DATA_GENERATOR_CONFIG['shard_rows']
+        if chunk_size <= 0:
+            raise ValueError("chunk_size는 1 이상이어야 합니다")
+        
+        starts = range(0, num_candidates, chunk_size)
+        streams = seed_stream(self._resolve_seed(seed), 'candidates').spawn(len(starts))
+        tasks = [(min(chunk_size, num_candidates - start), seq, start) for start, seq in zip(starts, streams)]
+        now = now or datetime.now()
+        
+        workers = workers or DATA_GENERATOR_CONFIG['workers'] or os.cpu_count() or 1
+        workers = min(workers, len(tasks))
+        if workers <= 1 or num_candidates < DATA_GENERATOR_CONFIG['parallel_min_rows']:
+            for size, seq, start in tasks:
+                yield _build_shard(self, size, seq, start, now)
+            return
+        
+        context = multiprocessing.get_context(DATA_GENERATOR_CONFIG['start_method'])
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            pending = deque()
+            for size, seq, start in tasks:
+                pending.append(executor.submit(_build_shard, self, size, seq, start, now))
+                if len(pending) >= workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+    
+    def write_candidates_parquet(self, output_dir: str, num_candidates: int, chunk_size: Optional[int] = None,
+                                 seed: Optional[int] = None, workers: Optional[int] = None) -> int:
+        """지원자 데이터를 지원 월(applied_month=YYYY-MM) 기준으로 파티션된 Parquet 파일로 저장
+        
+        청크마다 파티션별 파일을 하나씩 기록하므로 메모리 사용량은 chunk_size에만 비례합니다.
+        기록한 파일 수를 반환합니다.
+        """
+        files_written = 0
+        chunks = self.iter_candidates_chunks(num_candidates, chunk_size, seed, workers)
+        for chunk_no, chunk in enumerate(chunks):
+            months = chunk['applied_date'].to_numpy().astype('datetime64[M]')
+            for month in np.unique(months):
+                partition_dir = os.path.join(output_dir, f"applied_month={str(month)}")
+                os.makedirs(partition_dir, exist_ok=True)
+                chunk[months == month].to_parquet(
+                    os.path.join(partition_dir, f"part-{chunk_no:05d}.parquet"), index=False
+                )
+                files_written += 1
+        return files_written
+    
+    def _build_candidates_frame(self, num_candidates: int, rng: np.random.Generator,
+                                start_index: int = 0, now: Optional[datetime] = None) -> pd.DataFrame:
+        """지원자 데이터를 컬럼 단위(NumPy 배열)로 생성"""
+        n = num_candidates
+        now = now or datetime.now()
+        
+        all_positions = ALL_POSITIONS  # 범주형 코드 순서와 동일
+        name_idx = rng.integers(0, len(self.names), n)
+        position_idx = rng.integers(0, len(all_positions), n)
+        experience_idx = rng.integers(0, len(EXPERIENCE_LEVELS), n)
+        days_ago = rng.integers(1, 181, n)
+        
+        # 직무에 따른 스킬 할당 (직무별로 무작위 순열의 앞 3개를 뽑아 전역 라벨 인덱스로 변환)
+        skill_idx = np.empty(n, dtype=np.int64)
+        skill_labels: List[str] = []
+        for p, position in enumerate(all_positions):
+            rows = np.flatnonzero(position_idx == p)
+            if rows.size == 0:
+                continue
+            position_skills = self.skills.get(position, ['기본 스킬'])
+            k = len(position_skills)
+            picked = np.argsort(rng.random((rows.size, k)), axis=1)[:, :min(3, k)]
+            codes = (picked * (k ** np.arange(picked.shape[1]))).sum(axis=1)
+            uniques, inverse = np.unique(codes, return_inverse=True)
+            skill_idx[rows] = len(skill_labels) + inverse
+            skill_labels.extend(
+                ', '.join(position_skills[c // k ** j % k] for j in range(picked.shape[1])) for c in uniques
+            )
+        
+        # 경력에 따른 가중치가 있는 점수 생성
+        exp_weight = np.array([{'신입': 0.8, '1년': 0.85, '2년': 0.9, '3년': 0.95}.get(e, 1.0) for e in EXPERIENCE_LEVELS])
+        base_score = rng.normal(75, 15, n)
+        resume_score = np.clip((base_score * exp_weight[experience_idx]).astype(np.int64), 50, 98)
+        
+        # 상태 가중치 (최근 지원자일수록 초기 단계)
+        status_weights = np.array([
+            [0.5, 0.3, 0.1, 0.05, 0.03, 0.02],
+            [0.2, 0.3, 0.25, 0.15, 0.07, 0.03],
+            [0.1, 0.15, 0.2, 0.25, 0.2, 0.1]
+        ])
+        cum_weights = np.cumsum(status_weights, axis=1)
+        cum_weights[:, -1] = 1.0
+        bucket = np.where(days_ago < 7, 0, np.where(days_ago < 30, 1, 2))
+        status_idx = (rng.random(n)[:, None] >= cum_weights[bucket]).sum(axis=1)
+        
+        applied_date = np.datetime64(now, 'us') - days_ago.astype('timedelta64[D]')
+        
+        interview_mask = np.isin(status_idx, [1, 2, 3])  # 1차/2차/최종 면접
+        interview_offset = rng.integers(7, 22, n).astype('timedelta64[D]')
+        interview_date = np.where(interview_mask, applied_date + interview_offset, np.datetime64('NaT', 'us'))
+        
+        # 이름 단위 문자열은 미리 포맷한 뒤 인덱스로 가져오기
+        lowered = [nm.lower() for nm in self.names]
+        has_portfolio = np.isin(all_positions, ['프론트엔드 개발자', 'UI/UX 디자이너'])[position_idx]
+        has_github = np.array(['개발자' in p or '엔지니어' in p for p in all_positions])[position_idx]
+        
+        previous_company_idx = np.where(experience_idx == 0, PREVIOUS_COMPANIES.index('신입'),
+                                        rng.integers(0, len(self.companies), n))
+        
+        # 행마다 달라지는 문자열(ID, 전화번호, 메모)은 조각을 조합해 한 번의 연결로 생성
+        serial = np.arange(start_index + 1, start_index + n + 1)
+        id_heads = np.array(['REC'] + [f'REC{h}' for h in range(1, serial[-1] // 10000 + 1)] if n else ['REC'], dtype=object)
+        id_tails = np.array([f'{v:04d}' for v in range(10000)], dtype=object)
+        ids = id_heads[serial // 10000] + id_tails[serial % 10000]
+        
+        phone_heads = np.array([f'010-{v}' for v in range(10000)], dtype=object)
+        phone_tails = np.array([f'-{v}' for v in range(10000)], dtype=object)
+        phone = phone_heads[rng.integers(1000, 10000, n)] + phone_tails[rng.integers(1000, 10000, n)]
+        
+        combo = (name_idx * len(all_positions) + position_idx) * len(EXPERIENCE_LEVELS) + experience_idx
+        combo_uniques, combo_inverse = np.unique(combo, return_inverse=True)
+        note_heads = np.array([
+            f'{self.names[c // len(EXPERIENCE_LEVELS) // len(all_positions)]}님은 '
+            f'{all_positions[c // len(EXPERIENCE_LEVELS) % len(all_positions)]} 경력 '
+            f'{EXPERIENCE_LEVELS[c % len(EXPERIENCE_LEVELS)]}으로 '
+            for c in combo_uniques
+        ], dtype=object)
+        note_tails = np.array([f'{s} 스킬을 보유하고 있습니다.' for s in skill_labels], dtype=object)
+        notes = note_heads[combo_inverse] + note_tails[skill_idx]
+        
+        return pd.DataFrame({
+            'id': ids,
+            'name': _take(self.names, name_idx),
+            'position': _categorical('position', position_idx),
+            'status': _categorical('status', status_idx + 1),  # '지원접수' 제외
+            'experience': _categorical('experience', experience_idx),
+            'location': _categorical('location', rng.integers(0, len(REGIONS), n)),
+            'resume_score': resume_score,
+            'rating': np.round(rng.uniform(3.0, 5.0, n), 1),
+            'applied_date': applied_date,
+            'email': _take([f"{nm.replace(' ', '')}@email.com" for nm in lowered], name_idx),
+            'phone': phone,
+            'salary_expectation': rng.integers(3000, 8001, n),  # 만원 단위
+            'skills': _take(skill_labels, skill_idx),
+            'source': _categorical('source', rng.integers(0, len(RECRUITMENT_CHANNELS), n)),
+            'previous_company': _categorical('previous_company', previous_company_idx),
+            'education': _categorical('education', rng.integers(0, len(EDUCATION_LEVELS), n)),
+            'portfolio_url': _take([f'https://portfolio.{nm}.com' for nm in lowered], np.where(has_portfolio, name_idx, -1)),
+            'github_url': _take([f'https://github.com/{nm}' for nm in lowered], np.where(has_github, name_idx, -1)),
+            'linkedin_url': _take([f'https://linkedin.com/in/{nm}' for nm in lowered], name_idx),
+            'interview_date': interview_date,
+            'notes': notes
+        })
+    
+    def _build_candidates_records(self, num_candidates: int, seed: Optional[int] = None,
+                                  now: Optional[datetime] = None) -> pd.DataFrame:
+        """지원자 데이터를 행 단위 루프로 생성 (기존 방식, 지원자 스트림으로 시드한 random.Random 사용)"""
+        rng = random.Random(int(seed_stream(self._resolve_seed(seed), 'candidates').generate_state(1)[0]))
+        now = now or datetime.now()
         
         # 모든 직무 리스트 생성
         all_positions = []
@@ -73,24 +298,24 @@ class DataGenerator:
         candidates_data = []
         
         for i in range(num_candidates):
-            name = random.choice(_self.names)
-            position = random.choice(all_positions)
+            name = rng.choice(self.names)
+            position = rng.choice(all_positions)
             
             # 직무에 따른 스킬 할당
-            position_skills = _self.skills.get(position, ['기본 스킬'])
-            selected_skills = random.sample(position_skills, min(3, len(position_skills)))
+            position_skills = self.skills.get(position, ['기본 스킬'])
+            selected_skills = rng.sample(position_skills, min(3, len(position_skills)))
             
             # 지원일 생성 (최근 6개월)
-            applied_date = datetime.now() - timedelta(days=random.randint(1, 180))
+            applied_date = now - timedelta(days=rng.randint(1, 180))
             
             # 경력에 따른 가중치가 있는 점수 생성
-            experience = random.choice(EXPERIENCE_LEVELS)
+            experience = rng.choice(EXPERIENCE_LEVELS)
             exp_weight = {'신입': 0.8, '1년': 0.85, '2년': 0.9, '3년': 0.95}.get(experience, 1.0)
-            base_score = random.normalvariate(75, 15)
+            base_score = rng.normalvariate(75, 15)
             resume_score = max(50, min(98, int(base_score * exp_weight)))
             
             # 상태 가중치 (최근 지원자일수록 초기 단계)
-            days_ago = (datetime.now() - applied_date).days
+            days_ago = (now - applied_date).days
             if days_ago < 7:
                 status_weights = [0.5, 0.3, 0.1, 0.05, 0.03, 0.02]
             elif days_ago < 30:
@@ -98,7 +323,7 @@ class DataGenerator:
             else:
                 status_weights = [0.1, 0.15, 0.2, 0.25, 0.2, 0.1]
             
-            status = random.choices(RECRUITMENT_STAGES[1:], weights=status_weights)[0]
+            status = rng.choices(RECRUITMENT_STAGES[1:], weights=status_weights)[0]
             
             candidate = {
                 'id': f'REC{i+1:04d}',
@@ -106,80 +331,51 @@ class DataGenerator:
                 'position': position,
                 'status': status,
                 'experience': experience,
-                'location': random.choice(REGIONS),
+                'location': rng.choice(REGIONS),
                 'resume_score': resume_score,
-                'rating': round(random.uniform(3.0, 5.0), 1),
+                'rating': round(rng.uniform(3.0, 5.0), 1),
                 'applied_date': applied_date,
                 'email': f'{name.lower().replace(" ", "")}@email.com',
-                'phone': f'010-{random.randint(1000,9999)}-{random.randint(1000,9999)}',
-                'salary_expectation': f'{random.randint(3000, 8000)}만원',
+                'phone': f'010-{rng.randint(1000,9999)}-{rng.randint(1000,9999)}',
+                'salary_expectation': rng.randint(3000, 8000),
                 'skills': ', '.join(selected_skills),
-                'source': random.choice(RECRUITMENT_CHANNELS),
-                'previous_company': random.choice(_self.companies) if experience != '신입' else '신입',
-                'education': random.choice(['고졸', '전문대졸', '대졸', '석사', '박사']),
+                'source': rng.choice(RECRUITMENT_CHANNELS),
+                'previous_company': rng.choice(self.companies) if experience != '신입' else '신입',
+                'education': rng.choice(EDUCATION_LEVELS),
                 'portfolio_url': f'https://portfolio.{name.lower()}.com' if position in ['프론트엔드 개발자', 'UI/UX 디자이너'] else None,
                 'github_url': f'https://github.com/{name.lower()}' if '개발자' in position or '엔지니어' in position else None,
                 'linkedin_url': f'https://linkedin.com/in/{name.lower()}',
-                'interview_date': applied_date + timedelta(days=random.randint(7, 21)) if status in ['1차 면접', '2차 면접', '최종 면접'] else None,
+                'interview_date': applied_date + timedelta(days=rng.randint(7, 21)) if status in ['1차 면접', '2차 면접', '최종 면접'] else None,
                 'notes': f'{name}님은 {position} 경력 {experience}으로 {", ".join(selected_skills)} 스킬을 보유하고 있습니다.'
             }
             
             candidates_data.append(candidate)
         
-        return pd.DataFrame(candidates_data)
+        return apply_candidate_schema(pd.DataFrame(candidates_data))
     
-    @st.cache_data(ttl=3600)
-    def generate_channel_performance_data(_self) -> pd.DataFrame:
-        """채널 성과 데이터 생성"""
-        channel_data = []
-        
-        # 채널별 특성을 반영한 데이터 생성
-        channel_configs = {
-            '사람인': {'base_applicants': 1200, 'conversion_rate': 4.5, 'cost_per_click': 800},
-            '잡코리아': {'base_applicants': 900, 'conversion_rate': 5.2, 'cost_per_click': 750},
-            '링크드인': {'base_applicants': 300, 'conversion_rate': 8.5, 'cost_per_click': 1200},
-            '원티드': {'base_applicants': 600, 'conversion_rate': 6.8, 'cost_per_click': 950},
-            '직접지원': {'base_applicants': 200, 'conversion_rate': 12.0, 'cost_per_click': 0},
-            '추천': {'base_applicants': 80, 'conversion_rate': 15.5, 'cost_per_click': 0},
-            'GitHub Jobs': {'base_applicants': 150, 'conversion_rate': 9.2, 'cost_per_click': 600},
-            '프로그래머스': {'base_applicants': 180, 'conversion_rate': 7.8, 'cost_per_click': 700}
-        }
-        
-        for channel, config in channel_configs.items():
-            # 계절성과 랜덤 요소를 반영한 지원자 수
-            seasonal_factor = random.uniform(0.8, 1.2)
-            applicants = int(config['base_applicants'] * seasonal_factor)
-            
-            # 전환율에 약간의 변동성 추가
-            conversion_rate = config['conversion_rate'] * random.uniform(0.9, 1.1)
-            hired = int(applicants * conversion_rate / 100)
-            
-            # 비용 계산
-            if config['cost_per_click'] > 0:
-                total_cost = applicants * config['cost_per_click']
-                cpa = total_cost / hired if hired > 0 else 0
-            else:
-                total_cost = 0
-                cpa = 0
-            
-            channel_data.append({
-                'channel': channel,
-                'applicants': applicants,
-                'hired': hired,
-                'cost': total_cost,
-                'conversion_rate': round(conversion_rate, 2),
-                'cpa': round(cpa, 0),
-                'clicks': applicants * random.randint(3, 8),  # 지원자 당 평균 클릭 수
-                'ctr': round(random.uniform(2.0, 8.0), 2),  # 클릭율
-                'quality_score': round(random.uniform(3.5, 5.0), 1)  # 채널 품질 점수
-            })
+    @shared_cache(ttl=3600, dataset='candidates')
+    def generate_channel_performance_data(self, candidates_df: Optional[pd.DataFrame] = None, window: int = 30,
+                                          num_candidates: int = 3500, seed: Optional[int] = None,
+                                          now: Optional[datetime] = None) -> pd.DataFrame:
+        """채널 성과 데이터 생성 (지원자 데이터와 광고비 테이블에서 최근 window일 성과 계산)
+
+        구간 기준일은 now이고, 없으면 가장 최근 지원일입니다 (현재 시각 기준이면 고정된 now로 만든 데이터가 구간 밖으로 빠짐).
+        """
+        if candidates_df is None:
+            candidates_df = self.generate_candidates_data(num_candidates, seed, now=now)
         
-        return pd.DataFrame(channel_data)
+        channel_roi = ChannelROI(RECRUITMENT_CHANNELS)
+        channel_roi.add(candidates_df)
+        as_of = now if now is not None else candidates_df['applied_date'].max()
+        if not pd.isna(as_of):
+            channel_roi.advance_to(as_of)
+        return channel_roi.metrics(window)
     
-    @st.cache_data(ttl=3600)
-    def generate_monthly_trend_data(_self) -> pd.DataFrame:
+    @shared_cache(ttl=3600)
+    def generate_monthly_trend_data(self, seed: Optional[int] = None) -> pd.DataFrame:
         """월별 트렌드 데이터 생성"""
-        months = pd.date_range(start='2024-01-01', end='2024-06-30', freq='M')
+        rng = np.random.default_rng(seed_stream(self._resolve_seed(seed), 'monthly_trend'))
+        months = pd.date_range(start='2024-01-01', end='2024-06-30', freq='ME')
         
         trend_data = []
         base_applicants = 400
@@ -201,11 +397,11 @@ class DataGenerator:
             total = int(base_applicants * seasonal_factor * growth_factor)
             
             # 직무별 분배 (비율을 약간씩 변동)
-            dev_ratio = random.uniform(0.45, 0.55)
-            design_ratio = random.uniform(0.12, 0.18)
-            data_ratio = random.uniform(0.08, 0.15)
-            pm_ratio = random.uniform(0.05, 0.10)
-            qa_ratio = random.uniform(0.03, 0.08)
+            dev_ratio = rng.uniform(0.45, 0.55)
+            design_ratio = rng.uniform(0.12, 0.18)
+            data_ratio = rng.uniform(0.08, 0.15)
+            pm_ratio = rng.uniform(0.05, 0.10)
+            qa_ratio = rng.uniform(0.03, 0.08)
             others_ratio = 1 - (dev_ratio + design_ratio + data_ratio + pm_ratio + qa_ratio)
             
             trend_data.append({
@@ -217,15 +413,16 @@ class DataGenerator:
                 'product_managers': int(total * pm_ratio),
                 'qa_engineers': int(total * qa_ratio),
                 'others': int(total * others_ratio),
-                'avg_quality_score': round(random.uniform(70, 85), 1),
-                'avg_response_time': round(random.uniform(2.5, 7.0), 1)  # 평균 응답 시간(일)
+                'avg_quality_score': round(rng.uniform(70, 85), 1),
+                'avg_response_time': round(rng.uniform(2.5, 7.0), 1)  # 평균 응답 시간(일)
             })
         
         return pd.DataFrame(trend_data)
     
-    @st.cache_data(ttl=3600)
-    def generate_regional_data(_self) -> pd.DataFrame:
+    @shared_cache(ttl=3600)
+    def generate_regional_data(self, seed: Optional[int] = None) -> pd.DataFrame:
         """지역별 분포 데이터 생성"""
+        rng = np.random.default_rng(seed_stream(self._resolve_seed(seed), 'regional'))
         # 실제 인구 분포를 반영한 가중치
         region_weights = {
             '서울': 0.35, '경기': 0.25, '부산': 0.08, '대구': 0.06,
@@ -237,19 +434,19 @@ class DataGenerator:
         regional_data = []
         
         for region, weight in region_weights.items():
-            count = int(total_candidates * weight * random.uniform(0.9, 1.1))
+            count = int(total_candidates * weight * rng.uniform(0.9, 1.1))
             percentage = (count / total_candidates) * 100
             
             # 지역별 특성 반영
             if region == '서울':
-                avg_salary = random.randint(5500, 7500)
-                quality_score = random.uniform(78, 88)
+                avg_salary = int(rng.integers(5500, 7501))
+                quality_score = rng.uniform(78, 88)
             elif region == '경기':
-                avg_salary = random.randint(4800, 6800)
-                quality_score = random.uniform(75, 85)
+                avg_salary = int(rng.integers(4800, 6801))
+                quality_score = rng.uniform(75, 85)
             else:
-                avg_salary = random.randint(3800, 5800)
-                quality_score = random.uniform(70, 82)
+                avg_salary = int(rng.integers(3800, 5801))
+                quality_score = rng.uniform(70, 82)
             
             regional_data.append({
                 'region': region,
@@ -257,18 +454,86 @@ class DataGenerator:
                 'percentage': round(percentage, 1),
                 'avg_salary_expectation': f'{avg_salary}만원',
                 'avg_quality_score': round(quality_score, 1),
-                'top_position': random.choice(['프론트엔드 개발자', '백엔드 개발자', 'UI/UX 디자이너'])
+                'top_position': str(rng.choice(['프론트엔드 개발자', '백엔드 개발자', 'UI/UX 디자이너']))
             })
         
         return pd.DataFrame(regional_data)
     
-    @st.cache_data(ttl=3600)
-    def generate_funnel_data(_self) -> pd.DataFrame:
-        """채용 퍼널 데이터 생성"""
-        # 실제적인 전환율을 반영한 퍼널
-        total_applicants = 3500
-        
-        funnel_stages = [
-            ('총 지원자', total_applicants, 100.0),
-            ('서류 통과', int(total_applicants * 0.45), 45.0),
-            ('1차 면접', int(total_applicants * 0.25), 25.
+    @shared_cache(ttl=3600, dataset='candidates')
+    def generate_funnel_data(self, candidates_df: Optional[pd.DataFrame] = None,
+                             num_candidates: int = 3500, seed: Optional[int] = None) -> pd.DataFrame:
+        """채용 퍼널 데이터 생성 (지원자 상태에서 단계별 도달 인원 계산)"""
+        if candidates_df is None:
+            candidates_df = self.generate_candidates_data(num_candidates, seed)
+        funnel = FunnelEngine(candidates_df).funnel()
+        
+        return pd.DataFrame({
+            'stage': funnel.index,
+            'count': funnel['count'].to_numpy(),
+            'percentage': funnel['overall_rate'].round(1).to_numpy()
+        })
+    
+    def generate_status_events(self, candidates_df: pd.DataFrame, seed: Optional[int] = None,
+                               now: Optional[datetime] = None) -> pd.DataFrame:
+        """지원자의 현재 상태와 일치하는 상태 변경 이벤트 생성 (candidate_id, from_stage, to_stage, timestamp)
+
+        지원일에 '지원접수'로 시작해 현재 단계까지 한 단계씩 진행하며, 불합격자는 서류~최종 면접 중
+        한 단계에서 탈락합니다. 단계 간격은 2~11일이며 마지막 이벤트가 now를 넘지 않도록 비율로 줄입니다.
+        """
+        rng = np.random.default_rng(seed_stream(self._resolve_seed(seed), 'status_events'))
+        now = np.datetime64(now or datetime.now(), 'ns')
+        n = len(candidates_df)
+        rejected_code = RECRUITMENT_STAGES.index('불합격')
+        
+        final = pd.Categorical(candidates_df['status'], categories=RECRUITMENT_STAGES).codes.astype(np.int64)
+        rejected = final == rejected_code
+        last_progress = np.where(rejected, rng.integers(1, rejected_code - 1, n), final)  # 탈락 직전 단계 (서류~최종 면접)
+        lengths = last_progress + 1 + rejected
+        
+        owner = np.repeat(np.arange(n), lengths)
+        starts = np.cumsum(lengths) - lengths
+        step = np.arange(lengths.sum()) - starts[owner]
+        is_last = step == lengths[owner] - 1
+        to_stage = np.where(rejected[owner] & is_last, rejected_code, step)
+        from_stage = np.where(step == 0, -1, np.where(rejected[owner] & is_last, last_progress[owner], step - 1))
+        
+        # 단계 간격(일 + 시간)을 누적하고, 지원일~now 사이에 들어가도록 지원자별로 축소
+        gaps = rng.integers(2, 12, len(step)) * 86_400 + rng.integers(0, 86_400, len(step))
+        gaps[step == 0] = 0
+        elapsed = np.cumsum(gaps) - np.repeat(np.cumsum(gaps)[starts] - gaps[starts], lengths)
+        applied = candidates_df['applied_date'].to_numpy(dtype='datetime64[ns]')
+        available = (now - applied).astype('timedelta64[s]').astype(np.int64) * 0.95
+        span = elapsed[starts + lengths - 1]
+        scale = np.minimum(1.0, available / np.maximum(span, 1))
+        timestamps = applied[owner] + (elapsed * scale[owner]).astype('timedelta64[s]')
+        
+        stage_labels = np.array(RECRUITMENT_STAGES + [None], dtype=object)  # 코드 -1(최초 이벤트) → None
+        return pd.DataFrame({
+            'candidate_id': candidates_df['id'].to_numpy()[owner],
+            'from_stage': stage_labels[from_stage],
+            'to_stage': stage_labels[to_stage],
+            'timestamp': timestamps
+        })
+
+
+def main():
+    """대용량 지원자 픽스처를 Parquet 파티션으로 생성하는 CLI
+
+    예) python -m utils.data_generator --rows 5000000 --chunk-size 200000 --output data/candidates
+    """
+    parser = argparse.ArgumentParser(description="지원자 데이터를 월별 파티션 Parquet로 생성")
+    parser.add_argument('--rows', type=int, required=True, help="생성할 지원자 수")
+    parser.add_argument('--chunk-size', type=int, default=DATA_GENERATOR_CONFIG['shard_rows'],
+                        help="한 번에 생성할 행 수 (샤드 크기, 같은 시드라도 바꾸면 데이터가 달라짐)")
+    parser.add_argument('--output', default=os.path.join('data', 'candidates'), help="출력 디렉토리")
+    parser.add_argument('--seed', type=int, default=None, help="난수 시드 (기본값: DATA_GENERATOR_CONFIG['seed'])")
+    parser.add_argument('--workers', type=int, default=None, help="샤드 생성 프로세스 수 (결과에는 영향 없음)")
+    args = parser.parse_args()
+
+    files_written = DataGenerator().write_candidates_parquet(args.output, args.rows, args.chunk_size, args.seed,
+                                                             args.workers)
+    print(f"{args.rows:,}명 생성 완료: {files_written}개 파일 → {args.output}")
+
+
+if __name__ == "__main__":
+    main()
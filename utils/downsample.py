@@ -0,0 +1,99 @@
+"""
+차트 데이터 축소 모듈
+
+행이 많은 데이터를 그대로 Plotly에 넘기면 모든 점이 JSON으로 브라우저에 전송됩니다.
+히스토그램은 NumPy로 미리 구간별 개수를 세어 막대만 보내고, 산점도는 격자 칸마다 대표 점 하나만 남기거나
+(칸 수만큼으로 제한) 점이 아주 많으면 격자별 밀도 히트맵으로 바꿔 행 수와 관계없이 전송량을 일정하게 유지합니다.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+import plotly.graph_objects as go
+
+
+def _as_numeric(values) -> Tuple[np.ndarray, bool]:
+    """datetime 값은 int64(ns)로 바꿔 구간 계산 (변환 여부 함께 반환)"""
+    array = np.asarray(values)
+    if np.issubdtype(array.dtype, np.datetime64):
+        return array.astype('datetime64[ns]').astype(np.int64).astype(np.float64), True
+    return array.astype(np.float64), False
+
+
+def _from_numeric(values: np.ndarray, is_datetime: bool) -> np.ndarray:
+    return values.astype(np.int64).astype('datetime64[ns]') if is_datetime else values
+
+
+def histogram_bins(values, bins: int = 20, weights=None,
+                   value_range: Optional[Tuple[float, float]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """구간 경계와 구간별 개수 (결측은 제외, weights는 값별 인원 등 가중치)"""
+    values = np.asarray(values, dtype=np.float64)
+    valid = ~np.isnan(values)
+    if weights is not None:
+        weights = np.asarray(weights, dtype=np.float64)[valid]
+    if not valid.any():
+        return np.array([0.0, 1.0]), np.zeros(1)
+    counts, edges = np.histogram(values[valid], bins=bins, range=value_range, weights=weights)
+    return edges, counts
+
+
+def histogram_trace(edges: np.ndarray, counts: np.ndarray, name: str = '지원자 수', **kwargs) -> go.Bar:
+    """미리 센 구간 개수를 막대로 표시 (막대 폭 = 구간 폭)"""
+    return go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        name=name,
+        customdata=np.column_stack([edges[:-1], edges[1:]]),
+        hovertemplate="%{customdata[0]:.0f} ~ %{customdata[1]:.0f}<br>%{y:,}명<extra></extra>",
+        **kwargs
+    )
+
+
+def _grid_cells(x: np.ndarray, y: np.ndarray, bins: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """각 점의 격자 칸 번호와 x/y 구간 경계"""
+    x_edges = np.linspace(x.min(), x.max(), bins + 1)
+    y_edges = np.linspace(y.min(), y.max(), bins + 1)
+    x_cell = np.clip(np.searchsorted(x_edges, x, side='right') - 1, 0, bins - 1)
+    y_cell = np.clip(np.searchsorted(y_edges, y, side='right') - 1, 0, bins - 1)
+    return x_cell * bins + y_cell, x_edges, y_edges
+
+
+def grid_sample(x, y, max_points: int) -> np.ndarray:
+    """격자 칸마다 첫 번째 점 하나만 남긴 행 위치 (결과는 최대 max_points개, 원래 순서 유지)
+
+    칸 수가 max_points 이하가 되도록 격자 크기를 정하므로 빈 영역은 그대로 비고,
+    점이 몰린 영역의 모양은 유지됩니다.
+    """
+    x, _ = _as_numeric(x)
+    y, _ = _as_numeric(y)
+    if len(x) <= max_points:
+        return np.arange(len(x))
+    bins = max(1, int(np.sqrt(max_points)))
+    cells, _, _ = _grid_cells(x, y, bins)
+    _, first = np.unique(cells, return_index=True)
+    return np.sort(first)
+
+
+def density_grid(x, y, bins: int = 60) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """격자별 점 개수 (x 구간 중심, y 구간 중심, [y, x] 개수 배열)"""
+    x, x_is_datetime = _as_numeric(x)
+    y, y_is_datetime = _as_numeric(y)
+    counts, x_edges, y_edges = np.histogram2d(x, y, bins=bins)
+    x_centers = _from_numeric((x_edges[:-1] + x_edges[1:]) / 2, x_is_datetime)
+    y_centers = _from_numeric((y_edges[:-1] + y_edges[1:]) / 2, y_is_datetime)
+    return x_centers, y_centers, counts.T
+
+
+def density_heatmap_trace(x, y, bins: int = 60, **kwargs) -> go.Heatmap:
+    """격자별 밀도 히트맵 (빈 칸은 투명하게 표시)"""
+    x_centers, y_centers, counts = density_grid(x, y, bins)
+    return go.Heatmap(
+        x=x_centers,
+        y=y_centers,
+        z=np.where(counts > 0, counts, np.nan),
+        colorscale='Blues',
+        colorbar=dict(title='지원자 수'),
+        hovertemplate="%{x}<br>%{y:.0f}<br>%{z:,}명<extra></extra>",
+        **kwargs
+    )
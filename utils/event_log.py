@@ -0,0 +1,262 @@
+"""
+지원자 상태 변경 이벤트 로그 모듈
+
+지원자 테이블에는 현재 상태와 지원일만 있어 리드타임이나 단계별 체류 기간을 계산할 수 없습니다.
+이 모듈은 (지원자, 이전 단계, 다음 단계, 시각) 이벤트를 추가만 가능한(append-only) 컬럼 배열로 쌓고,
+일정 행 수마다 컬럼별 .npy 청크로 저장해 np.load(mmap_mode='r')로 메모리 매핑해 읽습니다.
+
+조회는 모두 (지원자, 시각) 정렬 한 번 + 벡터 연산으로 처리합니다.
+- state_as_of(T): 시각 T 기준 지원자별 상태 (T 이전 마지막 이벤트)
+- time_in_stage(): 이벤트별 단계 체류 기간 (다음 이벤트까지, 진행 중이면 기준 시각까지)
+- lead_time_percentiles(): 첫 이벤트(지원) → 목표 단계 도달까지 걸린 기간의 분위수
+"""
+
+import json
+import os
+import threading
+import uuid
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from config import RECRUITMENT_STAGES
+
+EVENT_COLUMNS = {
+    'candidate': np.int64,  # 지원자 ID 사전 코드
+    'from_stage': np.int8,  # 최초 이벤트는 -1
+    'to_stage': np.int8,
+    'timestamp': np.int64,  # datetime64[ns] 정수값
+}
+DEFAULT_CHUNK_ROWS = 1_000_000
+_NS_PER_DAY = 86_400 * 10**9
+
+
+class StatusEventLog:
+    """상태 변경 이벤트 컬럼 로그 (directory를 주면 청크를 .npy로 저장하고 메모리 매핑으로 읽음)"""
+
+    def __init__(self, directory: Optional[str] = None, stages: Sequence[str] = RECRUITMENT_STAGES,
+                 chunk_rows: int = DEFAULT_CHUNK_ROWS):
+        self.directory = directory
+        self.stages: List[str] = list(stages)
+        self.chunk_rows = chunk_rows
+        self.fingerprint = uuid.uuid4().hex  # 차트 캐시 키용 (append마다 갱신)
+        self._stage_codes = {stage: i for i, stage in enumerate(self.stages)}
+        self._candidate_ids: List[str] = []
+        self._candidate_index = pd.Index([], dtype=object)
+        self._chunks: List[Dict[str, np.ndarray]] = []
+        self._buffer: List[Dict[str, np.ndarray]] = []
+        self._sorted: Optional[Dict[str, np.ndarray]] = None
+        self._lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self._load()
+
+    # ---- 저장 / 적재 ----
+
+    def _chunk_dir(self, index: int) -> str:
+        return os.path.join(self.directory, f"chunk_{index:06d}")
+
+    def _load(self):
+        meta_path = os.path.join(self.directory, 'candidates.json')
+        if os.path.exists(meta_path):
+            with open(meta_path, encoding='utf-8') as f:
+                self._candidate_ids = json.load(f)
+            self._candidate_index = pd.Index(self._candidate_ids, dtype=object)
+        index = 0
+        while os.path.isdir(self._chunk_dir(index)):
+            self._chunks.append({
+                column: np.load(os.path.join(self._chunk_dir(index), f"{column}.npy"), mmap_mode='r')
+                for column in EVENT_COLUMNS
+            })
+            index += 1
+
+    def _write_chunk(self, chunk: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """청크를 임시 디렉토리에 쓴 뒤 이름을 바꿔 원자적으로 추가하고 메모리 매핑으로 다시 열기"""
+        index = len(self._chunks)
+        final_dir = self._chunk_dir(index)
+        tmp_dir = f"{final_dir}.{os.getpid()}.tmp"
+        os.makedirs(tmp_dir, exist_ok=True)
+        for column, values in chunk.items():
+            np.save(os.path.join(tmp_dir, f"{column}.npy"), values)
+        os.replace(tmp_dir, final_dir)
+
+        meta_path = os.path.join(self.directory, 'candidates.json')
+        with open(f"{meta_path}.tmp", 'w', encoding='utf-8') as f:
+            json.dump(self._candidate_ids, f, ensure_ascii=False)
+        os.replace(f"{meta_path}.tmp", meta_path)
+        return {column: np.load(os.path.join(final_dir, f"{column}.npy"), mmap_mode='r') for column in chunk}
+
+    def flush(self):
+        """버퍼에 쌓인 이벤트를 청크로 확정 (directory가 있으면 디스크에 저장)"""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._buffer:
+            return
+        chunk = {column: np.concatenate([part[column] for part in self._buffer]) for column in EVENT_COLUMNS}
+        self._buffer = []
+        self._chunks.append(self._write_chunk(chunk) if self.directory is not None else chunk)
+
+    # ---- 추가 ----
+
+    def _encode_candidates(self, candidate_ids: Iterable[str]) -> np.ndarray:
+        codes, uniques = pd.factorize(pd.Series(candidate_ids, dtype=object))
+        lookup = self._candidate_index.get_indexer(uniques)
+        new = lookup < 0
+        if new.any():
+            lookup[new] = len(self._candidate_ids) + np.arange(new.sum())
+            self._candidate_ids.extend(uniques[new].tolist())
+            self._candidate_index = pd.Index(self._candidate_ids, dtype=object)
+        return lookup.astype(np.int64)[codes]
+
+    def _encode_stages(self, stages) -> np.ndarray:
+        codes = pd.Categorical(stages, categories=self.stages).codes.astype(np.int8)
+        unknown = codes < 0
+        if unknown.any() and not pd.isna(np.asarray(stages, dtype=object)[unknown]).all():
+            raise ValueError(f"알 수 없는 단계가 있습니다: {set(np.asarray(stages, dtype=object)[unknown]) - {None}}")
+        return codes
+
+    def append(self, events: pd.DataFrame):
+        """이벤트 추가 (컬럼: candidate_id, from_stage(최초는 None), to_stage, timestamp)"""
+        if events.empty:
+            return
+        with self._lock:
+            part = {
+                'candidate': self._encode_candidates(events['candidate_id']),
+                'from_stage': self._encode_stages(events['from_stage']),
+                'to_stage': self._encode_stages(events['to_stage']),
+                'timestamp': pd.to_datetime(events['timestamp']).to_numpy(dtype='datetime64[ns]').astype(np.int64),
+            }
+            if (part['to_stage'] < 0).any():
+                raise ValueError("to_stage는 비어 있을 수 없습니다")
+            self._buffer.append(part)
+            self._sorted = None
+            self.fingerprint = uuid.uuid4().hex
+            if sum(len(p['candidate']) for p in self._buffer) >= self.chunk_rows:
+                self._flush_locked()
+
+    def __len__(self) -> int:
+        return sum(len(chunk['candidate']) for chunk in self._chunks + self._buffer)
+
+    @property
+    def candidate_ids(self) -> List[str]:
+        return list(self._candidate_ids)
+
+    # ---- 조회 ----
+
+    def _sorted_events(self) -> Dict[str, np.ndarray]:
+        """(지원자, 시각) 순으로 정렬한 전체 이벤트 (추가가 없으면 재사용)"""
+        with self._lock:
+            if self._sorted is None:
+                parts = self._chunks + self._buffer
+                if parts:
+                    columns = {c: np.concatenate([np.asarray(p[c]) for p in parts]) for c in EVENT_COLUMNS}
+                else:
+                    columns = {c: np.empty(0, dtype=t) for c, t in EVENT_COLUMNS.items()}
+                order = np.lexsort((columns['timestamp'], columns['candidate']))
+                self._sorted = {column: values[order] for column, values in columns.items()}
+            return self._sorted
+
+    def state_as_of(self, when) -> pd.Series:
+        """시각 when 기준 지원자별 상태 (그때까지 이벤트가 없는 지원자는 제외)"""
+        events = self._sorted_events()
+        keep = events['timestamp'] <= pd.Timestamp(when).value
+        candidates = events['candidate'][keep]
+        stages = events['to_stage'][keep]
+        last = np.flatnonzero(np.r_[candidates[1:] != candidates[:-1], True]) if len(candidates) else candidates
+        return pd.Series(
+            pd.Categorical.from_codes(stages[last], categories=self.stages),
+            index=pd.Index(np.asarray(self._candidate_ids, dtype=object)[candidates[last]], name='candidate_id'),
+            name='status'
+        )
+
+    def _candidate_mask(self, candidate_codes: np.ndarray, candidates: Iterable[str]) -> np.ndarray:
+        """지원자 코드 배열 중 candidates(지원자 ID 목록)에 속하는 위치"""
+        lookup = self._candidate_index.get_indexer(pd.Index(list(candidates), dtype=object))
+        member = np.zeros(len(self._candidate_ids), dtype=bool)
+        member[lookup[lookup >= 0]] = True
+        return member[candidate_codes]
+
+    def time_in_stage(self, as_of=None, include_open: bool = True,
+                      candidates: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """이벤트(단계 진입)별 체류 기간 (stage, days, open, candidates를 주면 그 지원자만)
+
+        다음 이벤트가 있으면 그 시각까지, 없으면(현재 단계) as_of까지를 체류 기간으로 보고 open=True로 표시합니다.
+        다음 이벤트가 as_of 이후인 구간도 as_of 시점에는 진행 중이므로 as_of에서 잘라 open=True로 표시합니다.
+        """
+        events = self._sorted_events()
+        owners, timestamps = events['candidate'], events['timestamp']
+        has_next = np.r_[owners[1:] == owners[:-1], False]
+        end = np.empty_like(timestamps)
+        end[:-1] = timestamps[1:]
+        as_of_value = pd.Timestamp(as_of if as_of is not None else pd.Timestamp.now()).value
+        closed = has_next & (end <= as_of_value) if as_of is not None else has_next
+        end[~closed] = as_of_value
+
+        keep = np.ones(len(owners), dtype=bool) if include_open else closed.copy()
+        if as_of is not None:
+            keep &= timestamps <= as_of_value
+        if candidates is not None:
+            keep &= self._candidate_mask(owners, candidates)
+        return pd.DataFrame({
+            'stage': pd.Categorical.from_codes(events['to_stage'][keep], categories=self.stages),
+            'days': (end[keep] - timestamps[keep]) / _NS_PER_DAY,
+            'open': ~closed[keep],
+        })
+
+    def stage_duration_percentiles(self, percentiles: Sequence[float] = (50, 75, 90), as_of=None,
+                                   include_open: bool = False,
+                                   candidates: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """단계별 체류 기간 분위수 (행: 단계, 열: p50/p75/..., candidates를 주면 그 지원자만)"""
+        durations = self.time_in_stage(as_of, include_open, candidates)
+        codes = durations['stage'].cat.codes.to_numpy()
+        days = durations['days'].to_numpy()
+        order = np.lexsort((days, codes))
+        codes, days = codes[order], days[order]
+        starts = np.searchsorted(codes, np.arange(len(self.stages)), side='left')
+        ends = np.searchsorted(codes, np.arange(len(self.stages)), side='right')
+
+        result = {}
+        for q in percentiles:
+            counts = ends - starts
+            # 정렬된 구간 안에서 선형 보간 분위수 (np.percentile 'linear'과 동일)
+            position = starts + (counts - 1).clip(min=0) * q / 100
+            lower = np.floor(position).astype(np.int64).clip(max=max(len(days) - 1, 0))
+            upper = np.ceil(position).astype(np.int64).clip(max=max(len(days) - 1, 0))
+            values = days[lower] + (days[upper] - days[lower]) * (position - lower) if len(days) else np.zeros(len(counts))
+            result[f'p{q:g}'] = np.where(counts > 0, values, np.nan)
+        result['count'] = ends - starts
+        return pd.DataFrame(result, index=pd.Index(self.stages, name='stage'))
+
+    def lead_times(self, target_stage: str = '합격', since=None, until=None) -> pd.Series:
+        """지원자별 첫 이벤트 → target_stage 첫 도달까지 일수 (도달 시각이 since~until 안인 지원자만)"""
+        events = self._sorted_events()
+        candidates, timestamps = events['candidate'], events['timestamp']
+        if not len(candidates):
+            return pd.Series(dtype=np.float64, name='lead_days')
+        starts = np.flatnonzero(np.r_[True, candidates[1:] != candidates[:-1]])
+        first_seen = timestamps[starts]
+
+        hits = np.flatnonzero(events['to_stage'] == self._stage_codes[target_stage])
+        hit_candidates = candidates[hits]
+        first_hit = hits[np.r_[True, hit_candidates[1:] != hit_candidates[:-1]]] if len(hits) else hits
+        group = np.searchsorted(starts, first_hit, side='right') - 1  # 도달 이벤트가 속한 지원자 구간
+        reached_at = timestamps[first_hit]
+
+        keep = np.ones(len(first_hit), dtype=bool)
+        if since is not None:
+            keep &= reached_at >= pd.Timestamp(since).value
+        if until is not None:
+            keep &= reached_at <= pd.Timestamp(until).value
+        ids = np.asarray(self._candidate_ids, dtype=object)[candidates[first_hit[keep]]]
+        return pd.Series((reached_at[keep] - first_seen[group[keep]]) / _NS_PER_DAY,
+                         index=pd.Index(ids, name='candidate_id'), name='lead_days')
+
+    def lead_time_percentiles(self, percentiles: Sequence[float] = (50, 75, 90), target_stage: str = '합격',
+                              since=None, until=None) -> Dict[str, float]:
+        """리드타임 분위수 ({'p50': 일수, ...}, 도달한 지원자가 없으면 NaN)"""
+        days = self.lead_times(target_stage, since, until).to_numpy()
+        values = np.percentile(days, percentiles) if len(days) else [np.nan] * len(percentiles)
+        return {f'p{q:g}': float(v) for q, v in zip(percentiles, values)}
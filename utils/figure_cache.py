@@ -0,0 +1,247 @@
+"""
+차트 Figure 캐시 모듈
+
+ChartGenerator 메서드 결과를 (메서드, 입력 프레임 지문, 인자) 키로 JSON 직렬화해 LRU로 보관합니다.
+같은 입력으로 다시 실행될 때 Plotly Figure를 처음부터 만들지 않고, 저장된 JSON에서 검증 없이 복원합니다.
+차트 공통 레이아웃/스타일은 시작 시 한 번 Plotly 템플릿으로 등록해 두고 차트마다 dict를 다시 만들지 않습니다.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import pickle
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from config import AGGREGATE_CACHE_CONFIG, CHART_CONFIG, COLORS, FIGURE_CACHE_CONFIG
+from utils.cache import DATASET_VERSION_ATTR, CacheStats, RedisCacheBackend, get_cache_backend, is_dataset_source
+
+logger = logging.getLogger(__name__)
+
+CHART_TEMPLATE = 'recruit_dashboard'
+
+_template_lock = threading.Lock()
+
+
+def register_chart_template(name: str = CHART_TEMPLATE) -> str:
+    """대시보드 공통 Plotly 템플릿을 한 번만 등록하고 이름 반환"""
+    with _template_lock:
+        if name in pio.templates:
+            return name
+
+        template = go.layout.Template(pio.templates['plotly'])
+        template.layout.update(
+            font=dict(size=12),
+            title=dict(font=dict(color=COLORS['dark'])),
+            colorway=CHART_CONFIG['funnel']['colors'],
+            height=CHART_CONFIG['bar']['height'],
+        )
+        template.data.funnel = [go.Funnel(
+            textfont=dict(size=14, color='white'),
+            connector=dict(line=dict(color=COLORS['primary'], dash='dot', width=3)),
+            marker=dict(line=dict(color='white', width=2)),
+        )]
+        template.data.pie = [go.Pie(textposition='inside', textinfo='percent+label')]
+        pio.templates[name] = template
+        return name
+
+
+# 같은 프레임 객체를 여러 차트에 넘길 때 지문을 다시 계산하지 않도록 id 기준으로 기억
+_frame_fingerprints: Dict[int, Tuple[weakref.ref, Tuple, str]] = {}
+
+
+def _hash_frame(frame) -> str:
+    """프레임 내용 지문
+
+    데이터셋 버전을 붙인 원본 프레임 객체는 값을 수정하지 않는다고 보고 버전 + 컬럼/타입 + 인덱스만 해시합니다.
+    그 밖의 프레임은 전체 값을 해시합니다 (파생 프레임도 attrs로 같은 버전을 물려받으므로 버전을 믿지 않음).
+    """
+    if isinstance(frame, pd.DataFrame):
+        schema = (list(frame.columns), [str(dtype) for dtype in frame.dtypes])
+    else:
+        schema = (frame.name, str(frame.dtype))
+    digest = hashlib.sha256(repr((frame.shape, schema)).encode())
+    version = frame.attrs.get(DATASET_VERSION_ATTR)
+    if version is None or not is_dataset_source(frame):
+        digest.update(pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes())
+    else:
+        digest.update(version.encode())
+        index = frame.index
+        if isinstance(index, pd.RangeIndex):
+            digest.update(repr((index.start, index.stop, index.step)).encode())
+        else:
+            digest.update(pd.util.hash_pandas_object(index).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def fingerprint(value: Any) -> str:
+    """캐시 키용 인자 지문 (DataFrame/Series는 내용, fingerprint 속성이 있으면 그 값, 나머지는 pickle)"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        shape_key = (value.shape, tuple(value.columns) if isinstance(value, pd.DataFrame) else value.name)
+        cached = _frame_fingerprints.get(id(value))
+        if cached is not None and cached[0]() is value and cached[1] == shape_key:
+            return cached[2]
+        result = _hash_frame(value)
+        key = id(value)
+        _frame_fingerprints[key] = (weakref.ref(value, lambda _: _frame_fingerprints.pop(key, None)),
+                                    shape_key, result)
+        return result
+    own = getattr(value, 'fingerprint', None)
+    if isinstance(own, str):
+        return own
+    return hashlib.sha256(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)).hexdigest()
+
+
+def _to_json(figure: go.Figure) -> str:
+    return pio.to_json(figure, validate=False)
+
+
+def _from_json(spec: str) -> go.Figure:
+    # 저장할 때 이미 검증된 Figure이므로 복원 시 속성 검증 생략 (검증이 복원 비용의 대부분)
+    return go.Figure(json.loads(spec), _validate=False)
+
+
+class FigureCache:
+    """직렬화된 Figure LRU 캐시 (항목 수 + 바이트 기준 삭제, 적중률 통계)
+
+    shared(get/set(ttl) 백엔드, 예: RedisCacheBackend)를 주면 프로세스 캐시에 없을 때 레플리카 간 공유 캐시를 조회합니다.
+    키가 입력 프레임 지문(데이터셋 버전 포함)이므로 데이터가 바뀌면 다른 키가 됩니다.
+    """
+
+    def __init__(self, max_entries: int = FIGURE_CACHE_CONFIG['max_entries'],
+                 max_bytes: int = FIGURE_CACHE_CONFIG['max_bytes'], shared=None,
+                 shared_ttl: Optional[float] = AGGREGATE_CACHE_CONFIG['ttl']):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.shared = shared
+        self.shared_ttl = shared_ttl
+        self.stats = CacheStats()
+        self._entries: 'OrderedDict[str, Any]' = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(self._sizes.values())
+
+    def _get_shared(self, key: str):
+        if self.shared is None:
+            return None
+        try:
+            data = self.shared.get(key)
+            return json.loads(data) if data is not None else None
+        except Exception as e:
+            logger.warning("공유 Figure 캐시를 조회하지 못했습니다: %s", e)
+            return None
+
+    def get(self, key: str):
+        """저장된 Figure(또는 {이름: Figure}) 복원 (없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is None:
+            entry = self._get_shared(key)
+            if entry is None:
+                with self._lock:
+                    self.stats.misses += 1
+                return None
+            self._store(key, entry)
+        with self._lock:
+            self.stats.hits += 1
+        if isinstance(entry, dict):
+            return {name: _from_json(spec) for name, spec in entry.items()}
+        return _from_json(entry)
+
+    def set(self, key: str, value):
+        if isinstance(value, dict):
+            entry = {name: _to_json(figure) for name, figure in value.items()}
+            size = sum(len(spec) for spec in entry.values())
+        else:
+            entry = _to_json(value)
+            size = len(entry)
+        if size > self.max_bytes:
+            return
+        self._store(key, entry, size)
+        if self.shared is not None:
+            try:
+                self.shared.set(key, json.dumps(entry).encode(), self.shared_ttl)
+            except Exception as e:
+                logger.warning("공유 Figure 캐시에 저장하지 못했습니다: %s", e)
+
+    def _store(self, key: str, entry, size: Optional[int] = None):
+        if size is None:
+            size = sum(len(spec) for spec in entry.values()) if isinstance(entry, dict) else len(entry)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._sizes[key] = size
+            while len(self._entries) > self.max_entries or self.nbytes > self.max_bytes:
+                oldest, _ = self._entries.popitem(last=False)
+                del self._sizes[oldest]
+                self.stats.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+
+
+def figure_key(name: str, args: tuple, kwargs: dict) -> str:
+    digest = hashlib.sha256(name.encode())
+    for value in args:
+        digest.update(fingerprint(value).encode())
+    for arg_name in sorted(kwargs):
+        digest.update(arg_name.encode())
+        digest.update(fingerprint(kwargs[arg_name]).encode())
+    return digest.hexdigest()
+
+
+def cached_figure(method: Callable) -> Callable:
+    """ChartGenerator 메서드용 데코레이터 (self.figure_cache가 None이면 캐시하지 않음)
+
+    반환된 Figure는 매번 새 객체이므로 호출한 쪽에서 update_layout 등으로 수정해도 캐시에 영향이 없습니다.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        cache = getattr(self, 'figure_cache', None)
+        if cache is None:
+            return method(self, *args, **kwargs)
+
+        key = figure_key(method.__qualname__, args, kwargs)
+        figure = cache.get(key)
+        if figure is None:
+            figure = method(self, *args, **kwargs)
+            cache.set(key, figure)
+        return figure
+
+    return wrapper
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_figure_cache() -> FigureCache:
+    """프로세스 공용 Figure 캐시 (공유 캐시 백엔드가 Redis이면 레플리카 간 공유 계층 추가)"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            shared = None
+            backend = get_cache_backend()
+            if (AGGREGATE_CACHE_CONFIG['enabled'] and AGGREGATE_CACHE_CONFIG['shared_figures']
+                    and isinstance(backend, RedisCacheBackend)):
+                shared = RedisCacheBackend(backend.client, AGGREGATE_CACHE_CONFIG['figure_max_bytes'],
+                                           prefix=f"{AGGREGATE_CACHE_CONFIG['key_prefix']}:figure")
+            _default_cache = FigureCache(shared=shared)
+        return _default_cache
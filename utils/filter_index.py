@@ -0,0 +1,94 @@
+"""
+사이드바 필터용 비트맵 인덱스 모듈
+
+필터 대상 컬럼의 값마다 행 포함 여부를 비트맵(np.packbits, 행당 1비트)으로 미리 만들어 두고,
+필터 조합은 선택한 값의 비트맵을 OR(컬럼 내) / AND(컬럼 간) 해서 계산합니다.
+데이터셋 버전마다 한 번만 만들면 위젯을 바꿀 때마다 전체 행을 비교하지 않아도 됩니다.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# 비트맵을 한 번에 만드는 값 개수 (임시 불리언 배열 크기 제한)
+_BUILD_BLOCK = 64
+
+
+class FilterIndex:
+    """컬럼 값별 비트맵 인덱스"""
+
+    def __init__(self, df: pd.DataFrame, columns: Iterable[str]):
+        self.size = len(df)
+        self._values: Dict[str, List[Any]] = {}
+        self._positions: Dict[str, Dict[Any, int]] = {}
+        self._bitmaps: Dict[str, np.ndarray] = {}
+        self._valid: Dict[str, Optional[np.ndarray]] = {}
+
+        for column in columns:
+            series = df[column]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                # 범주형은 어휘 순서를 유지하되 실제로 있는 값만 인덱싱
+                series = series.cat.remove_unused_categories()
+                codes = series.cat.codes.to_numpy()
+                values = list(series.cat.categories)
+            else:
+                codes, uniques = pd.factorize(series, sort=False)
+                values = list(uniques)
+
+            bitmaps = np.empty((len(values), (self.size + 7) // 8), dtype=np.uint8)
+            for start in range(0, len(values), _BUILD_BLOCK):
+                block = np.arange(start, min(start + _BUILD_BLOCK, len(values)))
+                bitmaps[block] = np.packbits(codes[None, :] == block[:, None], axis=1)
+
+            self._values[column] = values
+            self._positions[column] = {value: i for i, value in enumerate(values)}
+            self._bitmaps[column] = bitmaps
+            self._valid[column] = np.packbits(codes >= 0) if (codes < 0).any() else None
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._values)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(bitmaps.nbytes for bitmaps in self._bitmaps.values())
+
+    def values(self, column: str) -> List[Any]:
+        """필터 옵션으로 쓸 컬럼 값 목록"""
+        return list(self._values[column])
+
+    def _column_bits(self, column: str, selected: Iterable[Any]) -> Optional[np.ndarray]:
+        """한 컬럼의 선택 값에 해당하는 비트맵 (제약이 없으면 None)"""
+        positions = self._positions[column]
+        chosen = np.zeros(len(positions), dtype=bool)
+        for value in selected:
+            i = positions.get(value)
+            if i is not None:
+                chosen[i] = True
+
+        bitmaps = self._bitmaps[column]
+        valid = self._valid[column]
+        if chosen.all():
+            return None  # 전체 선택은 필터 없음 (결측 행 포함)
+        if not chosen.any():
+            return np.zeros(bitmaps.shape[1], dtype=np.uint8)
+
+        # 선택한 값과 선택하지 않은 값 중 적은 쪽만 OR
+        if chosen.sum() <= len(chosen) // 2:
+            return np.bitwise_or.reduce(bitmaps[chosen], axis=0)
+        bits = ~np.bitwise_or.reduce(bitmaps[~chosen], axis=0)
+        return bits & valid if valid is not None else bits
+
+    def mask(self, selections: Dict[str, Iterable[Any]]) -> np.ndarray:
+        """{컬럼: 선택 값 목록} 조합에 해당하는 행 불리언 마스크"""
+        packed = None
+        for column, selected in selections.items():
+            bits = self._column_bits(column, selected)
+            if bits is None:
+                continue
+            packed = bits.copy() if packed is None else np.bitwise_and(packed, bits, out=packed)
+
+        if packed is None:
+            return np.ones(self.size, dtype=bool)
+        return np.unpackbits(packed, count=self.size).view(bool)
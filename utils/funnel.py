@@ -0,0 +1,135 @@
+"""
+채용 퍼널 계산 모듈
+
+지원자의 현재 상태(status)를 RECRUITMENT_STAGES 순서로 정렬해 단계별 도달 인원, 단계 간 전환율,
+단계별 지원 후 경과일 중앙값을 계산합니다. 데이터셋 버전마다 한 번 (직무 × 채널 × 지원 월 × 단계 × 경과일)
+인원 배열을 만들어 두므로, 필터/그룹 조합이 바뀌어도 행을 다시 훑지 않고 배열만 잘라 합산합니다.
+
+- 도달 인원: 현재 단계가 k 이상인 지원자 수 (불합격자는 탈락 단계를 알 수 없어 첫 단계까지만 도달로 계산)
+- 지원 후 경과일 중앙값: 현재 그 단계에 있는 지원자의 지원일부터 경과일 중앙값 (단계 체류 기간이 아님,
+  체류 기간은 이벤트 로그의 StatusEventLog.time_in_stage 참고)
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from config import RECRUITMENT_STAGES
+from utils.aggregates import _dimension_codes
+
+FUNNEL_DIMENSIONS = ['position', 'source', 'month']
+REJECTED_STAGE = '불합격'
+MAX_DAYS = 365  # 경과일 히스토그램 상한 (넘으면 마지막 칸에 포함)
+
+
+class FunnelEngine:
+    """그룹 × 단계 × 경과일 인원 배열 기반 퍼널 계산"""
+
+    def __init__(self, df: pd.DataFrame, dimensions: Iterable[str] = FUNNEL_DIMENSIONS,
+                 stages: List[str] = RECRUITMENT_STAGES, as_of: Optional[datetime] = None,
+                 date_column: str = 'applied_date', max_days: int = MAX_DAYS,
+                 weight_column: Optional[str] = None):
+        self.dimensions: List[str] = list(dimensions)
+        self.stages: List[str] = list(stages)
+        self.progress_stages = [stage for stage in self.stages if stage != REJECTED_STAGE]
+        self.as_of = pd.Timestamp(as_of or datetime.now())
+        self.labels: Dict[str, List[Any]] = {}
+        self._positions: Dict[str, Dict[Any, int]] = {}
+
+        codes = []
+        for dimension in self.dimensions:
+            dimension_codes, labels = _dimension_codes(df, dimension, date_column)
+            codes.append(dimension_codes)
+            self.labels[dimension] = labels
+            self._positions[dimension] = {label: i for i, label in enumerate(labels)}
+
+        # 상태는 어휘 순서의 코드로 (범주형이 아니거나 어휘가 달라도 같은 순서로 맞춤)
+        stage_codes = pd.Categorical(df['status'], categories=self.stages).codes.astype(np.int64)
+        applied = df[date_column].to_numpy(dtype='datetime64[ns]')
+        elapsed = (np.datetime64(self.as_of.to_datetime64(), 'ns') - applied).astype('timedelta64[D]').astype(np.int64)
+        day_codes = np.clip(elapsed, 0, max_days)
+        day_codes[np.isnat(applied)] = -1
+
+        all_codes = codes + [stage_codes, day_codes]
+        valid = np.logical_and.reduce([c >= 0 for c in all_codes])
+        self.dropped_rows = int((~valid).sum())
+
+        shape = tuple(len(self.labels[d]) for d in self.dimensions) + (len(self.stages), max_days + 1)
+        flat = np.ravel_multi_index([c[valid] for c in all_codes], shape)
+        # weight_column이 있으면 행마다 그 인원수만큼 더함 (DB에서 미리 GROUP BY한 집계 행)
+        weights = df[weight_column].to_numpy(dtype=np.float64)[valid] if weight_column else None
+        self._counts = np.bincount(flat, weights=weights, minlength=int(np.prod(shape))).astype(np.int32).reshape(shape)
+
+    @property
+    def nbytes(self) -> int:
+        return self._counts.nbytes
+
+    def _reduce(self, by: List[str], selections: Optional[Dict[str, Iterable[Any]]]):
+        """선택 값으로 자르고 by 이외 차원을 합산한 (*by, 단계, 경과일) 배열과 차원별 라벨"""
+        array = self._counts
+        labels = dict(self.labels)
+        for dimension, selected in (selections or {}).items():
+            if dimension not in self._positions:
+                continue  # 퍼널 차원이 아닌 필터(지역 등)는 무시
+            positions = self._positions[dimension]
+            index = sorted({positions[value] for value in selected if value in positions})
+            if len(index) < len(positions):
+                array = array.take(index, axis=self.dimensions.index(dimension))
+                labels[dimension] = [self.labels[dimension][i] for i in index]
+
+        keep = [self.dimensions.index(dimension) for dimension in by]
+        summed = tuple(i for i in range(len(self.dimensions)) if i not in keep)
+        reduced = array.sum(axis=summed, dtype=np.int64) if summed else array.astype(np.int64)
+        lead = np.argsort(np.argsort(keep))  # 요청한 by 순서로 재배열
+        return reduced.transpose(tuple(lead) + (len(keep), len(keep) + 1)), labels
+
+    @staticmethod
+    def _median_days(histogram: np.ndarray) -> np.ndarray:
+        """마지막 축(경과일) 히스토그램의 중앙값 (인원이 없으면 NaN)"""
+        total = histogram.sum(axis=-1)
+        cumulative = histogram.cumsum(axis=-1)
+        lower = (cumulative >= ((total + 1) // 2)[..., None]).argmax(axis=-1)
+        upper = (cumulative >= (total // 2 + 1)[..., None]).argmax(axis=-1)
+        return np.where(total > 0, (lower + upper) / 2, np.nan)
+
+    def funnel(self, by=None, selections: Optional[Dict[str, Iterable[Any]]] = None) -> pd.DataFrame:
+        """단계별 퍼널 (by를 주면 그룹 값 × 단계 MultiIndex)
+
+        컬럼: current(현재 인원), count(도달 인원), conversion(직전 단계 대비 %),
+        overall_rate(첫 단계 대비 %), median_days_since_applied(현재 단계 지원자의 지원 후 경과일 중앙값)
+        """
+        by = [by] if isinstance(by, str) else list(by or [])
+        reduced, labels = self._reduce(by, selections)
+
+        progress = [self.stages.index(stage) for stage in self.progress_stages]
+        current = reduced.sum(axis=-1)
+        progress_current = current[..., progress]
+        reached = progress_current[..., ::-1].cumsum(axis=-1)[..., ::-1]
+        if REJECTED_STAGE in self.stages:
+            reached[..., 0] += current[..., self.stages.index(REJECTED_STAGE)]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            previous = np.concatenate([reached[..., :1], reached[..., :-1]], axis=-1)
+            conversion = np.where(previous > 0, reached / previous * 100, np.nan)
+            overall = np.where(reached[..., :1] > 0, reached / reached[..., :1] * 100, np.nan)
+        median_days_since_applied = self._median_days(reduced[..., progress, :])
+
+        index_levels = [labels[dimension] for dimension in by] + [self.progress_stages]
+        index = pd.MultiIndex.from_product(index_levels, names=by + ['stage']) if by \
+            else pd.Index(self.progress_stages, name='stage')
+        return pd.DataFrame({
+            'current': progress_current.ravel(),
+            'count': reached.ravel(),
+            'conversion': conversion.ravel(),
+            'overall_rate': overall.ravel(),
+            'median_days_since_applied': median_days_since_applied.ravel(),
+        }, index=index)
+
+    def rejected(self, selections: Optional[Dict[str, Iterable[Any]]] = None) -> int:
+        """불합격 인원"""
+        if REJECTED_STAGE not in self.stages:
+            return 0
+        reduced, _ = self._reduce([], selections)
+        return int(reduced[self.stages.index(REJECTED_STAGE)].sum())
@@ -0,0 +1,229 @@
+"""
+채용공고 CSV 증분 수집 모듈
+
+스크랩 파일(premium_remember_jobs_YYYYMMDD_HHMMSS.csv)마다 공고ID 기준으로
+행 해시를 비교해 신규/변경/마감 공고를 찾고, 바뀐 공고만 세그먼트 파일로 추가합니다.
+
+저장 구조 (store_dir)
+- index.parquet    : 공고ID별 행 해시, 마감일, 최초/최종 수집 시각 (작은 고정폭 컬럼)
+- segments/*.parquet: 스크랩별 신규·변경 공고의 요약 컬럼
+- manifest.json    : 반영한 파일 목록과 마지막 수집 결과
+"""
+
+import argparse
+import json
+import os
+import re
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
+from utils.aggregate_cache import get_aggregate_cache
+from utils.remember_loader import HEAVY_COLUMNS, CsvSource, rewind
+
+DEFAULT_INGESTION_DIR = os.path.join('data', 'ingestion')
+SCRAPE_FILE_PATTERN = re.compile(r'(\d{8})_(\d{6})')
+
+INDEX_FILE = 'index.parquet'
+MANIFEST_FILE = 'manifest.json'
+SEGMENTS_DIR = 'segments'
+
+
+@dataclass
+class IngestionResult:
+    """스크랩 파일 한 건의 수집 결과"""
+    source: str
+    scraped_at: str
+    total: int = 0
+    new: int = 0
+    changed: int = 0
+    unchanged: int = 0
+    expired: int = 0
+    skipped: bool = False
+    new_ids: List[int] = field(default_factory=list)
+    changed_ids: List[int] = field(default_factory=list)
+    expired_ids: List[int] = field(default_factory=list)
+
+
+def scrape_time_from_name(name: str) -> Optional[datetime]:
+    """파일명에 포함된 스크랩 시각 파싱"""
+    match = SCRAPE_FILE_PATTERN.search(os.path.basename(name))
+    if not match:
+        return None
+    return datetime.strptime(''.join(match.groups()), '%Y%m%d%H%M%S')
+
+
+def read_scrape_rows(source: CsvSource) -> pd.DataFrame:
+    """공고 행을 문자열 그대로 읽기 (페이로드 JSON은 파싱하지 않고 해시에만 사용)
+
+    파일마다 타입 추론 결과가 달라 해시가 흔들리지 않도록 공고ID 외에는 모두 문자열로 읽습니다.
+    """
+    rewind(source)
+    column_names = pacsv.open_csv(source).schema.names
+    rewind(source)
+    table = pacsv.read_csv(
+        source,
+        convert_options=pacsv.ConvertOptions(
+            column_types={name: pa.int64() if name == '공고ID' else pa.string() for name in column_names},
+            strings_can_be_null=True,
+        ),
+    )
+    df = table.to_pandas()
+    df = df[df['공고ID'].notna()].drop_duplicates('공고ID', keep='last')
+    return df.reset_index(drop=True)
+
+
+class IngestionManager:
+    """공고ID 기준 증분 수집 관리자"""
+
+    def __init__(self, store_dir: str = DEFAULT_INGESTION_DIR):
+        self.store_dir = store_dir
+        self.segments_dir = os.path.join(store_dir, SEGMENTS_DIR)
+        self.index = self._load_index()
+        self.manifest = self._load_manifest()
+
+    def _load_index(self) -> pd.DataFrame:
+        path = os.path.join(self.store_dir, INDEX_FILE)
+        if os.path.exists(path):
+            return pd.read_parquet(path)
+        return pd.DataFrame({
+            '공고ID': pd.Series(dtype='int64'),
+            'row_hash': pd.Series(dtype='uint64'),
+            'deadline': pd.Series(dtype='datetime64[ns]'),
+            'first_seen': pd.Series(dtype='datetime64[ns]'),
+            'last_changed': pd.Series(dtype='datetime64[ns]'),
+            'expired': pd.Series(dtype=bool),
+        })
+
+    def _load_manifest(self) -> dict:
+        path = os.path.join(self.store_dir, MANIFEST_FILE)
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+        return {'files': [], 'last_result': None}
+
+    @property
+    def last_result(self) -> Optional[IngestionResult]:
+        """마지막 수집 결과 ("지난 스크랩 이후 신규" 표시용)"""
+        if not self.manifest.get('last_result'):
+            return None
+        return IngestionResult(**self.manifest['last_result'])
+
+    def ingest(self, source: CsvSource, scraped_at: Optional[datetime] = None) -> IngestionResult:
+        """스크랩 파일 한 건을 반영하고 변경분만 세그먼트로 기록"""
+        name = getattr(source, 'name', None) or os.path.basename(str(source))
+        scraped_at = scraped_at or scrape_time_from_name(name) or datetime.now()
+
+        if name in self.manifest['files']:
+            return IngestionResult(source=name, scraped_at=scraped_at.isoformat(), skipped=True)
+
+        rows = read_scrape_rows(source)
+        hash_columns = [col for col in rows.columns if col != '공고ID']
+        row_hash = pd.util.hash_pandas_object(rows[hash_columns], index=False).to_numpy()
+        deadline = pd.to_datetime(rows['마감일'], errors='coerce') if '마감일' in rows else pd.NaT
+
+        scrape = pd.DataFrame({
+            '공고ID': rows['공고ID'].to_numpy(dtype=np.int64),
+            'row_hash': row_hash,
+            'deadline': deadline,
+        })
+        merged = scrape.merge(self.index, on='공고ID', how='left', suffixes=('', '_prev'), indicator=True)
+        is_new = (merged['_merge'] == 'left_only').to_numpy()
+        is_changed = ~is_new & (merged['row_hash'].to_numpy() != merged['row_hash_prev'].to_numpy())
+        delta = is_new | is_changed
+
+        # 변경분만 요약 컬럼 세그먼트로 저장 (대용량 페이로드 컬럼 제외)
+        if delta.any():
+            os.makedirs(self.segments_dir, exist_ok=True)
+            summary_columns = [col for col in rows.columns if col not in HEAVY_COLUMNS]
+            segment = rows.loc[delta, summary_columns].assign(_scraped_at=pd.Timestamp(scraped_at))
+            segment.to_parquet(
+                os.path.join(self.segments_dir, f"{scraped_at:%Y%m%d_%H%M%S}.parquet"), index=False
+            )
+
+        # 인덱스 갱신: 변경분만 교체하고 마감 여부는 스크랩 시각 기준으로 재계산
+        now = pd.Timestamp(scraped_at)
+        updates = pd.DataFrame({
+            '공고ID': merged['공고ID'],
+            'row_hash': merged['row_hash'],
+            'deadline': merged['deadline'],
+            'first_seen': merged['first_seen'].where(~is_new, now),
+            'last_changed': merged['last_changed'].where(~delta, now),
+            'expired': merged['expired'].fillna(False).astype(bool),
+        })
+        index = pd.concat([self.index[~self.index['공고ID'].isin(updates['공고ID'])], updates], ignore_index=True)
+        was_expired = index['expired'].to_numpy(dtype=bool)
+        index['expired'] = (index['deadline'] < now.normalize()).to_numpy()
+        newly_expired = index['expired'].to_numpy() & ~was_expired
+
+        result = IngestionResult(
+            source=name,
+            scraped_at=scraped_at.isoformat(),
+            total=len(rows),
+            new=int(is_new.sum()),
+            changed=int(is_changed.sum()),
+            unchanged=int(len(rows) - delta.sum()),
+            expired=int(newly_expired.sum()),
+            new_ids=merged.loc[is_new, '공고ID'].astype(int).tolist(),
+            changed_ids=merged.loc[is_changed, '공고ID'].astype(int).tolist(),
+            expired_ids=index.loc[newly_expired, '공고ID'].astype(int).tolist(),
+        )
+
+        os.makedirs(self.store_dir, exist_ok=True)
+        index.sort_values('공고ID').to_parquet(os.path.join(self.store_dir, INDEX_FILE), index=False)
+        self.index = index
+        self.manifest['files'].append(name)
+        self.manifest['last_result'] = asdict(result)
+        with open(os.path.join(self.store_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+
+        if delta.any() or newly_expired.any():
+            # 바뀐 공고가 있을 때만 새 버전을 알려 모든 레플리카가 캐시/스냅샷을 다시 만들게 함
+            get_aggregate_cache().publish_version('postings', f"{name}:{scraped_at:%Y%m%d_%H%M%S}")
+        return result
+
+    def load_current(self) -> pd.DataFrame:
+        """세그먼트를 병합해 공고ID별 최신 버전과 마감 여부 반환"""
+        if not os.path.isdir(self.segments_dir) or not os.listdir(self.segments_dir):
+            return pd.DataFrame(columns=['공고ID'])
+        segments = [
+            pd.read_parquet(os.path.join(self.segments_dir, name))
+            for name in sorted(os.listdir(self.segments_dir))
+            if name.endswith('.parquet')
+        ]
+        current = (
+            pd.concat(segments, ignore_index=True)
+            .sort_values('_scraped_at', kind='stable')
+            .drop_duplicates('공고ID', keep='last')
+        )
+        return current.merge(self.index[['공고ID', 'first_seen', 'expired']], on='공고ID', how='left')
+
+
+def main():
+    """스크랩 파일 증분 수집 CLI
+
+    예) python -m utils.ingestion premium_remember_jobs_*.csv
+    """
+    parser = argparse.ArgumentParser(description="리멤버 채용공고 스크랩 파일 증분 수집")
+    parser.add_argument('files', nargs='+', help="스크랩 CSV 파일 (시간순으로 처리)")
+    parser.add_argument('--store', default=DEFAULT_INGESTION_DIR, help="수집 저장소 디렉토리")
+    args = parser.parse_args()
+
+    manager = IngestionManager(args.store)
+    files = sorted(args.files, key=lambda path: scrape_time_from_name(path) or datetime.min)
+    for path in files:
+        result = manager.ingest(path)
+        if result.skipped:
+            print(f"{result.source}: 이미 반영됨")
+        else:
+            print(f"{result.source}: 총 {result.total:,} · 신규 {result.new:,} · 변경 {result.changed:,} · "
+                  f"마감 {result.expired:,}")
+
+
+if __name__ == "__main__":
+    main()
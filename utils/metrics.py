@@ -0,0 +1,206 @@
+"""
+대시보드 계측(메트릭) 모듈
+
+데이터 로드/필터링/집계/화면 렌더링/차트 생성 단계의 소요 시간과 처리 행 수, 캐시 적중률,
+세션/재실행 수를 Prometheus 형식으로 기록하고 별도 포트의 /metrics로 노출합니다.
+(Streamlit 서버에는 경로를 추가할 수 없으므로 프로세스마다 작은 HTTP 서버를 하나 띄웁니다.)
+
+- @timed(stage) / with track(stage, name): 단계별 지연 시간 히스토그램 (dashboard_stage_seconds)
+- record_rows(stage, name, n): 처리 행 수 (dashboard_rows_processed_total)
+- register_cache(name, stats): CacheStats 적중/실패/삭제 수와 적중률 (수집 시점에 읽음)
+- record_rerun(page, new_session): 재실행 수와 새 세션 수
+- collect_timings(): 현재 스레드(한 번의 재실행)에서 기록된 단계 시간을 따로 모음 (프로파일러 오버레이용)
+
+prometheus_client가 설치되어 있지 않거나 METRICS_CONFIG['enabled']가 꺼져 있으면 기록하지 않고 그대로 실행합니다.
+"""
+
+import functools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from config import METRICS_CONFIG
+from utils.aggregate_cache import get_aggregate_cache
+from utils.cache import CacheStats, get_cache_backend
+from utils.figure_cache import get_figure_cache
+
+logger = logging.getLogger(__name__)
+
+_metrics = None
+_metrics_lock = threading.Lock()
+_caches: Dict[str, Callable[[], CacheStats]] = {}
+_server_started = False
+_local = threading.local()
+
+
+class _CacheCollector:
+    """등록된 캐시의 CacheStats를 수집 시점에 읽어 내보내는 수집기"""
+
+    def collect(self):
+        from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+        families = {
+            'hits': CounterMetricFamily('dashboard_cache_hits', "캐시 적중 수", labels=['cache']),
+            'misses': CounterMetricFamily('dashboard_cache_misses', "캐시 실패 수", labels=['cache']),
+            'evictions': CounterMetricFamily('dashboard_cache_evictions', "캐시 삭제 수", labels=['cache']),
+        }
+        ratio = GaugeMetricFamily('dashboard_cache_hit_ratio', "프로세스 시작 후 캐시 적중률", labels=['cache'])
+        for name, get_stats in list(_caches.items()):
+            try:
+                stats = get_stats()
+            except Exception as e:
+                logger.warning("'%s' 캐시 통계를 읽지 못했습니다: %s", name, e)
+                continue
+            for field, family in families.items():
+                family.add_metric([name], getattr(stats, field))
+            ratio.add_metric([name], stats.hit_ratio)
+        yield from families.values()
+        yield ratio
+
+
+def _get_metrics():
+    """Prometheus 메트릭 객체 (처음 호출할 때 생성, 사용할 수 없으면 None)"""
+    global _metrics
+    if _metrics is not None or not METRICS_CONFIG['enabled']:
+        return _metrics or None
+    with _metrics_lock:
+        if _metrics is None:
+            try:
+                import prometheus_client as prom  # 선택 의존성: 메트릭을 내보낼 때만 필요
+            except ImportError:
+                logger.info("prometheus_client가 없어 메트릭을 기록하지 않습니다")
+                _metrics = False
+                return None
+            _metrics = {
+                'stage_seconds': prom.Histogram(
+                    'dashboard_stage_seconds', "단계별 소요 시간(초)", ['stage', 'name'],
+                    buckets=METRICS_CONFIG['buckets']
+                ),
+                'stage_errors': prom.Counter('dashboard_stage_errors', "단계별 예외 수", ['stage', 'name']),
+                'rows': prom.Counter('dashboard_rows_processed', "단계별 처리 행 수", ['stage', 'name']),
+                'reruns': prom.Counter('dashboard_reruns', "페이지 재실행 수", ['page']),
+                'sessions': prom.Counter('dashboard_sessions', "새 브라우저 세션 수", ['page']),
+            }
+            prom.REGISTRY.register(_CacheCollector())
+    return _metrics or None
+
+
+@contextmanager
+def collect_timings() -> Iterator[Dict[Tuple[str, str], List[float]]]:
+    """블록 안에서 이 스레드가 기록한 (stage, name)별 소요 시간 목록 (Prometheus 사용 여부와 무관)"""
+    previous = getattr(_local, 'timings', None)
+    timings: Dict[Tuple[str, str], List[float]] = {}
+    _local.timings = timings
+    try:
+        yield timings
+    finally:
+        _local.timings = previous
+
+
+def observe(stage: str, name: str, seconds: float, failed: bool = False):
+    timings = getattr(_local, 'timings', None)
+    if timings is not None:
+        timings.setdefault((stage, name), []).append(seconds)
+    metrics = _get_metrics()
+    if metrics is None:
+        return
+    metrics['stage_seconds'].labels(stage, name).observe(seconds)
+    if failed:
+        metrics['stage_errors'].labels(stage, name).inc()
+
+
+def record_rows(stage: str, name: str, rows: int):
+    metrics = _get_metrics()
+    if metrics is not None and rows:
+        metrics['rows'].labels(stage, name).inc(rows)
+
+
+def _result_rows(result: Any) -> Optional[int]:
+    """결과의 행 수 (DataFrame, 또는 첫 원소가 DataFrame인 튜플)"""
+    if isinstance(result, tuple) and result:
+        result = result[0]
+    return len(result) if isinstance(result, pd.DataFrame) else None
+
+
+@contextmanager
+def track(stage: str, name: str) -> Iterator[None]:
+    """블록 실행 시간을 stage/name 히스토그램에 기록"""
+    started = time.perf_counter()
+    failed = False
+    try:
+        yield
+    except BaseException:
+        failed = True
+        raise
+    finally:
+        observe(stage, name, time.perf_counter() - started, failed)
+
+
+def timed(stage: str, name: Optional[str] = None, count_rows: bool = False) -> Callable:
+    """함수 실행 시간을 기록하는 데코레이터 (count_rows=True면 반환 프레임의 행 수도 기록)
+
+    캐시 데코레이터(shared_cache, st.cache_data, cached_figure)보다 바깥에 두면 캐시 적중 시의 시간도 포함됩니다.
+    """
+    def decorator(func: Callable) -> Callable:
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with track(stage, label):
+                result = func(*args, **kwargs)
+            if count_rows:
+                rows = _result_rows(result)
+                if rows is not None:
+                    record_rows(stage, label, rows)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def register_cache(name: str, get_stats: Callable[[], CacheStats]):
+    """수집 시점마다 get_stats()로 읽을 캐시 통계 등록 (같은 이름은 덮어씀)"""
+    _caches[name] = get_stats
+
+
+def record_rerun(page: str, new_session: bool = False):
+    metrics = _get_metrics()
+    if metrics is None:
+        return
+    metrics['reruns'].labels(page).inc()
+    if new_session:
+        metrics['sessions'].labels(page).inc()
+
+
+def register_default_caches():
+    """공유 데이터 캐시, Figure 캐시, 집계 캐시 통계 등록"""
+    register_cache('data', lambda: get_cache_backend().stats)
+    register_cache('figure', lambda: get_figure_cache().stats)
+    register_cache('aggregate', lambda: get_aggregate_cache().stats)
+
+
+def start_metrics_server() -> bool:
+    """/metrics HTTP 서버를 프로세스당 한 번 시작하고 기본 캐시 통계 등록 (이미 떠 있거나 포트를 쓸 수 없으면 False)"""
+    global _server_started
+    if _get_metrics() is None:
+        return False
+    with _metrics_lock:
+        if _server_started:
+            return False
+        _server_started = True  # 실패해도 재실행마다 다시 시도하지 않음
+        register_default_caches()
+        from prometheus_client import start_http_server  # 선택 의존성: 메트릭을 내보낼 때만 필요
+
+        try:
+            start_http_server(METRICS_CONFIG['port'], addr=METRICS_CONFIG['address'])
+        except OSError as e:
+            logger.warning("메트릭 서버를 %s:%d에 열지 못했습니다: %s",
+                           METRICS_CONFIG['address'], METRICS_CONFIG['port'], e)
+            return False
+        logger.info("메트릭 서버 시작: http://%s:%d/metrics", METRICS_CONFIG['address'], METRICS_CONFIG['port'])
+        return True
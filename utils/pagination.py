@@ -0,0 +1,92 @@
+"""
+지원자 목록 페이지네이션 모듈
+
+필터된 전체 행을 expander로 그리지 않고, 현재 페이지의 행만 잘라 한 번에 표 형태로 포맷합니다.
+상세 정보는 표에서 선택한 지원자에 대해서만 그리고, 페이지 번호는 session_state에 유지합니다.
+"""
+
+import hashlib
+from typing import Callable, Dict, Optional, Tuple
+
+import pandas as pd
+import streamlit as st
+
+from config import DEFAULT_FILTERS
+
+
+def page_bounds(total_rows: int, page: int, per_page: int) -> Tuple[int, int, int]:
+    """(시작 행, 끝 행, 전체 페이지 수) 계산 (페이지 번호는 범위 안으로 보정)"""
+    page_count = max(1, -(-total_rows // per_page))
+    page = min(max(page, 0), page_count - 1)
+    start = page * per_page
+    return start, min(start + per_page, total_rows), page_count
+
+
+def _move_page(key: str, delta: int, page_count: int):
+    st.session_state[key] = min(max(st.session_state.get(key, 0) + delta, 0), page_count - 1)
+
+
+def render_page_selector(key: str, total_rows: int, per_page: int) -> int:
+    """이전/다음 버튼과 현재 페이지 표시 (0부터 시작하는 페이지 번호 반환)"""
+    _, _, page_count = page_bounds(total_rows, 0, per_page)
+    page = min(st.session_state.get(key, 0), page_count - 1)  # 필터로 행이 줄어든 경우 보정
+    st.session_state[key] = page
+
+    col1, col2, col3 = st.columns([1, 3, 1])
+    with col1:
+        st.button("◀ 이전", key=f"{key}_prev", disabled=page == 0,
+                  on_click=_move_page, args=(key, -1, page_count))
+    with col2:
+        st.caption(f"{page + 1} / {page_count} 페이지 (총 {total_rows:,}명)")
+    with col3:
+        st.button("다음 ▶", key=f"{key}_next", disabled=page >= page_count - 1,
+                  on_click=_move_page, args=(key, 1, page_count))
+    return page
+
+
+def _page_token(page_df: pd.DataFrame) -> str:
+    """페이지에 보이는 행(id 컬럼, 없으면 인덱스)의 지문 (필터/검색으로 행이 바뀌면 달라짐)"""
+    ids = page_df['id'] if 'id' in page_df.columns else page_df.index.to_series()
+    hashed = pd.util.hash_pandas_object(ids, index=False).to_numpy()
+    return hashlib.sha1(hashed.tobytes()).hexdigest()[:12]
+
+
+def render_page_table(page_df: pd.DataFrame, columns: Dict[str, str], key: str, page: int,
+                      formatters: Optional[Dict[str, Callable[[pd.Series], pd.Series]]] = None) -> Optional[pd.Series]:
+    """이미 잘라 둔 한 페이지를 표로 그리고, 선택한 행(원본 컬럼 전체)을 반환
+
+    표의 위젯 키에 페이지 행 지문을 넣어, 필터/검색으로 페이지 내용이 바뀌면 이전 선택을 버립니다.
+    """
+    formatters = formatters or {}
+    table = pd.DataFrame({
+        label: formatters[column](page_df[column]) if column in formatters else page_df[column]
+        for column, label in columns.items()
+    })
+    event = st.dataframe(
+        table.reset_index(drop=True),
+        hide_index=True,
+        on_select="rerun",
+        selection_mode="single-row",
+        key=f"{key}_table_{page}_{_page_token(page_df)}",
+        use_container_width=True,
+    )
+
+    selected_rows = event.selection.rows if event is not None else []
+    selected_rows = [row for row in selected_rows if row < len(page_df)]  # 행이 줄어든 뒤 남은 선택 무시
+    if not selected_rows:
+        st.caption("행을 선택하면 상세 정보를 볼 수 있습니다.")
+        return None
+    return page_df.iloc[selected_rows[0]]
+
+
+def render_paginated_table(df: pd.DataFrame, columns: Dict[str, str], key: str,
+                           formatters: Optional[Dict[str, Callable[[pd.Series], pd.Series]]] = None,
+                           per_page: Optional[int] = None) -> Optional[pd.Series]:
+    """현재 페이지만 표로 그리고, 선택한 행(원본 컬럼 전체)을 반환
+
+    columns는 {원본 컬럼: 표시 이름}, formatters는 {원본 컬럼: Series 단위 포맷 함수}입니다.
+    """
+    per_page = per_page or DEFAULT_FILTERS['items_per_page']
+    page = render_page_selector(key, len(df), per_page)
+    start, end, _ = page_bounds(len(df), page, per_page)
+    return render_page_table(df.iloc[start:end], columns, key, page, formatters)
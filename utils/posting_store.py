@@ -0,0 +1,234 @@
+"""
+채용공고 상세 데이터(__NEXT_DATA__) 정규화 저장소 모듈
+
+공고소개 컬럼에 직렬화된 Next.js pageProps를 한 번만 파싱해서
+공고 / 페이로드 / 기업 테이블로 나누어 Parquet으로 저장합니다.
+여러 공고가 공유하는 동일한 페이로드와 기업 소개는 한 번만 저장합니다.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+from utils.remember_loader import CsvSource, rewind
+
+PAYLOAD_COLUMN = '공고소개'
+DEFAULT_STORE_DIR = os.path.join('data', 'postings')
+
+POSTINGS_FILE = 'postings.parquet'
+PAYLOADS_FILE = 'payloads.parquet'
+ORGANIZATIONS_FILE = 'organizations.parquet'
+
+
+def _close_truncated_json(text: str) -> str:
+    """잘린 JSON 문자열을 마지막으로 완결된 값까지 자르고 괄호를 닫기 (짝이 없는 닫는 괄호가 나오면 그 앞에서 자름)"""
+    stack: List[str] = []
+    cut, cut_stack = 0, []
+    in_string = escape = False
+
+    for i, ch in enumerate(text):
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == '\\':
+                escape = True
+            elif ch == '"':
+                in_string = False
+            continue
+
+        if ch == '"':
+            in_string = True
+        elif ch in '{[':
+            stack.append('}' if ch == '{' else ']')
+            cut, cut_stack = i + 1, list(stack)
+        elif ch in '}]':
+            if not stack:
+                break
+            stack.pop()
+            cut, cut_stack = i + 1, list(stack)
+        elif ch == ',':
+            cut, cut_stack = i, list(stack)
+
+    return text[:cut] + ''.join(reversed(cut_stack))
+
+
+def parse_payload(text: str) -> Tuple[dict, bool]:
+    """페이로드 파싱 (잘린 경우 복구 가능한 부분만 파싱하고 truncated=True 반환)"""
+    try:
+        return json.loads(text), False
+    except ValueError:
+        return json.loads(_close_truncated_json(text)), True
+
+
+def extract_payload(text: str) -> dict:
+    """페이로드에서 대시보드에 필요한 필드만 추출 (abTest 등 클라이언트 설정은 버림)"""
+    try:
+        payload, truncated = parse_payload(text)
+    except ValueError:
+        payload, truncated = None, True
+    if not isinstance(payload, dict):
+        return {'headhunting_ids': [], 'organizations': [], 'truncated': True}
+
+    page_props = payload.get('props', {}).get('pageProps', {})
+    data = page_props.get('ssrMeta', {}).get('clientConfig', {}).get('data') or page_props.get('data') or {}
+
+    organizations = []
+    for org in data.get('data_job_jobPostingDetailRCheckData', []):
+        if isinstance(org, dict) and 'organizationId' in org:
+            organizations.append({
+                'organizationId': int(org['organizationId']),
+                'title': org.get('title'),
+                'descriptions': [str(d) for d in org.get('descriptions', [])],
+            })
+
+    return {
+        'headhunting_ids': [int(v) for v in data.get('data_job_rememberHeadhuntingId', []) if isinstance(v, int)],
+        'organizations': organizations,
+        'truncated': truncated,
+    }
+
+
+def _iter_payload_batches(source: CsvSource):
+    """공고ID와 페이로드 컬럼만 배치 단위로 스트리밍"""
+    rewind(source)
+    reader = pacsv.open_csv(
+        source,
+        convert_options=pacsv.ConvertOptions(
+            include_columns=['공고ID', PAYLOAD_COLUMN],
+            column_types={'공고ID': pa.int64(), PAYLOAD_COLUMN: pa.string()},
+        ),
+    )
+    for batch in reader:
+        yield batch.column('공고ID').to_pylist(), batch.column(PAYLOAD_COLUMN).to_pylist()
+
+
+def build_posting_store(source: CsvSource, store_dir: str = DEFAULT_STORE_DIR,
+                        workers: Optional[int] = None) -> Dict[str, int]:
+    """CSV의 공고소개 페이로드를 파싱해 정규화된 Parquet 저장소 생성
+
+    동일한 페이로드는 해시로 묶어 한 번만 파싱하며, 고유 페이로드는 프로세스 풀에서 병렬로 처리합니다.
+    """
+    posting_hashes: Dict[int, Optional[str]] = {}
+    unique_payloads: Dict[str, str] = {}
+
+    for posting_ids, texts in _iter_payload_batches(source):
+        for posting_id, text in zip(posting_ids, texts):
+            if posting_id is None:
+                continue
+            if not text:
+                posting_hashes[posting_id] = None
+                continue
+            digest = hashlib.sha1(text.encode('utf-8')).hexdigest()
+            posting_hashes[posting_id] = digest
+            unique_payloads.setdefault(digest, text)
+
+    digests = list(unique_payloads)
+    texts = [unique_payloads.pop(d) for d in digests]
+    if workers == 1 or len(texts) < 2:
+        extracted = [extract_payload(t) for t in texts]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            extracted = list(pool.map(extract_payload, texts, chunksize=max(1, len(texts) // 32)))
+
+    organizations: Dict[int, dict] = {}
+    payload_rows = []
+    for digest, fields in zip(digests, extracted):
+        for org in fields['organizations']:
+            organizations.setdefault(org['organizationId'], org)
+        payload_rows.append({
+            'payload_hash': digest,
+            'headhunting_ids': fields['headhunting_ids'],
+            'organization_ids': [org['organizationId'] for org in fields['organizations']],
+            'truncated': fields['truncated'],
+        })
+
+    os.makedirs(store_dir, exist_ok=True)
+    postings = pd.DataFrame({
+        '공고ID': pd.Series(list(posting_hashes), dtype='int64'),
+        'payload_hash': pd.Series(list(posting_hashes.values()), dtype=object),
+    }).sort_values('공고ID')
+    postings.to_parquet(os.path.join(store_dir, POSTINGS_FILE), index=False)
+
+    payloads_table = pa.Table.from_pylist(payload_rows, schema=pa.schema([
+        ('payload_hash', pa.string()),
+        ('headhunting_ids', pa.list_(pa.int64())),
+        ('organization_ids', pa.list_(pa.int64())),
+        ('truncated', pa.bool_()),
+    ]))
+    pq.write_table(payloads_table, os.path.join(store_dir, PAYLOADS_FILE))
+
+    organizations_table = pa.Table.from_pylist(
+        sorted(organizations.values(), key=lambda org: org['organizationId']),
+        schema=pa.schema([
+            ('organizationId', pa.int64()),
+            ('title', pa.string()),
+            ('descriptions', pa.list_(pa.string())),
+        ]),
+    )
+    pq.write_table(organizations_table, os.path.join(store_dir, ORGANIZATIONS_FILE))
+
+    return {
+        'postings': len(postings),
+        'payloads': len(payload_rows),
+        'organizations': len(organizations),
+    }
+
+
+class PostingStore:
+    """정규화된 공고 상세 저장소 (공고ID 인덱스)"""
+
+    def __init__(self, store_dir: str = DEFAULT_STORE_DIR):
+        self.store_dir = store_dir
+        self.postings = pd.read_parquet(os.path.join(store_dir, POSTINGS_FILE)).set_index('공고ID')
+        self.payloads = pd.read_parquet(os.path.join(store_dir, PAYLOADS_FILE)).set_index('payload_hash')
+        self.organizations = pd.read_parquet(os.path.join(store_dir, ORGANIZATIONS_FILE)).set_index('organizationId')
+
+    @staticmethod
+    def exists(store_dir: str = DEFAULT_STORE_DIR) -> bool:
+        return all(
+            os.path.exists(os.path.join(store_dir, name))
+            for name in (POSTINGS_FILE, PAYLOADS_FILE, ORGANIZATIONS_FILE)
+        )
+
+    def posting_payloads(self, posting_ids: List[int]) -> pd.DataFrame:
+        """공고ID별 페이로드 필드 조회 (공고ID 순서 유지)"""
+        postings = self.postings.reindex(posting_ids)
+        return postings.join(self.payloads, on='payload_hash')
+
+    def posting_organizations(self, posting_id: int) -> pd.DataFrame:
+        """공고 페이지에 노출된 기업 소개 목록 조회"""
+        if posting_id not in self.postings.index:
+            return self.organizations.iloc[0:0]
+        payload_hash = self.postings.at[posting_id, 'payload_hash']
+        if pd.isna(payload_hash) or payload_hash not in self.payloads.index:
+            return self.organizations.iloc[0:0]
+        org_ids = self.payloads.at[payload_hash, 'organization_ids']
+        return self.organizations.reindex(org_ids).dropna(subset=['title'])
+
+
+def main():
+    """공고 상세 저장소 생성 CLI
+
+    예) python -m utils.posting_store premium_remember_jobs_20250527_220128.csv --output data/postings
+    """
+    parser = argparse.ArgumentParser(description="공고소개 페이로드를 정규화된 Parquet 저장소로 변환")
+    parser.add_argument('csv', help="리멤버 채용공고 CSV 경로")
+    parser.add_argument('--output', default=DEFAULT_STORE_DIR, help="저장소 디렉토리")
+    parser.add_argument('--workers', type=int, default=None, help="파싱 프로세스 수")
+    args = parser.parse_args()
+
+    counts = build_posting_store(args.csv, args.output, args.workers)
+    print(f"공고 {counts['postings']:,}건 · 고유 페이로드 {counts['payloads']:,}건 · "
+          f"기업 {counts['organizations']:,}곳 → {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+"""
+재실행 프로파일러 오버레이 (개발용)
+
+DASHBOARD_PROFILE=1 환경 변수나 ?profile=1 쿼리 파라미터로 켜면 Streamlit 재실행 한 번을
+cProfile + 스택 샘플링으로 감싸고, 사이드바에 다음 내역을 보여줍니다.
+
+- render_* 함수별 소요 시간 (utils.metrics의 @timed 기록, 중첩 호출은 포함 시간)
+- 패키지별 자체 실행 시간 (pandas / numpy / pyarrow / plotly / streamlit / 앱 코드 / 내장 함수 / 기타)과 Plotly JSON 직렬화 시간
+- 차트별 전송 바이트 (st.plotly_chart에 넘긴 Figure의 JSON 크기)
+- 자체 실행 시간 상위 N개 함수
+
+최근 keep개의 프로파일은 로그 디렉토리(docker-compose의 ./logs 볼륨)에 저장합니다.
+- *.prof  : pstats 파일 (snakeviz, flameprof 등으로 열기)
+- *.folded: 샘플링한 접힌 스택(collapsed stack) 파일 (flamegraph.pl, speedscope로 바로 열기)
+
+차트 크기를 재려고 Figure를 한 번 더 직렬화하므로, 켜져 있는 동안에는 렌더링 시간이 조금 늘어납니다.
+"""
+
+import cProfile
+import functools
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+import plotly.io as pio
+import streamlit as st
+
+from config import PROFILER_CONFIG
+from utils.metrics import collect_timings
+
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGES = ('pandas', 'numpy', 'pyarrow', 'plotly', 'streamlit')
+
+_local = threading.local()
+_chart_hook_lock = threading.Lock()
+
+
+@dataclass
+class RerunProfile:
+    """재실행 한 번의 프로파일 요약"""
+    page: str
+    started_at: datetime
+    wall_seconds: float
+    render_seconds: Dict[str, float]
+    package_seconds: Dict[str, float]
+    plotly_json_seconds: float
+    chart_bytes: List[Tuple[str, int]]
+    hot_functions: pd.DataFrame
+    files: List[str] = field(default_factory=list)
+
+
+def profiling_requested() -> bool:
+    """환경 변수 또는 쿼리 파라미터로 프로파일러가 켜져 있는지"""
+    if PROFILER_CONFIG['enabled']:
+        return True
+    try:
+        return st.query_params.get(PROFILER_CONFIG['query_param']) in ('1', 'true')
+    except Exception:
+        return False  # 스크립트 실행 컨텍스트 밖
+
+
+def _package(filename: str) -> str:
+    if filename == '~' or filename.startswith('<'):
+        return '내장 함수'  # C 함수/동적 코드 (파일 경로 없음)
+    path = filename.replace('\\', '/')
+    for package in PACKAGES:
+        if f"/{package}/" in path:
+            return package
+    if os.path.abspath(filename).startswith(APP_ROOT) and '/site-packages/' not in path:
+        return '앱 코드'
+    return '기타'
+
+
+def _install_chart_hook():
+    """st.plotly_chart를 감싸 프로파일 중인 스레드에서만 Figure JSON 크기 기록 (한 번만 설치)"""
+    with _chart_hook_lock:
+        if getattr(st.plotly_chart, '_profiler_hook', False):
+            return
+        original = st.plotly_chart
+
+        @functools.wraps(original)
+        def plotly_chart(figure_or_data, *args, **kwargs):
+            charts = getattr(_local, 'charts', None)
+            if charts is not None:
+                try:
+                    title = figure_or_data.layout.title.text
+                except AttributeError:
+                    title = None
+                size = len(pio.to_json(figure_or_data, validate=False).encode())
+                charts.append((title or kwargs.get('key') or f"차트 {len(charts) + 1}", size))
+            return original(figure_or_data, *args, **kwargs)
+
+        plotly_chart._profiler_hook = True
+        st.plotly_chart = plotly_chart
+
+
+class _StackSampler:
+    """대상 스레드의 호출 스택을 주기적으로 샘플링해 접힌 스택 횟수로 모음"""
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='profile-sampler', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if names:
+                self.stacks[';'.join(reversed(names))] += 1
+
+    def folded(self) -> str:
+        return ''.join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+def _summarize(stats: pstats.Stats, top_n: int) -> Tuple[Dict[str, float], float, pd.DataFrame]:
+    package_seconds: Dict[str, float] = {}
+    plotly_json = 0.0
+    rows = []
+    for (filename, lineno, name), (_, calls, tottime, cumtime, _) in stats.stats.items():
+        package = _package(filename)
+        package_seconds[package] = package_seconds.get(package, 0.0) + tottime
+        if package == 'plotly' and name == 'to_json' and filename.replace('\\', '/').endswith('io/_json.py'):
+            plotly_json += cumtime
+        rows.append((f"{name} ({os.path.basename(filename)}:{lineno})", package, calls, tottime, cumtime))
+    hot = (
+        pd.DataFrame(rows, columns=['function', 'package', 'calls', 'tottime', 'cumtime'])
+        .nlargest(top_n, 'tottime')
+        .reset_index(drop=True)
+    )
+    return dict(sorted(package_seconds.items(), key=lambda item: -item[1])), plotly_json, hot
+
+
+def _write_files(profiler: cProfile.Profile, sampler: _StackSampler, page: str, started_at: datetime,
+                 log_dir: str, keep: int) -> List[str]:
+    os.makedirs(log_dir, exist_ok=True)
+    base = os.path.join(log_dir, f"{started_at:%Y%m%d_%H%M%S_%f}-{page}")
+    profiler.dump_stats(f"{base}.prof")
+    with open(f"{base}.folded", 'w', encoding='utf-8') as f:
+        f.write(sampler.folded())
+
+    # 최근 keep개 프로파일(.prof/.folded 쌍)만 남김
+    bases = sorted({entry.name.rsplit('.', 1)[0] for entry in os.scandir(log_dir)
+                    if entry.name.endswith(('.prof', '.folded'))})
+    for stale in bases[:-keep] if keep else bases:
+        for suffix in ('.prof', '.folded'):
+            try:
+                os.remove(os.path.join(log_dir, stale + suffix))
+            except FileNotFoundError:
+                pass
+    return [f"{base}.prof", f"{base}.folded"]
+
+
+@contextmanager
+def profile_rerun(page: str, enabled: Optional[bool] = None) -> Iterator[None]:
+    """재실행 한 번을 프로파일하고 끝나면 사이드바에 내역 표시 (꺼져 있으면 그대로 실행)"""
+    if not (profiling_requested() if enabled is None else enabled):
+        yield
+        return
+
+    _install_chart_hook()
+    started_at = datetime.now()
+    profiler = cProfile.Profile()
+    sampler = _StackSampler(threading.get_ident(), PROFILER_CONFIG['sample_interval'])
+    _local.charts = charts = []
+    started = time.perf_counter()
+    with collect_timings() as timings:
+        sampler.start()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            sampler.stop()
+            _local.charts = None
+    wall_seconds = time.perf_counter() - started
+
+    package_seconds, plotly_json, hot = _summarize(pstats.Stats(profiler), PROFILER_CONFIG['top_n'])
+    profile = RerunProfile(
+        page=page,
+        started_at=started_at,
+        wall_seconds=wall_seconds,
+        render_seconds={name: sum(values) for (stage, name), values in timings.items() if stage == 'render'},
+        package_seconds=package_seconds,
+        plotly_json_seconds=plotly_json,
+        chart_bytes=charts,
+        hot_functions=hot,
+    )
+    try:
+        profile.files = _write_files(profiler, sampler, page, started_at,
+                                     PROFILER_CONFIG['log_dir'], PROFILER_CONFIG['keep'])
+    except OSError as e:
+        st.sidebar.warning(f"프로파일 파일을 저장하지 못했습니다: {e}")
+    render_profile_panel(profile)
+
+
+def render_profile_panel(profile: RerunProfile):
+    """사이드바 프로파일 내역 패널"""
+    with st.sidebar.expander(f"🔬 재실행 프로파일 ({profile.wall_seconds * 1000:,.0f}ms)", expanded=True):
+        st.caption(f"{profile.page} · {profile.started_at:%H:%M:%S}")
+
+        if profile.render_seconds:
+            st.markdown("**화면 함수별 시간 (ms, 포함 시간)**")
+            render_df = pd.Series(profile.render_seconds).sort_values(ascending=False).mul(1000).round(1)
+            st.dataframe(render_df.rename('ms').rename_axis('함수').reset_index(), hide_index=True)
+
+        st.markdown("**패키지별 자체 시간 (ms)**")
+        package_df = pd.Series(profile.package_seconds).mul(1000).round(1)
+        st.dataframe(package_df.rename('ms').rename_axis('패키지').reset_index(), hide_index=True)
+        st.caption(f"Plotly JSON 직렬화 {profile.plotly_json_seconds * 1000:,.1f}ms")
+
+        if profile.chart_bytes:
+            st.markdown("**차트별 전송 크기**")
+            chart_df = pd.DataFrame(profile.chart_bytes, columns=['차트', 'bytes'])
+            chart_df['KB'] = (chart_df.pop('bytes') / 1024).round(1)
+            st.dataframe(chart_df, hide_index=True)
+            st.caption(f"합계 {chart_df['KB'].sum():,.1f}KB")
+
+        st.markdown(f"**자체 시간 상위 {len(profile.hot_functions)}개 함수**")
+        hot = profile.hot_functions.assign(
+            tottime=lambda df: (df['tottime'] * 1000).round(2),
+            cumtime=lambda df: (df['cumtime'] * 1000).round(2),
+        ).rename(columns={'function': '함수', 'package': '패키지', 'calls': '호출', 'tottime': '자체(ms)',
+                          'cumtime': '누적(ms)'})
+        st.dataframe(hot, hide_index=True)
+
+        for path in profile.files:
+            st.caption(f"💾 {path}")
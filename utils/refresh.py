@@ -0,0 +1,162 @@
+"""
+백그라운드 데이터 새로고침 모듈
+
+Streamlit 스크립트 스레드에서 데이터 생성/CSV 로드/집계 구조 생성을 하면 캐시가 만료될 때마다
+첫 요청이 그 시간만큼 기다립니다. BackgroundRefresher는 별도 데몬 스레드에서 주기(REFRESH_INTERVALS)보다
+조금 일찍 데이터를 다시 만들고, 완성된 스냅샷으로 참조 하나만 바꿔 끼웁니다(원자적 교체).
+화면 재실행은 항상 준비된 스냅샷을 읽으며, 최초 스냅샷이 만들어지기 전에만 기다립니다.
+
+- 빌드가 실패하면 이전 스냅샷을 유지하고 retry_seconds 후 다시 시도합니다.
+- build(previous)에는 직전 스냅샷 값(최초는 None)이 전달되어 증분 갱신이나 캐시 재사용에 쓸 수 있습니다.
+- changed를 주면 poll_seconds마다 그 값(예: 파일 수정 시각)을 비교해 바뀌면 주기 전이라도 다시 만듭니다.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from config import REFRESH_CONFIG, REFRESH_INTERVALS
+
+logger = logging.getLogger(__name__)
+
+_UNSET = object()
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """한 번의 빌드 결과 (교체 후에도 읽던 쪽은 이전 스냅샷을 그대로 사용)"""
+    generation: int
+    value: Any
+    built_at: float
+    build_seconds: float
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.built_at
+
+
+class BackgroundRefresher:
+    """주기적으로 build()를 호출해 스냅샷을 미리 교체하는 데몬 스레드"""
+
+    def __init__(self, name: str, build: Callable[[Optional[Any]], Any], interval: float,
+                 lead_ratio: float = REFRESH_CONFIG['lead_ratio'],
+                 retry_seconds: float = REFRESH_CONFIG['retry_seconds'],
+                 changed: Optional[Callable[[], Any]] = None,
+                 poll_seconds: float = REFRESH_INTERVALS['real_time']):
+        self.name = name
+        self.build = build
+        self.interval = interval
+        self.lead = interval * lead_ratio  # 만료 전에 미리 다시 만드는 여유 시간
+        self.retry_seconds = retry_seconds
+        self.changed = changed
+        self.poll_seconds = poll_seconds
+        self.last_error: Optional[BaseException] = None
+
+        self._snapshot: Optional[Snapshot] = None
+        self._token = _UNSET
+        self._forced = False
+        self._ready = threading.Event()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._build_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> 'BackgroundRefresher':
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name=f"refresh-{self.name}", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def request_refresh(self, version: Optional[str] = None):
+        """다음 주기를 기다리지 않고 백그라운드에서 바로 다시 만들기 (집계 캐시 무효화 콜백으로도 등록)"""
+        self._forced = True
+        self._wake.set()
+
+    def current(self, timeout: Optional[float] = None) -> Snapshot:
+        """가장 최근 스냅샷 (최초 빌드 전이면 완료될 때까지 대기, 최초 빌드가 실패하면 그 예외를 전달)"""
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+        self.start()
+        if not self._ready.wait(timeout):
+            raise TimeoutError(f"'{self.name}' 데이터가 아직 준비되지 않았습니다")
+        if self._snapshot is None:
+            raise RuntimeError(f"'{self.name}' 데이터를 만들지 못했습니다") from self.last_error
+        return self._snapshot
+
+    def refresh(self) -> Snapshot:
+        """지금 스레드에서 다시 만들어 교체 (동시에 호출되면 한 번만 빌드)"""
+        with self._build_lock:
+            self._forced = False
+            token = self.changed() if self.changed is not None else _UNSET
+            previous = self._snapshot
+            started = time.perf_counter()
+            value = self.build(previous.value if previous is not None else None)
+            snapshot = Snapshot(
+                generation=previous.generation + 1 if previous is not None else 1,
+                value=value,
+                built_at=time.time(),
+                build_seconds=time.perf_counter() - started
+            )
+            self._snapshot = snapshot  # 참조 교체 한 번으로 새 스냅샷 공개
+            self._token = token
+            self.last_error = None
+            return snapshot
+
+    def _due(self) -> bool:
+        snapshot = self._snapshot
+        if snapshot is None or self._forced:
+            return True
+        if self.changed is not None:
+            try:
+                if self.changed() != self._token:
+                    return True
+            except Exception as e:
+                logger.warning("'%s' 변경 여부를 확인하지 못했습니다: %s", self.name, e)
+        return snapshot.age >= self.interval - self.lead
+
+    def _run(self):
+        while not self._stop.is_set():
+            failed = False
+            if self._due():
+                try:
+                    snapshot = self.refresh()
+                    logger.info("'%s' 스냅샷 %d 교체 (%.2f초)", self.name, snapshot.generation,
+                                snapshot.build_seconds)
+                except Exception as e:
+                    self.last_error = e
+                    failed = True
+                    logger.exception("'%s' 새로고침 실패, 이전 스냅샷을 유지합니다", self.name)
+                finally:
+                    self._ready.set()
+
+            if failed or self._snapshot is None:
+                wait = self.retry_seconds
+            else:
+                wait = max(0.0, self.interval - self.lead - self._snapshot.age)
+                if self.changed is not None:
+                    wait = min(wait, self.poll_seconds)  # 변경 감지는 더 자주 확인
+            self._wake.wait(wait)
+            self._wake.clear()
+
+
+_refreshers: Dict[str, BackgroundRefresher] = {}
+_refreshers_lock = threading.Lock()
+
+
+def get_refresher(name: str, build: Callable[[Optional[Any]], Any], interval: float, **kwargs) -> BackgroundRefresher:
+    """이름별 프로세스 공용 refresher (처음 호출할 때 만들고 스레드 시작)"""
+    with _refreshers_lock:
+        refresher = _refreshers.get(name)
+        if refresher is None:
+            refresher = _refreshers[name] = BackgroundRefresher(name, build, interval, **kwargs)
+        return refresher.start()
@@ -0,0 +1,115 @@
+"""
+리멤버 채용공고 CSV 로더 모듈
+
+대시보드에 필요한 요약 컬럼만 읽고, 공고소개 등 대용량 텍스트/JSON 컬럼은
+상세 보기에서 요청할 때만 스트리밍으로 읽습니다.
+"""
+
+import os
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple, Union, IO
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+
+# 요약 화면에서 사용하는 컬럼과 타입
+SUMMARY_COLUMNS: Dict[str, pa.DataType] = {
+    '공고ID': pa.int64(),
+    '회사명': pa.string(),
+    '직무': pa.string(),
+    '공고시작일': pa.string(),
+}
+
+# 행마다 직렬화된 페이지 데이터가 들어 있는 대용량 컬럼
+HEAVY_COLUMNS: List[str] = ['공고소개', '주요업무', '자격요건', '우대사항', '채용절차']
+
+CsvSource = Union[str, os.PathLike, IO]
+
+
+@dataclass
+class LoadReport:
+    """파일별 로딩 통계"""
+    source: str
+    rows: int
+    columns: int
+    parse_seconds: float
+    peak_memory_mb: float
+
+
+def _source_name(source: CsvSource) -> str:
+    return getattr(source, 'name', None) or os.path.basename(str(source))
+
+
+def rewind(source: CsvSource):
+    """업로드된 파일 객체는 다시 읽을 수 있도록 처음으로 이동"""
+    if hasattr(source, 'seek'):
+        source.seek(0)
+
+
+def load_postings_summary(source: CsvSource, columns: Dict[str, pa.DataType] = None) -> Tuple[pd.DataFrame, LoadReport]:
+    """요약 컬럼만 투영해서 공고 목록 로드
+
+    파싱 시간과 최대 메모리(Arrow 메모리 풀 + pandas 변환 시 Python 할당)를 함께 반환합니다.
+    """
+    columns = columns or SUMMARY_COLUMNS
+    rewind(source)
+
+    pool = pa.proxy_memory_pool(pa.default_memory_pool())
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    try:
+        table = pacsv.read_csv(
+            source,
+            convert_options=pacsv.ConvertOptions(include_columns=list(columns), column_types=columns),
+            memory_pool=pool,
+        )
+        # 측정용 풀은 함수 종료와 함께 사라지므로 결과는 기본 풀로 복사해서 반환
+        table = pc.take(table, pa.array(np.arange(table.num_rows)),
+                        memory_pool=pa.default_memory_pool())
+        df = table.to_pandas()
+        elapsed = time.perf_counter() - start
+        _, traced_peak = tracemalloc.get_traced_memory()
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+
+    report = LoadReport(
+        source=_source_name(source),
+        rows=len(df),
+        columns=len(df.columns),
+        parse_seconds=elapsed,
+        peak_memory_mb=(pool.max_memory() + traced_peak) / 1024 / 1024,
+    )
+    return df, report
+
+
+def load_posting_details(source: CsvSource, posting_ids: Iterable[int], columns: List[str] = None) -> pd.DataFrame:
+    """지정한 공고ID의 대용량 컬럼만 배치 단위로 스트리밍하여 로드"""
+    columns = columns or HEAVY_COLUMNS
+    wanted_ids = pa.array([int(pid) for pid in posting_ids], type=pa.int64())
+    rewind(source)
+
+    reader = pacsv.open_csv(
+        source,
+        convert_options=pacsv.ConvertOptions(
+            include_columns=['공고ID'] + columns,
+            column_types={'공고ID': pa.int64(), **{col: pa.string() for col in columns}},
+        ),
+    )
+    matches = []
+    for batch in reader:
+        hit = batch.filter(pc.is_in(batch.column('공고ID'), value_set=wanted_ids))
+        if hit.num_rows:
+            matches.append(hit)
+
+    if not matches:
+        return pd.DataFrame(columns=['공고ID'] + columns)
+    return pa.Table.from_batches(matches).to_pandas()
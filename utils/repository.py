@@ -0,0 +1,532 @@
+"""
+지원자 저장소(DB) 모듈
+
+지원자/채널/퍼널 데이터를 PostgreSQL(운영) 또는 SQLite(로컬 대체)에서 조회합니다.
+사이드바 필터·검색·페이지네이션은 WHERE/LIMIT/OFFSET으로, KPI·채널 성과·퍼널은 GROUP BY 집계로
+DB에서 계산하고 작은 결과만 가져오므로 전체 지원자 행을 프로세스 메모리에 올리지 않습니다.
+
+- ConnectionPool: 최대 연결 수가 정해진 풀 (모두 사용 중이면 pool_timeout초 대기 후 TimeoutError)
+- 같은 SQL 문자열을 재사용하므로 PostgreSQL은 prepare=True로 서버 측 준비 구문을,
+  SQLite는 연결별 구문 캐시(cached_statements)를 사용합니다.
+- 큰 결과는 iter_batches로 PostgreSQL 서버 측(이름 있는) 커서 / SQLite fetchmany 단위로 나눠 가져옵니다.
+- RepositoryFunnel / RepositoryChannelROI는 FunnelEngine / ChannelROI와 같은 조회 메서드를 제공해
+  화면 코드를 그대로 재사용합니다.
+- 행을 추가하면 'candidates' 데이터셋의 새 버전을 공개해 모든 레플리카의 집계 캐시를 무효화합니다.
+
+예) python -m utils.repository --sqlite data/recruitment.db --load-sample 100000
+"""
+
+import argparse
+import os
+import queue
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config import DATABASE_CONFIG, RECRUITMENT_CHANNELS, ROI_WINDOWS
+from utils.aggregate_cache import get_aggregate_cache
+from utils.channel_roi import FrameSpendTable, SpendTable, channel_metrics_frame, load_spend_table, summarize_channels
+from utils.funnel import FUNNEL_DIMENSIONS, REJECTED_STAGE, FunnelEngine
+from utils.metrics import record_rows, track
+from utils.schema import CANDIDATE_CATEGORIES, apply_candidate_schema
+from utils.search_index import SEARCH_FIELDS
+
+CANDIDATE_COLUMNS = [
+    'id', 'name', 'position', 'status', 'experience', 'location', 'resume_score', 'rating',
+    'applied_date', 'email', 'phone', 'salary_expectation', 'skills', 'source', 'previous_company',
+    'education', 'portfolio_url', 'github_url', 'linkedin_url', 'interview_date', 'notes'
+]
+DATETIME_COLUMNS = ['applied_date', 'interview_date']
+FILTER_COLUMNS = ['position', 'status', 'experience', 'location', 'source', 'education']  # WHERE에 쓸 수 있는 컬럼
+HIRED_STATUS = '합격'
+_SQLITE_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S.%f'
+
+# PostgreSQL은 init.sql, SQLite는 create_schema()로 생성 (컬럼 정의는 동일하게 유지)
+SCHEMA_SQL = [
+    """CREATE TABLE IF NOT EXISTS candidates (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        position TEXT NOT NULL,
+        status TEXT NOT NULL,
+        experience TEXT,
+        location TEXT,
+        resume_score INTEGER,
+        rating REAL,
+        applied_date TIMESTAMP NOT NULL,
+        email TEXT,
+        phone TEXT,
+        salary_expectation INTEGER,
+        skills TEXT,
+        source TEXT,
+        previous_company TEXT,
+        education TEXT,
+        portfolio_url TEXT,
+        github_url TEXT,
+        linkedin_url TEXT,
+        interview_date TIMESTAMP,
+        notes TEXT
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_candidates_applied_date ON candidates (applied_date DESC, id)",
+    "CREATE INDEX IF NOT EXISTS idx_candidates_status ON candidates (status)",
+    "CREATE INDEX IF NOT EXISTS idx_candidates_position ON candidates (position)",
+    "CREATE INDEX IF NOT EXISTS idx_candidates_source_applied ON candidates (source, applied_date)",
+    """CREATE TABLE IF NOT EXISTS channel_spend (
+        date DATE NOT NULL,
+        channel TEXT NOT NULL,
+        cost BIGINT NOT NULL,
+        PRIMARY KEY (date, channel)
+    )""",
+]
+
+
+class SQLiteDialect:
+    """로컬/테스트용 SQLite (파일 경로 필요: ':memory:'는 연결마다 다른 DB가 되어 풀과 함께 쓸 수 없음)"""
+    name = 'sqlite'
+    placeholder = '?'
+    like = 'LIKE'  # SQLite LIKE는 ASCII 대소문자를 구분하지 않음
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def connect(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # 풀이 연결을 스레드 간에 넘기므로 check_same_thread 해제 (한 번에 한 스레드만 사용)
+        conn = sqlite3.connect(self.path, check_same_thread=False, cached_statements=256)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def execute(self, cursor, sql: str, params: Sequence[Any] = ()):
+        cursor.execute(sql, params)  # 같은 SQL 문자열은 연결의 구문 캐시에서 재사용
+
+    def stream_cursor(self, conn):
+        return conn.cursor()
+
+    def day(self, column: str) -> str:
+        return f"date({column})"
+
+    def to_param(self, value: Any) -> Any:
+        # 문자열 비교가 시간 순서와 같도록 항상 같은 형식으로 저장/비교
+        if isinstance(value, (datetime, pd.Timestamp)):
+            return value.strftime(_SQLITE_DATETIME_FORMAT)
+        return value
+
+    def datetime_column(self, series: pd.Series) -> pd.Series:
+        return series.dt.strftime(_SQLITE_DATETIME_FORMAT)
+
+
+class PostgresDialect:
+    """운영용 PostgreSQL (psycopg 3 필요)"""
+    name = 'postgres'
+    placeholder = '%s'
+    like = 'ILIKE'
+
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+
+    def connect(self):
+        import psycopg  # 선택 의존성: DB 저장소를 쓸 때만 필요
+
+        return psycopg.connect(
+            host=self.config['host'], port=self.config['port'], dbname=self.config['database'],
+            user=self.config['user'], password=self.config['password'],
+            options=f"-c statement_timeout={self.config['statement_timeout_ms']}"
+        )
+
+    def execute(self, cursor, sql: str, params: Sequence[Any] = ()):
+        cursor.execute(sql, params, prepare=True)  # 서버 측 준비 구문으로 파싱/계획 재사용
+
+    def stream_cursor(self, conn):
+        cursor = conn.cursor(name=f"stream_{uuid.uuid4().hex}")  # 서버 측 커서: 결과를 나눠서 전송
+        cursor.itersize = self.config['fetch_batch_size']
+        return cursor
+
+    def day(self, column: str) -> str:
+        return f"CAST({column} AS DATE)"
+
+    def to_param(self, value: Any) -> Any:
+        return value.to_pydatetime() if isinstance(value, pd.Timestamp) else value
+
+    def datetime_column(self, series: pd.Series) -> pd.Series:
+        return pd.Series(series.dt.to_pydatetime(), index=series.index, dtype=object)
+
+
+class ConnectionPool:
+    """최대 max_size개 연결을 재사용하는 풀 (블록이 끝나면 커밋, 오류면 롤백 후 반환)"""
+
+    def __init__(self, connect: Callable[[], Any], max_size: int = DATABASE_CONFIG['pool_size'],
+                 timeout: float = DATABASE_CONFIG['pool_timeout']):
+        self._connect = connect
+        self.max_size = max_size
+        self.timeout = timeout
+        self._idle: 'queue.LifoQueue[Any]' = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self.created = 0
+
+    @contextmanager
+    def connection(self):
+        if not self._slots.acquire(timeout=self.timeout):
+            raise TimeoutError(f"DB 연결 풀이 {self.timeout}초 동안 가득 차 있습니다 (최대 {self.max_size}개)")
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._connect()
+                self.created += 1
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                self._discard_or_reset(conn)
+                raise
+            self._idle.put(conn)
+        finally:
+            self._slots.release()
+
+    def _discard_or_reset(self, conn):
+        """오류가 난 연결은 롤백해서 재사용하고, 롤백도 실패하면 닫음"""
+        try:
+            conn.rollback()
+        except Exception:
+            try:
+                conn.close()
+            except Exception:
+                pass
+            return
+        self._idle.put(conn)
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+def _escape_like(term: str) -> str:
+    return term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+class CandidateRepository:
+    """지원자 테이블 조회 (필터/검색/페이지/집계를 SQL로 실행)"""
+
+    def __init__(self, pool: ConnectionPool, dialect, search_fields: Iterable[str] = SEARCH_FIELDS,
+                 fetch_batch_size: int = DATABASE_CONFIG['fetch_batch_size']):
+        self.pool = pool
+        self.dialect = dialect
+        self.search_fields = [field for field in search_fields if field in CANDIDATE_COLUMNS]
+        self.fetch_batch_size = fetch_batch_size
+        self._values: Dict[str, List[Any]] = {}
+
+    # ---- 스키마 / 적재 ----
+
+    def create_schema(self):
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            for statement in SCHEMA_SQL:
+                cursor.execute(statement)
+
+    def _rows(self, df: pd.DataFrame, columns: List[str]) -> List[Tuple]:
+        values = []
+        for column in columns:
+            series = df[column]
+            if column in DATETIME_COLUMNS:
+                series = self.dialect.datetime_column(pd.to_datetime(series))
+            values.append(series.astype(object).where(series.notna(), None).tolist())
+        return list(zip(*values))
+
+    def insert_candidates(self, df: pd.DataFrame, batch_size: Optional[int] = None) -> int:
+        """지원자 행 추가 (batch_size행씩 executemany)"""
+        batch_size = batch_size or self.fetch_batch_size
+        sql = (f"INSERT INTO candidates ({', '.join(CANDIDATE_COLUMNS)}) "
+               f"VALUES ({', '.join([self.dialect.placeholder] * len(CANDIDATE_COLUMNS))})")
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(df), batch_size):
+                cursor.executemany(sql, self._rows(df.iloc[start:start + batch_size], CANDIDATE_COLUMNS))
+        self.clear_cached_values()
+        get_aggregate_cache().publish_version('candidates')
+        return len(df)
+
+    def insert_spend(self, spend_df: pd.DataFrame):
+        """채널 광고비 집행 내역 (date, channel, cost) 추가"""
+        frame = spend_df.assign(date=pd.to_datetime(spend_df['date']).dt.strftime('%Y-%m-%d'))
+        p = self.dialect.placeholder
+        with self.pool.connection() as conn:
+            conn.cursor().executemany(f"INSERT INTO channel_spend (date, channel, cost) VALUES ({p}, {p}, {p})",
+                                      self._rows(frame, ['date', 'channel', 'cost']))
+        get_aggregate_cache().publish_version('candidates')
+
+    def clear_cached_values(self, version: Optional[str] = None):
+        """필터 옵션 캐시 비우기 (다른 프로세스가 새 데이터셋 버전을 공개했을 때도 호출)"""
+        self._values.clear()
+
+    # ---- 조회 공통 ----
+
+    def _query(self, sql: str, params: Sequence[Any] = ()) -> List[Tuple]:
+        with track('query', self.dialect.name), self.pool.connection() as conn:
+            cursor = conn.cursor()
+            self.dialect.execute(cursor, sql, params)
+            rows = cursor.fetchall()
+        record_rows('query', self.dialect.name, len(rows))
+        return rows
+
+    def _frame(self, rows: List[Tuple], columns: List[str]) -> pd.DataFrame:
+        df = pd.DataFrame.from_records(rows, columns=columns)
+        for column in DATETIME_COLUMNS:
+            if column in df:
+                df[column] = pd.to_datetime(df[column], format='ISO8601')
+        return apply_candidate_schema(df)
+
+    def values(self, column: str) -> List[Any]:
+        """필터 옵션으로 쓸 컬럼 값 목록 (어휘가 있으면 어휘 순서, 적재 전까지 캐시)"""
+        if column not in FILTER_COLUMNS:
+            raise ValueError(f"필터할 수 없는 컬럼입니다: {column}")
+        if column not in self._values:
+            found = {row[0] for row in self._query(f"SELECT DISTINCT {column} FROM candidates") if row[0] is not None}
+            vocabulary = CANDIDATE_CATEGORIES.get(column)
+            order = list(vocabulary.categories) if vocabulary is not None else sorted(found)
+            self._values[column] = [value for value in order if value in found]
+        return list(self._values[column])
+
+    def _where(self, selections: Optional[Dict[str, Iterable[Any]]] = None,
+               search: Optional[str] = None) -> Tuple[str, List[Any]]:
+        """선택 값/검색어를 WHERE 절과 파라미터로 변환 (전체 선택인 컬럼은 조건 없음)"""
+        p = self.dialect.placeholder
+        clauses, params = [], []
+        for column, selected in (selections or {}).items():
+            selected = list(selected)
+            if column == 'month':
+                ranges = []
+                for month in selected:
+                    start = pd.Timestamp(f"{month}-01")
+                    ranges.append(f"(applied_date >= {p} AND applied_date < {p})")
+                    params += [self.dialect.to_param(start), self.dialect.to_param(start + pd.offsets.MonthBegin())]
+                clauses.append(f"({' OR '.join(ranges)})" if ranges else "1 = 0")
+                continue
+            if column not in FILTER_COLUMNS or set(self.values(column)) <= set(selected):
+                continue
+            if not selected:
+                clauses.append("1 = 0")
+                continue
+            clauses.append(f"{column} IN ({', '.join([p] * len(selected))})")
+            params += selected
+
+        # 검색어는 공백으로 나눈 단어마다 검색 필드 중 하나에 포함되어야 함
+        for word in (search or '').split():
+            pattern = f"%{_escape_like(word)}%"
+            clauses.append('(' + ' OR '.join(f"{field} {self.dialect.like} {p} ESCAPE '\\'"
+                                             for field in self.search_fields) + ')')
+            params += [pattern] * len(self.search_fields)
+        return (f"WHERE {' AND '.join(clauses)}" if clauses else ''), params
+
+    # ---- 지원자 목록 ----
+
+    def count(self, selections: Optional[Dict[str, Iterable[Any]]] = None, search: Optional[str] = None) -> int:
+        where, params = self._where(selections, search)
+        return int(self._query(f"SELECT COUNT(*) FROM candidates {where}", params)[0][0])
+
+    def page(self, selections: Optional[Dict[str, Iterable[Any]]] = None, search: Optional[str] = None,
+             page: int = 0, per_page: int = 20, columns: Sequence[str] = CANDIDATE_COLUMNS) -> pd.DataFrame:
+        """최근 지원 순 page번째 페이지 (0부터)"""
+        where, params = self._where(selections, search)
+        p = self.dialect.placeholder
+        rows = self._query(
+            f"SELECT {', '.join(columns)} FROM candidates {where} "
+            f"ORDER BY applied_date DESC, id LIMIT {p} OFFSET {p}",
+            params + [per_page, page * per_page]
+        )
+        return self._frame(rows, list(columns))
+
+    def iter_batches(self, selections: Optional[Dict[str, Iterable[Any]]] = None, search: Optional[str] = None,
+                     columns: Sequence[str] = CANDIDATE_COLUMNS,
+                     batch_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """조건에 맞는 지원자를 batch_size행 프레임 단위로 스트리밍 (전체 결과를 한 번에 가져오지 않음)"""
+        batch_size = batch_size or self.fetch_batch_size
+        where, params = self._where(selections, search)
+        with self.pool.connection() as conn:
+            cursor = self.dialect.stream_cursor(conn)
+            try:
+                cursor.execute(f"SELECT {', '.join(columns)} FROM candidates {where} ORDER BY id", params)
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield self._frame(rows, list(columns))
+            finally:
+                cursor.close()
+
+    def load_frame(self, selections: Optional[Dict[str, Iterable[Any]]] = None,
+                   columns: Sequence[str] = CANDIDATE_COLUMNS) -> pd.DataFrame:
+        frames = list(self.iter_batches(selections, columns=columns))
+        return pd.concat(frames, ignore_index=True) if frames else self._frame([], list(columns))
+
+    # ---- 집계 ----
+
+    def summary(self, selections: Optional[Dict[str, Iterable[Any]]] = None) -> Dict[str, float]:
+        """KPI (total, hired, avg_score)"""
+        where, params = self._where(selections)
+        p = self.dialect.placeholder
+        total, hired, avg_score = self._query(
+            f"SELECT COUNT(*), SUM(CASE WHEN status = {p} THEN 1 ELSE 0 END), AVG(resume_score) "
+            f"FROM candidates {where}",
+            [HIRED_STATUS] + params
+        )[0]
+        return {
+            'total': int(total),
+            'hired': int(hired or 0),
+            'avg_score': float(avg_score) if avg_score is not None else float('nan'),
+        }
+
+    def counts(self, by: str, selections: Optional[Dict[str, Iterable[Any]]] = None,
+               search: Optional[str] = None) -> pd.Series:
+        """컬럼 값별 지원자 수 (어휘 순서, 없는 값은 0)"""
+        if by not in FILTER_COLUMNS:
+            raise ValueError(f"집계할 수 없는 컬럼입니다: {by}")
+        where, params = self._where(selections, search)
+        rows = self._query(f"SELECT {by}, COUNT(*) FROM candidates {where} GROUP BY {by}", params)
+        counts = pd.Series({value: int(n) for value, n in rows}, dtype=np.int64)
+        return counts.reindex(self.values(by), fill_value=0).rename_axis(by)
+
+    def funnel_counts(self, by: Sequence[str] = (),
+                      selections: Optional[Dict[str, Iterable[Any]]] = None) -> pd.DataFrame:
+        """(by 컬럼, status, 지원일(일 단위), n) 집계 행 (월은 지원일에서 계산하므로 GROUP BY하지 않음)"""
+        columns = [column for column in by if column != 'month']
+        for column in columns:
+            if column not in FILTER_COLUMNS:
+                raise ValueError(f"집계할 수 없는 컬럼입니다: {column}")
+        where, params = self._where(selections)
+        day = self.dialect.day('applied_date')
+        keys = ', '.join(columns + ['status', day])
+        rows = self._query(f"SELECT {keys}, COUNT(*) FROM candidates {where} GROUP BY {keys}", params)
+        df = pd.DataFrame.from_records(rows, columns=columns + ['status', 'applied_date', 'n'])
+        df['applied_date'] = pd.to_datetime(df['applied_date'])
+        return apply_candidate_schema(df)  # 그룹 라벨을 어휘 순서로
+
+    def channel_totals(self, start: datetime, end: datetime) -> pd.DataFrame:
+        """[start, end) 지원자의 채널별 (applicants, hired, score_sum)"""
+        p = self.dialect.placeholder
+        rows = self._query(
+            f"SELECT source, COUNT(*), SUM(CASE WHEN status = {p} THEN 1 ELSE 0 END), SUM(resume_score) "
+            f"FROM candidates WHERE applied_date >= {p} AND applied_date < {p} GROUP BY source",
+            [HIRED_STATUS, self.dialect.to_param(start), self.dialect.to_param(end)]
+        )
+        return pd.DataFrame.from_records(rows, columns=['channel', 'applicants', 'hired', 'score_sum'],
+                                         index='channel')
+
+    def spend_table(self) -> SpendTable:
+        """channel_spend 테이블에 집행 내역이 있으면 그 내역, 없으면 기본 광고비 테이블"""
+        rows = self._query("SELECT date, channel, cost FROM channel_spend")
+        if not rows:
+            return load_spend_table()
+        return FrameSpendTable(pd.DataFrame.from_records(rows, columns=['date', 'channel', 'cost']))
+
+
+class RepositoryFunnel:
+    """FunnelEngine과 같은 조회 메서드를 DB 집계로 제공 (지원자 행 대신 상태 × 지원일 집계만 가져옴)"""
+
+    def __init__(self, repository: CandidateRepository, as_of: Optional[datetime] = None):
+        self.repository = repository
+        self.as_of = as_of
+        self.progress_stages = [stage for stage in CANDIDATE_CATEGORIES['status'].categories if stage != REJECTED_STAGE]
+
+    @staticmethod
+    def _funnel_selections(selections):
+        # FunnelEngine과 같게 퍼널 차원(직무/채널/지원 월) 필터만 적용
+        return {dimension: values for dimension, values in (selections or {}).items() if dimension in FUNNEL_DIMENSIONS}
+
+    def funnel(self, by=None, selections: Optional[Dict[str, Iterable[Any]]] = None) -> pd.DataFrame:
+        by = [by] if isinstance(by, str) else list(by or [])
+        rows = self.repository.funnel_counts(by, self._funnel_selections(selections))
+        engine = FunnelEngine(rows, dimensions=by, as_of=self.as_of, weight_column='n')
+        return engine.funnel(by)
+
+    def rejected(self, selections: Optional[Dict[str, Iterable[Any]]] = None) -> int:
+        return self.repository.count({**self._funnel_selections(selections), 'status': [REJECTED_STAGE]})
+
+
+class RepositoryChannelROI:
+    """ChannelROI와 같은 조회 메서드(windows/metrics/summary)를 DB 집계로 제공"""
+
+    def __init__(self, repository: CandidateRepository, channels: Iterable[str] = RECRUITMENT_CHANNELS,
+                 spend_table: Optional[SpendTable] = None, windows: Iterable[int] = ROI_WINDOWS,
+                 as_of: Optional[datetime] = None):
+        self.repository = repository
+        self.channels: List[str] = list(channels)
+        self.spend_table = spend_table if spend_table is not None else repository.spend_table()
+        self.windows: List[int] = sorted(windows)
+        self.latest_day = np.datetime64(as_of or datetime.now(), 'D')
+
+    def metrics(self, window: int) -> pd.DataFrame:
+        """최근 window일 (기준일 포함) 채널별 성과"""
+        if window not in self.windows:
+            raise ValueError(f"지원하지 않는 구간입니다: {window}일 (가능: {self.windows})")
+        days = self.latest_day - window + 1 + np.arange(window)
+        start = pd.Timestamp(days[0])
+        totals = self.repository.channel_totals(start, pd.Timestamp(self.latest_day) + timedelta(days=1))
+        totals = totals.reindex(self.channels, fill_value=0).fillna(0)
+        cost = self.spend_table.daily_cost(self.channels, days).sum(axis=1)
+        return channel_metrics_frame(self.channels, totals['applicants'].to_numpy(), totals['hired'].to_numpy(),
+                                     totals['score_sum'].to_numpy(), cost)
+
+    def summary(self, window: int) -> Dict[str, float]:
+        return summarize_channels(self.metrics(window))
+
+
+def create_repository(config: Dict[str, Any] = DATABASE_CONFIG) -> CandidateRepository:
+    """설정의 backend('postgres' 또는 'sqlite')에 맞는 저장소 생성"""
+    if config['backend'] == 'sqlite':
+        dialect = SQLiteDialect(config['sqlite_path'])
+    elif config['backend'] == 'postgres':
+        dialect = PostgresDialect(config)
+    else:
+        raise ValueError(f"지원하지 않는 DB 백엔드입니다: {config['backend']}")
+    pool = ConnectionPool(dialect.connect, config['pool_size'], config['pool_timeout'])
+    return CandidateRepository(pool, dialect, fetch_batch_size=config['fetch_batch_size'])
+
+
+_default_repository = None
+_default_repository_lock = threading.Lock()
+
+
+def get_repository() -> CandidateRepository:
+    """프로세스 공용 저장소 (연결 풀 공유)"""
+    global _default_repository
+    with _default_repository_lock:
+        if _default_repository is None:
+            _default_repository = create_repository()
+            get_aggregate_cache().on_invalidate('candidates', _default_repository.clear_cached_values)
+        return _default_repository
+
+
+def main():
+    """DB 스키마를 만들고 샘플 지원자를 적재하는 CLI"""
+    from utils.data_generator import DataGenerator
+
+    parser = argparse.ArgumentParser(description="지원자 DB 스키마 생성 및 샘플 데이터 적재")
+    parser.add_argument('--sqlite', help="SQLite 파일 경로 (없으면 DATABASE_CONFIG 사용)")
+    parser.add_argument('--load-sample', type=int, default=0, help="적재할 샘플 지원자 수")
+    parser.add_argument('--chunk-size', type=int, default=None, help="샤드 크기 (기본값: DATA_GENERATOR_CONFIG)")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--workers', type=int, default=None, help="샤드 생성 프로세스 수 (결과에는 영향 없음)")
+    args = parser.parse_args()
+
+    config = dict(DATABASE_CONFIG, backend='sqlite', sqlite_path=args.sqlite) if args.sqlite else DATABASE_CONFIG
+    repository = create_repository(config)
+    repository.create_schema()
+    loaded = 0
+    for chunk in DataGenerator().iter_candidates_chunks(args.load_sample, args.chunk_size, args.seed,
+                                                                args.workers):
+        loaded += repository.insert_candidates(chunk)
+    print(f"{loaded:,}명 적재 완료 ({config['backend']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+지원자 데이터 스키마 모듈
+
+직무/상태/경력/지역/채널/학력/이전 직장은 config.py의 닫힌 어휘에서만 값을 가지므로
+순서가 있는 pd.Categorical(정수 코드 + 어휘 사전)로 저장합니다.
+isin 필터, value_counts, groupby가 문자열 비교 대신 정수 코드로 동작하고 메모리도 크게 줄어듭니다.
+희망연봉(salary_expectation)은 '5000만원' 문자열 대신 만원 단위 정수로 저장합니다.
+"""
+
+from typing import Dict
+
+import pandas as pd
+
+from config import (
+    JOB_CATEGORIES, RECRUITMENT_STAGES, EXPERIENCE_LEVELS, REGIONS,
+    RECRUITMENT_CHANNELS, EDUCATION_LEVELS, PREVIOUS_COMPANIES
+)
+
+ALL_POSITIONS = [position for positions in JOB_CATEGORIES.values() for position in positions]
+
+# 컬럼별 범주형 타입 (어휘 순서 = 정렬 순서)
+CANDIDATE_CATEGORIES: Dict[str, pd.CategoricalDtype] = {
+    'position': pd.CategoricalDtype(ALL_POSITIONS, ordered=True),
+    'status': pd.CategoricalDtype(RECRUITMENT_STAGES, ordered=True),
+    'experience': pd.CategoricalDtype(EXPERIENCE_LEVELS, ordered=True),
+    'location': pd.CategoricalDtype(REGIONS, ordered=True),
+    'source': pd.CategoricalDtype(RECRUITMENT_CHANNELS, ordered=True),
+    'education': pd.CategoricalDtype(EDUCATION_LEVELS, ordered=True),
+    'previous_company': pd.CategoricalDtype(PREVIOUS_COMPANIES, ordered=True),
+}
+
+SALARY_COLUMN = 'salary_expectation'
+
+
+def apply_candidate_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """지원자 프레임을 범주형/정수 스키마로 변환한 사본 반환
+
+    어휘에 없는 값이 있으면 조용히 결측으로 바꾸지 않고 ValueError를 발생시킵니다.
+    """
+    df = df.copy()
+    for column, dtype in CANDIDATE_CATEGORIES.items():
+        if column not in df or df[column].dtype == dtype:
+            continue
+        values = df[column]
+        unknown = values[values.notna() & ~values.isin(dtype.categories)].unique()
+        if len(unknown):
+            raise ValueError(f"'{column}' 컬럼에 어휘에 없는 값이 있습니다: {list(unknown)[:5]}")
+        df[column] = values.astype(dtype)
+
+    if SALARY_COLUMN in df and not pd.api.types.is_integer_dtype(df[SALARY_COLUMN]):
+        salary = df[SALARY_COLUMN].astype(str).str.replace(r'[^0-9]', '', regex=True)
+        df[SALARY_COLUMN] = pd.to_numeric(salary).astype('int64')
+
+    return df
+
+
+def format_salary(value: int) -> str:
+    """만원 단위 정수 희망연봉을 화면 표시용 문자열로 변환"""
+    return f"{value:,}만원"
@@ -0,0 +1,472 @@
+"""
+지원자 전문 검색 인덱스 모듈
+
+이름/직무/스킬/메모/이전 직장 값을 단어로 나누고, 단어의 1~3글자 n-gram으로 역색인을 만듭니다.
+한글 이름('김민수')처럼 공백이 없는 짧은 단어도 '민수' 같은 부분 문자열로 찾을 수 있습니다.
+
+컬럼 값은 반복이 많으므로 고유 값 단위로만 토큰화하고, 행은 값 코드별 행 목록(CSR)으로 찾습니다.
+새 행은 대기 구간에 쌓았다가 일정 크기를 넘으면 기존 행 목록과 병합합니다.
+
+결과는 (점수 내림차순, 행 위치 오름차순)이고 점수는 몇 가지 값뿐이므로, limit이 있고 일치 행이 많으면
+앞쪽 행부터 블록 단위로 점수를 매기다가 가능한 최고 점수의 행이 limit개 모이면 바로 끝냅니다
+(뒤쪽 행은 점수가 같아도 순서가 뒤이므로 결과가 전체 계산과 같음).
+
+인덱스 하나를 여러 세션이 공유하므로 검색끼리는 동시에 돌고, 행 추가/병합은 진행 중인 검색이 끝난 뒤 단독으로 실행합니다.
+"""
+
+import re
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# 검색 대상 컬럼과 가중치 (이름 일치가 메모 일치보다 앞에 오도록)
+SEARCH_FIELDS: Dict[str, float] = {
+    'name': 5.0,
+    'position': 3.0,
+    'previous_company': 2.0,
+    'skills': 2.0,
+    'notes': 1.0,
+}
+
+# 단어 일치 유형별 점수
+EXACT_SCORE, PREFIX_SCORE, SUBSTRING_SCORE = 3.0, 2.0, 1.0
+
+MAX_GRAM = 3
+DENSE_FRACTION = 8  # 예상 일치 행이 전체의 1/8을 넘으면 전체 코드 배열을 순차 조회
+SCAN_BLOCK = 16_384  # 상위 limit개를 앞쪽 행부터 찾을 때의 최대 블록 크기 (최대 전체의 1/DENSE_FRACTION까지 시도)
+MIN_SCAN_BLOCK = 1_024
+TABLE_MAX_VALUES = 65_536  # 고유 값이 이보다 많은 컬럼(메모 등)은 점수표 대신 이진 탐색으로 조회
+_WORD_SPLIT = re.compile(r'[\s,]+')
+
+
+def tokenize(text: str) -> List[str]:
+    """소문자로 바꾼 뒤 공백/쉼표 기준으로 단어 분리"""
+    return [word for word in _WORD_SPLIT.split(str(text).lower()) if word]
+
+
+def ngrams(word: str, max_n: int = MAX_GRAM) -> Set[str]:
+    """단어의 1~max_n 글자 n-gram 집합"""
+    return {word[i:i + n] for n in range(1, max_n + 1) for i in range(len(word) - n + 1)}
+
+
+def _gather(order: np.ndarray, offsets: np.ndarray, value_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """CSR 행 목록에서 여러 값의 행을 한 번에 모으기 (행 위치, 각 행이 속한 value_ids 인덱스)"""
+    starts = offsets[value_ids]
+    lengths = offsets[value_ids + 1] - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    source = np.repeat(np.arange(len(value_ids)), lengths)
+    positions = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths) + starts[source]
+    return order[positions], source
+
+
+def _encode_column(series: pd.Series) -> Tuple[np.ndarray, pa.Array]:
+    """컬럼을 (행별 값 코드, 고유 값 문자열 배열)로 사전 인코딩 (결측은 -1)"""
+    array = pa.array(series.array if isinstance(series.dtype, pd.CategoricalDtype) else series, from_pandas=True)
+    if not pa.types.is_dictionary(array.type):
+        array = pc.dictionary_encode(array.cast(pa.string()))
+    codes = array.indices.to_numpy(zero_copy_only=False)
+    codes = np.where(pd.isna(codes), -1, codes).astype(np.int64) if array.null_count else codes.astype(np.int64)
+    return codes, array.dictionary.cast(pa.string())
+
+
+def _split_words(values: pa.Array) -> Tuple[np.ndarray, pa.Array]:
+    """고유 값들을 단어로 분리 (단어가 속한 값 인덱스, 단어 배열)"""
+    lists = pc.utf8_split_whitespace(pc.replace_substring(pc.utf8_lower(values), ',', ' '))
+    words = pc.list_flatten(lists)
+    parents = pc.list_parent_indices(lists)
+    keep = pc.greater(pc.binary_length(words), 0)
+    return parents.filter(keep).to_numpy(), words.filter(keep)
+
+
+class _ReadWriteLock:
+    """검색(읽기)은 여럿이 함께, 추가/병합(쓰기)은 혼자 잡는 잠금 (쓰기 대기 중에는 새 읽기를 막음)"""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._readers = 0
+        self._writing = False
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read(self):
+        with self._condition:
+            self._condition.wait_for(lambda: not self._writing and not self._waiting_writers)
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self):
+        with self._condition:
+            self._waiting_writers += 1
+            self._condition.wait_for(lambda: not self._writing and not self._readers)
+            self._waiting_writers -= 1
+            self._writing = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
+
+
+class _FieldPostings:
+    """컬럼 하나의 고유 값 사전, 단어→값 목록, 값→행 목록"""
+
+    def __init__(self):
+        self.values = pd.Index([], dtype=object)
+        self.word_values: Dict[int, np.ndarray] = {}
+        self.codes = np.empty(0, dtype=np.int64)  # 전체 행의 값 코드 (결측 -1)
+        self.base_size = 0
+        self.order = np.empty(0, dtype=np.int64)
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.pending: List[np.ndarray] = []
+
+    @property
+    def pending_size(self) -> int:
+        return sum(len(codes) for codes in self.pending)
+
+    def append(self, codes: np.ndarray, merge_ratio: float):
+        self.codes = np.concatenate([self.codes, codes])
+        self.pending.append(codes)
+        if self.pending_size > merge_ratio * self.base_size:
+            self.merge()
+
+    def merge(self):
+        """대기 구간 행을 값→행 목록(CSR)에 병합"""
+        valid = self.codes >= 0
+        self.order = np.flatnonzero(valid)[np.argsort(self.codes[valid], kind='stable')]
+        counts = np.bincount(self.codes[valid], minlength=len(self.values))
+        self.offsets = np.concatenate([[0], np.cumsum(counts)])
+        self.base_size = len(self.codes)
+        self.pending = []
+
+    def _merged(self, value_ids: np.ndarray) -> np.ndarray:
+        """행 목록(CSR)에 이미 있는 값 코드의 위치 (대기 구간에서 처음 나온 값은 제외)"""
+        return np.flatnonzero(value_ids < len(self.offsets) - 1)
+
+    def row_count(self, value_ids: np.ndarray) -> int:
+        """값 코드들에 해당하는 행 수 (대기 구간은 상한으로 추정)"""
+        merged = value_ids[self._merged(value_ids)]
+        return int((self.offsets[merged + 1] - self.offsets[merged]).sum()) + self.pending_size
+
+    def rows(self, value_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """값 코드들에 해당하는 (행 위치, value_ids 인덱스)"""
+        merged = self._merged(value_ids)
+        rows, source = _gather(self.order, self.offsets, value_ids[merged])
+        source = merged[source]
+        start = self.base_size
+        for codes in self.pending:
+            lookup = np.full(len(self.values), -1, dtype=np.int64)
+            lookup[value_ids] = np.arange(len(value_ids))
+            hit = np.flatnonzero((codes >= 0) & (lookup[np.maximum(codes, 0)] >= 0))
+            rows = np.concatenate([rows, hit + start])
+            source = np.concatenate([source, lookup[codes[hit]]])
+            start += len(codes)
+        return rows, source
+
+
+class SearchIndex:
+    """n-gram 역색인 기반 지원자 검색"""
+
+    def __init__(self, df: Optional[pd.DataFrame] = None, fields: Dict[str, float] = SEARCH_FIELDS,
+                 merge_ratio: float = 0.1):
+        self.fields = dict(fields)
+        self.merge_ratio = merge_ratio
+        self.size = 0
+        self.labels = pd.Index([])
+        self._words: List[str] = []
+        self._word_ids: Dict[str, int] = {}
+        self._grams: Dict[str, Set[int]] = defaultdict(set)
+        self._postings = {field: _FieldPostings() for field in self.fields}
+        self._token_cache: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._value_cache: Dict[str, Dict[str, Tuple[np.ndarray, np.ndarray]]] = {}
+        self._estimate_cache: Dict[str, int] = {}
+        # 질의마다 재사용하는 행 단위 작업 배열 (스레드별, 사용한 위치만 다시 0으로 되돌림)
+        self._scratch = threading.local()
+        self._lock = _ReadWriteLock()
+        if df is not None:
+            self.add(df)
+
+    def _word_id(self, word: str) -> int:
+        wid = self._word_ids.get(word)
+        if wid is None:
+            wid = len(self._words)
+            self._words.append(word)
+            self._word_ids[word] = wid
+            for gram in ngrams(word):
+                self._grams[gram].add(wid)
+        return wid
+
+    def add(self, df: pd.DataFrame):
+        """새 행을 인덱스에 추가 (새로 등장한 고유 값만 토큰화, 진행 중인 검색이 끝날 때까지 대기)"""
+        with self._lock.write():
+            self._add(df)
+
+    def _add(self, df: pd.DataFrame):
+        for field, postings in self._postings.items():
+            codes, uniques = _encode_column(df[field])
+            lookup = postings.values.get_indexer(uniques.to_pandas()) if len(postings.values) else \
+                np.full(len(uniques), -1, dtype=np.int64)
+
+            new = np.flatnonzero(lookup < 0)
+            if len(new):
+                new_values = uniques.take(pa.array(new))
+                lookup[new] = len(postings.values) + np.arange(len(new))
+                postings.values = postings.values.append(pd.Index(new_values.to_pylist(), dtype=object))
+
+                # 단어 사전은 작으므로 고유 단어만 Python으로 n-gram 처리
+                parents, words = _split_words(new_values)
+                encoded = pc.dictionary_encode(words)
+                word_lookup = np.array([self._word_id(word) for word in encoded.dictionary.to_pylist()], dtype=np.int64)
+                # (단어, 값) 쌍을 정수 키 하나로 묶어 중복 제거 후 단어별로 분할
+                n_values = len(postings.values)
+                keys = np.unique(word_lookup[encoded.indices.to_numpy()] * n_values + lookup[new][parents])
+                pair_words, pair_values = np.divmod(keys, n_values)
+                wids, starts = np.unique(pair_words, return_index=True)
+                for wid, chunk in zip(wids, np.split(pair_values, starts[1:])):
+                    existing = postings.word_values.get(int(wid))
+                    postings.word_values[int(wid)] = chunk if existing is None else np.concatenate([existing, chunk])
+
+            postings.append(np.where(codes >= 0, lookup[np.maximum(codes, 0)], -1), self.merge_ratio)
+
+        self.size += len(df)
+        self.labels = self.labels.append(df.index) if len(self.labels) else df.index
+        self._token_cache.clear()
+        self._value_cache.clear()
+        self._estimate_cache.clear()
+
+    def _match_words(self, token: str) -> Tuple[np.ndarray, np.ndarray]:
+        """검색어 토큰을 포함하는 단어 id와 일치 점수 (정확 > 접두 > 부분 문자열)"""
+        cached = self._token_cache.get(token)
+        if cached is not None:
+            return cached
+
+        if len(token) <= MAX_GRAM:
+            candidates = self._grams.get(token, set())
+        else:
+            grams = sorted((self._grams.get(token[i:i + MAX_GRAM], set())
+                            for i in range(len(token) - MAX_GRAM + 1)), key=len)
+            candidates = set.intersection(*grams)
+
+        wids, scores = [], []
+        for wid in candidates:
+            word = self._words[wid]
+            if token not in word:
+                continue
+            wids.append(wid)
+            scores.append(EXACT_SCORE if word == token else PREFIX_SCORE if word.startswith(token) else SUBSTRING_SCORE)
+
+        result = (np.asarray(wids, dtype=np.int64), np.asarray(scores, dtype=np.float64))
+        if len(self._token_cache) > 1024:
+            self._token_cache.clear()
+        self._token_cache[token] = result
+        return result
+
+    def _token_values(self, token: str) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """토큰에 일치하는 컬럼별 (값 코드, 값 점수) (값 코드 오름차순, 한 값에 여러 단어가 일치하면 최고 점수)"""
+        cached = self._value_cache.get(token)
+        if cached is not None:
+            return cached
+
+        wids, word_scores = self._match_words(token)
+        result = {}
+        for field, postings in self._postings.items():
+            matched = [(postings.word_values[w], s) for w, s in zip(wids.tolist(), word_scores.tolist())
+                       if w in postings.word_values]
+            if not matched:
+                continue
+            value_ids = np.concatenate([values for values, _ in matched])
+            value_scores = np.concatenate([np.full(len(values), s) for values, s in matched])
+            if len(matched) > 1:
+                value_ids, inverse = np.unique(value_ids, return_inverse=True)
+                best = np.zeros(len(value_ids))
+                np.maximum.at(best, inverse, value_scores)
+                value_scores = best
+            else:
+                order = np.argsort(value_ids, kind='stable')
+                value_ids, value_scores = value_ids[order], value_scores[order]
+            result[field] = (value_ids, value_scores)
+        if len(self._value_cache) > 256:
+            self._value_cache.clear()
+        self._value_cache[token] = result
+        return result
+
+    def _estimate(self, token: str) -> int:
+        """토큰에 일치하는 행 수 추정 (대기 구간은 상한)"""
+        estimate = self._estimate_cache.get(token)
+        if estimate is None:
+            estimate = sum(self._postings[f].row_count(v) for f, (v, _) in self._token_values(token).items())
+            self._estimate_cache[token] = estimate
+        return estimate
+
+    def _scratch_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """현재 스레드의 (점수 누적, 방문 표시) 작업 배열 (행 수가 바뀌면 새로 할당)"""
+        scratch = self._scratch
+        if getattr(scratch, 'size', None) != self.size:
+            scratch.scores = np.zeros(self.size)
+            scratch.seen = np.zeros(self.size, dtype=bool)
+            scratch.size = self.size
+        return scratch.scores, scratch.seen
+
+    def _dense_scores(self, field: str, value_ids: np.ndarray, value_scores: np.ndarray) -> np.ndarray:
+        """값 코드별 가중 점수표 (마지막 칸은 결측 코드 -1용 0점)"""
+        table = np.zeros(len(self._postings[field].values) + 1)
+        table[value_ids] = value_scores * self.fields[field]
+        return table
+
+    def _block_scorer(self, field: str, value_ids: np.ndarray,
+                      value_scores: np.ndarray) -> Callable[[np.ndarray], np.ndarray]:
+        """값 코드 배열 -> 가중 점수 함수 (고유 값이 많은 컬럼은 전체 크기 점수표를 만들지 않음)"""
+        if len(self._postings[field].values) <= TABLE_MAX_VALUES:
+            table = self._dense_scores(field, value_ids, value_scores)
+            return lambda codes: table[codes]
+        ids, weighted = value_ids, value_scores * self.fields[field]  # _token_values가 값 코드 순으로 정렬해 둠
+
+        def score(codes: np.ndarray) -> np.ndarray:
+            pos = np.minimum(np.searchsorted(ids, codes), len(ids) - 1)
+            return np.where(ids[pos] == codes, weighted[pos], 0.0)
+        return score
+
+    @property
+    def _scan_rows(self) -> int:
+        """앞쪽 블록 탐색을 시도할 최대 행 수"""
+        return min(self.size, max(self.size // DENSE_FRACTION, SCAN_BLOCK))
+
+    def _scan_top(self, token_matches: List[Dict[str, Tuple[np.ndarray, np.ndarray]]], limit: int, estimate: float,
+                  within: Optional[np.ndarray]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """앞쪽 행부터 블록 단위로 최고 점수 행 limit개를 찾기 (시도 범위 안에 없으면 None)
+
+        최고 점수는 토큰별·컬럼별 최대 점수의 합이며, 이 점수의 행이 limit개 모이면 그 뒤 행은 결과에 들 수 없습니다.
+        최고 점수 행은 모든 (토큰, 컬럼)에서 최대 점수여야 하므로, 점수표 조회가 싼 컬럼부터 거르고 남은 행만 다음 컬럼을 봅니다.
+        첫 블록은 예상 일치 밀도로 limit의 2배가 나올 만큼만 잡고, 모자라면 두 배씩 늘립니다.
+        """
+        checks = []
+        for matches in token_matches:
+            for field, (value_ids, value_scores) in matches.items():
+                cheap = len(self._postings[field].values) <= TABLE_MAX_VALUES
+                checks.append((not cheap, self._postings[field].codes, self._block_scorer(field, value_ids, value_scores),
+                               value_scores.max() * self.fields[field]))
+        checks.sort(key=lambda check: check[0])
+        best = sum(check[3] for check in checks)
+
+        found, total, start = [], 0, 0
+        block = int(min(SCAN_BLOCK, max(MIN_SCAN_BLOCK, 2 * limit * self.size / max(estimate, 1))))
+        while start < self._scan_rows:
+            end = min(start + block, self.size)
+            rows = np.arange(start, end) if within is None else np.flatnonzero(within[start:end]) + start
+            for _, codes, score, field_best in checks:
+                rows = rows[score(codes[rows]) >= field_best - 1e-9]
+            found.append(rows)
+            total += len(rows)
+            if total >= limit:
+                rows = np.concatenate(found)[:limit]
+                return rows, np.full(len(rows), best)
+            start, block = end, min(block * 2, SCAN_BLOCK)
+        return None
+
+    def _driver_rows(self, matches: Dict[str, Tuple[np.ndarray, np.ndarray]], within: Optional[np.ndarray],
+                     estimate: int) -> Tuple[np.ndarray, np.ndarray]:
+        """가장 선택적인 토큰의 (행 위치, 점수)
+
+        일치 행이 적으면 행 목록(CSR)에서 모으고, 많으면 전체 코드 배열을 한 번 순차 조회합니다.
+        """
+        if estimate * DENSE_FRACTION > self.size:
+            scores = np.zeros(self.size)
+            for field, (value_ids, value_scores) in matches.items():
+                scores += self._dense_scores(field, value_ids, value_scores)[self._postings[field].codes]
+            if within is not None:
+                scores[~within] = 0
+            rows = np.flatnonzero(scores)
+            return rows, scores[rows]
+
+        acc, seen = self._scratch_arrays()
+        collected = []
+        try:
+            for field, (value_ids, value_scores) in matches.items():
+                rows, source = self._postings[field].rows(value_ids)
+                if within is not None:
+                    keep = within[rows]
+                    rows, source = rows[keep], source[keep]
+                acc[rows] += value_scores[source] * self.fields[field]
+                collected.append(rows[~seen[rows]])
+                seen[collected[-1]] = True
+            rows = np.concatenate(collected) if collected else np.empty(0, dtype=np.int64)
+            return rows, acc[rows]
+        finally:
+            for rows in collected:
+                acc[rows] = 0
+                seen[rows] = False
+
+    def search(self, query: str, limit: Optional[int] = None,
+               within: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """검색어의 모든 토큰이 일치하는 행 위치를 점수 순으로 반환 (행 위치, 점수)
+
+        가장 선택적인 토큰으로 후보 행을 만든 뒤, 나머지 토큰은 후보 행의 값 코드로만 점수를 매깁니다.
+        within은 전체 행 길이의 불리언 마스크로, 사이드바 필터 결과 안에서만 찾을 때 사용합니다.
+        """
+        with self._lock.read():
+            return self._search(query, limit, within)
+
+    def _search(self, query: str, limit: Optional[int],
+                within: Optional[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        token_matches = [self._token_values(token) for token in dict.fromkeys(tokenize(query))]
+        if not token_matches or not all(token_matches):
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        estimates = [self._estimate(token) for token in dict.fromkeys(tokenize(query))]
+        order = np.argsort(estimates, kind='stable')
+        token_matches = [token_matches[i] for i in order]
+
+        # 가장 선택적인 토큰도 (필터 안에서) 시도 범위에 limit의 2배 넘게 나올 만큼 흔하면 앞쪽 블록부터 훑어 봄
+        expected = estimates[order[0]]
+        if within is not None and self.size:
+            expected = expected * np.count_nonzero(within) / self.size
+        if limit is not None and limit > 0 and expected * self._scan_rows >= 2 * limit * self.size:
+            top = self._scan_top(token_matches, limit, expected, within)
+            if top is not None:
+                return top
+
+        rows, scores = self._driver_rows(token_matches[0], within, estimates[order[0]])
+        for matches in token_matches[1:]:
+            if len(rows) == 0:
+                break
+            token_scores = np.zeros(len(rows))
+            for field, (value_ids, value_scores) in matches.items():
+                token_scores += self._dense_scores(field, value_ids, value_scores)[self._postings[field].codes[rows]]
+            keep = token_scores > 0
+            rows, scores = rows[keep], scores[keep] + token_scores[keep]
+
+        if limit is not None and limit < len(rows):
+            # limit번째 점수보다 높은 행 전부 + 같은 점수 중 앞쪽 행 (동점을 임의로 고르지 않음)
+            cut = -np.partition(-scores, limit - 1)[limit - 1]
+            above = np.flatnonzero(scores > cut)
+            tied = np.flatnonzero(scores == cut)
+            tied = tied[np.argsort(rows[tied], kind='stable')[:limit - len(above)]]
+            top = np.concatenate([above, tied])
+            rows, scores = rows[top], scores[top]
+        order = np.lexsort((rows, -scores))
+        return rows[order], scores[order]
+
+    def merge(self):
+        """대기 중인 추가 행을 모두 병합"""
+        with self._lock.write():
+            for postings in self._postings.values():
+                if postings.pending:
+                    postings.merge()
+
+    @property
+    def vocabulary_size(self) -> int:
+        return len(self._words)
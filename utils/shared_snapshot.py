@@ -0,0 +1,103 @@
+"""
+공유 데이터셋 스냅샷 모듈
+
+세션/프로세스마다 같은 지원자 프레임을 따로 들고 있으면 동시 사용자 수만큼 메모리가 늘어납니다.
+이 모듈은 데이터셋 버전마다 프레임을 압축하지 않은 Arrow IPC 파일로 한 번 기록하고, 각 프로세스는
+pa.memory_map으로 열어 복사 없이(zero-copy) pandas 프레임으로 씁니다. 같은 호스트의 모든 세션과
+워커 프로세스가 운영체제 페이지 캐시의 같은 버퍼를 공유합니다.
+
+- 매핑된 숫자/날짜 컬럼은 읽기 전용이므로 스냅샷 프레임을 직접 수정하면 오류가 납니다.
+  필요한 값은 지역 변수나 assign()으로 만든 새 프레임에서 계산합니다.
+- 파일은 임시 파일에 쓴 뒤 이름을 바꿔 원자적으로 공개하며, 같은 버전 파일이 이미 있으면 다시 쓰지 않습니다.
+- 오래된 버전 파일은 keep개만 남기고 삭제합니다 (이미 매핑한 프로세스는 삭제 후에도 계속 읽을 수 있음).
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import pandas as pd
+import pyarrow as pa
+
+from config import SNAPSHOT_CONFIG
+from utils.cache import dataset_version, register_dataset_source
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_SUFFIX = '.arrow'
+
+_open_frames: 'OrderedDict[str, pd.DataFrame]' = OrderedDict()
+_open_frames_lock = threading.Lock()
+
+
+def snapshot_path(name: str, version: str, directory: Optional[str] = None) -> str:
+    directory = directory or SNAPSHOT_CONFIG['directory']
+    digest = hashlib.sha256(version.encode()).hexdigest()[:16]
+    return os.path.join(directory, f"{name}-{digest}{SNAPSHOT_SUFFIX}")
+
+
+def _remove_stale(name: str, directory: str, keep: int, current: str):
+    """같은 이름의 오래된 스냅샷 파일을 최근 keep개만 남기고 삭제"""
+    entries = []
+    for entry in os.scandir(directory):
+        if entry.name.startswith(f"{name}-") and entry.name.endswith(SNAPSHOT_SUFFIX) and entry.path != current:
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except FileNotFoundError:
+                continue
+    for _, path in sorted(entries, reverse=True)[max(keep - 1, 0):]:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def publish_frame(df: pd.DataFrame, name: str, directory: Optional[str] = None,
+                  keep: int = SNAPSHOT_CONFIG['keep']) -> str:
+    """프레임을 데이터셋 버전별 Arrow IPC 파일로 공개하고 경로 반환 (이미 있으면 그대로 사용)"""
+    directory = directory or SNAPSHOT_CONFIG['directory']
+    path = snapshot_path(name, dataset_version(df), directory)
+    if os.path.exists(path):
+        return path
+
+    os.makedirs(directory, exist_ok=True)
+    table = pa.Table.from_pandas(df)  # attrs(데이터셋 버전)는 pandas 메타데이터로 함께 저장
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with pa.OSFile(tmp_path, 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, path)  # 다른 프로세스가 쓰다 만 파일을 열지 않도록 원자적 교체
+    _remove_stale(name, directory, keep, path)
+    return path
+
+
+def open_frame(path: str) -> pd.DataFrame:
+    """공개된 스냅샷을 메모리 매핑으로 열기 (프로세스 안에서는 경로별로 같은 프레임 객체 재사용)"""
+    with _open_frames_lock:
+        frame = _open_frames.get(path)
+        if frame is not None:
+            _open_frames.move_to_end(path)
+            return frame
+
+    table = pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+    # split_blocks: 컬럼마다 별도 블록으로 두어 합치면서 복사하지 않도록 함
+    frame = register_dataset_source(table.to_pandas(split_blocks=True))
+
+    with _open_frames_lock:
+        frame = _open_frames.setdefault(path, frame)
+        _open_frames.move_to_end(path)
+        while len(_open_frames) > SNAPSHOT_CONFIG['keep']:
+            _open_frames.popitem(last=False)
+    return frame
+
+
+def share_frame(df: pd.DataFrame, name: str, directory: Optional[str] = None) -> pd.DataFrame:
+    """프레임을 공유 스냅샷으로 공개한 뒤 매핑한 읽기 전용 프레임 반환 (실패하면 원래 프레임 그대로)"""
+    try:
+        return open_frame(publish_frame(df, name, directory))
+    except (OSError, pa.ArrowException) as e:
+        logger.warning("'%s' 스냅샷을 공유 메모리로 공개하지 못해 프로세스 메모리 프레임을 사용합니다: %s", name, e)
+        return df